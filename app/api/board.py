@@ -1,22 +1,28 @@
 from typing import Annotated
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 
+from app.api.dependencies import unit_of_work
+from app.api.routing import ClosingStreamingResponse, FastJSONRoute, ndjson_lines
 from app.containers import Container
 from app.schemas.base import ResponseBase
 from app.schemas.board import (
+    RequestBoardBatchGetDto,
     RequestBoardCreateDto,
     RequestBoardUpdateDto,
     ResponseBoard,
+    ResponseBoardBatchGet,
     ResponseBoardList,
 )
 from app.services.auth import AuthService
 from app.services.board import BoardService
+from app.services.post import PostService
+from app.utils.pagination import PageOrder
 
-router = APIRouter(tags=["board"])
-
-container = Container()
+router = APIRouter(
+    tags=["board"], dependencies=[Depends(unit_of_work)], route_class=FastJSONRoute
+)
 
 CurrentUser = Annotated[tuple[int, str], Depends(AuthService.get_current_user)]
 
@@ -49,6 +55,32 @@ async def create_board(
     )
 
 
+@router.post(
+    "/boards:batchGet",
+    response_model=ResponseBoardBatchGet,
+    responses={
+        200: {"description": "게시판 일괄 조회 결과, 항목별 결과를 확인해야 합니다."},
+        422: {"description": "Validation Error"},
+    },
+    status_code=status.HTTP_200_OK,
+    description="게시판 일괄 조회 API, 요청한 ID 순서대로 응답합니다.",
+    summary="Batch Get Boards",
+)
+@inject
+async def batch_get_boards(
+    request: RequestBoardBatchGetDto,
+    current_user: CurrentUser,
+    auth_service: AuthService = Depends(Provide[Container.auth_service]),
+    board_service: BoardService = Depends(Provide[Container.board_service]),
+) -> ResponseBoardBatchGet:
+    user_id, token = current_user
+    await auth_service.check_blacklist(token)
+    data = await board_service.get_boards(request.ids, user_id)
+    return ResponseBoardBatchGet(
+        code=status.HTTP_200_OK, message="게시판 일괄 조회 결과", data=data
+    )
+
+
 @router.get(
     "/board/{id}",
     response_model=ResponseBoard,
@@ -89,17 +121,24 @@ async def get_board(
 )
 @inject
 async def list_boards(
-    cursor_id: int,
     limit: int,
     current_user: CurrentUser,
+    cursor_id: int = Query(default=0, deprecated=True),
+    cursor: str | None = None,
+    order: PageOrder = PageOrder.ID,
     auth_service: AuthService = Depends(Provide[Container.auth_service]),
     board_service: BoardService = Depends(Provide[Container.board_service]),
 ) -> ResponseBoardList:
     user_id, token = current_user
     await auth_service.check_blacklist(token)
-    data = await board_service.list_boards(user_id, cursor_id, limit)
+    page = await board_service.list_boards(user_id, cursor_id, limit, cursor, order)
     return ResponseBoardList(
-        code=status.HTTP_200_OK, message="게시판 목록 조회 성공.", data=data
+        code=status.HTTP_200_OK,
+        message="게시판 목록 조회 성공.",
+        data=page.items,
+        next_cursor=page.next_cursor,
+        prev_cursor=page.prev_cursor,
+        has_more=page.has_more,
     )
 
 
@@ -154,3 +193,35 @@ async def delete_board(
     await auth_service.check_blacklist(token)
     await board_service.delete_board(board_id=id, user_id=user_id)
     return ResponseBase(code=status.HTTP_200_OK, message="게시판 삭제 성공.")
+
+
+@router.get(
+    "/board/{id}/export",
+    response_class=ClosingStreamingResponse,
+    responses={
+        200: {
+            "description": "게시판의 게시글을 한 줄에 하나씩 JSON으로 내보냅니다.",
+            "content": {"application/x-ndjson": {}},
+        },
+        403: {"description": "게시판을 찾을 수 없습니다."},
+        422: {"description": "Validation Error"},
+    },
+    status_code=status.HTTP_200_OK,
+    description="게시판 게시글 내보내기 API",
+    summary="Export Board Posts",
+)
+@inject
+async def export_board_posts(
+    id: int,
+    current_user: CurrentUser,
+    auth_service: AuthService = Depends(Provide[Container.auth_service]),
+    post_service: PostService = Depends(Provide[Container.post_service]),
+) -> ClosingStreamingResponse:
+    user_id, token = current_user
+    await auth_service.check_blacklist(token)
+    posts = await post_service.export_posts(id, user_id)
+    # the unit of work ends before the body is sent, the stream reads the posts
+    # on a session of its own, from the database the unit of work read from
+    return ClosingStreamingResponse(
+        ndjson_lines(posts), media_type="application/x-ndjson"
+    )
@@ -0,0 +1,44 @@
+from typing import AsyncGenerator
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import Depends, Request
+
+from app.containers import Container
+from app.databases.rdb import RDBDatabase, has_written
+from app.databases.replica import RecentWriters
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+@inject
+async def get_rdb(
+    db: RDBDatabase = Depends(Provide[Container.db]),
+) -> RDBDatabase:
+    return db
+
+
+@inject
+async def get_recent_writers(
+    recent_writers: RecentWriters = Depends(Provide[Container.recent_writers]),
+) -> RecentWriters:
+    return recent_writers
+
+
+async def unit_of_work(
+    request: Request,
+    db: RDBDatabase = Depends(get_rdb),
+    recent_writers: RecentWriters = Depends(get_recent_writers),
+) -> AsyncGenerator[None, None]:
+    # the same token reads its own writes in the requests that follow, on any worker
+    token = request.headers.get("Authorization") if db.has_replicas else None
+    if token is None:
+        use_primary = False
+    elif request.method not in SAFE_METHODS:
+        # goes to the primary to write anyway, its reads must see the latest rows
+        use_primary = True
+    else:
+        use_primary = await recent_writers.wrote_recently(token)
+    async with db.unit_of_work(use_primary) as session:
+        yield
+    if token is not None and has_written(session):
+        await recent_writers.remember(token)
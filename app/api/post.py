@@ -1,22 +1,30 @@
 from typing import Annotated
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 
+from app.api.dependencies import unit_of_work
+from app.api.routing import FastJSONRoute
 from app.containers import Container
 from app.schemas.base import ResponseBase
 from app.schemas.post import (
+    RequestPostBatchCreateDto,
+    RequestPostBatchGetDto,
     RequestPostCreateDto,
     RequestPostUpdateDto,
     ResponsePost,
+    ResponsePostBatch,
+    ResponsePostBatchGet,
     ResponsePostList,
+    ResponsePostSearchList,
 )
 from app.services.auth import AuthService
 from app.services.post import PostService
+from app.utils.pagination import PageOrder
 
-router = APIRouter(tags=["post"])
-
-container = Container()
+router = APIRouter(
+    tags=["post"], dependencies=[Depends(unit_of_work)], route_class=FastJSONRoute
+)
 
 CurrentUser = Annotated[tuple[int, str], Depends(AuthService.get_current_user)]
 
@@ -48,6 +56,60 @@ async def create_post(
     )
 
 
+@router.post(
+    "/posts:batch",
+    response_model=ResponsePostBatch,
+    responses={
+        200: {"description": "게시글 일괄 생성 결과, 항목별 결과를 확인해야 합니다."},
+        422: {"description": "Validation Error"},
+    },
+    status_code=status.HTTP_200_OK,
+    description="게시글 일괄 생성 API",
+    summary="Create Posts",
+)
+@inject
+async def create_posts(
+    request: RequestPostBatchCreateDto,
+    current_user: CurrentUser,
+    auth_service: AuthService = Depends(Provide[Container.auth_service]),
+    post_service: PostService = Depends(Provide[Container.post_service]),
+) -> ResponsePostBatch:
+    user_id, token = current_user
+    await auth_service.check_blacklist(token)
+
+    data = await post_service.create_posts(user_id, request.posts)
+    return ResponsePostBatch(
+        code=status.HTTP_200_OK, message="게시글 일괄 생성 결과", data=data
+    )
+
+
+@router.post(
+    "/posts:batchGet",
+    response_model=ResponsePostBatchGet,
+    responses={
+        200: {"description": "게시글 일괄 조회 결과, 항목별 결과를 확인해야 합니다."},
+        422: {"description": "Validation Error"},
+    },
+    status_code=status.HTTP_200_OK,
+    description="게시글 일괄 조회 API, 요청한 ID 순서대로 응답합니다.",
+    summary="Batch Get Posts",
+)
+@inject
+async def batch_get_posts(
+    request: RequestPostBatchGetDto,
+    current_user: CurrentUser,
+    auth_service: AuthService = Depends(Provide[Container.auth_service]),
+    post_service: PostService = Depends(Provide[Container.post_service]),
+) -> ResponsePostBatchGet:
+    user_id, token = current_user
+    await auth_service.check_blacklist(token)
+
+    data = await post_service.get_posts(request.ids, user_id)
+    return ResponsePostBatchGet(
+        code=status.HTTP_200_OK, message="게시글 일괄 조회 결과", data=data
+    )
+
+
 @router.get(
     "/post/{id}",
     response_model=ResponsePost,
@@ -129,9 +191,43 @@ async def delete_post(
     return ResponseBase(code=status.HTTP_200_OK, message="게시글 삭제 성공.")
 
 
+@router.get(
+    "/posts/search",
+    response_model=ResponsePostSearchList,
+    responses={
+        200: {"description": "게시글 검색 성공"},
+        422: {"description": "Validation Error"},
+    },
+    status_code=status.HTTP_200_OK,
+    description="게시글 검색 API, 검색 점수가 높은 순서로 조회합니다.",
+    summary="Search Posts",
+)
+@inject
+async def search_posts(
+    current_user: CurrentUser,
+    q: str = Query(min_length=1, max_length=256),
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = None,
+    auth_service: AuthService = Depends(Provide[Container.auth_service]),
+    post_service: PostService = Depends(Provide[Container.post_service]),
+) -> ResponsePostSearchList:
+    user_id, token = current_user
+    await auth_service.check_blacklist(token)
+
+    page = await post_service.search_posts(user_id, q, limit, cursor)
+    return ResponsePostSearchList(
+        code=status.HTTP_200_OK,
+        message="게시글 검색 성공",
+        data=page.items,
+        next_cursor=page.next_cursor,
+        has_more=page.has_more,
+    )
+
+
 @router.get(
     "/posts/{board_id}",
     response_model=ResponsePostList,
+    response_model_exclude_unset=True,
     responses={
         200: {"description": "게시글 목록 조회 성공."},
         422: {"description": "Validation Error"},
@@ -143,16 +239,32 @@ async def delete_post(
 @inject
 async def list_posts(
     board_id: int,
-    cursor_id: int,
     limit: int,
     current_user: CurrentUser,
+    cursor_id: int = Query(default=0, deprecated=True),
+    cursor: str | None = None,
+    order: PageOrder = PageOrder.ID,
+    fields: str | None = Query(
+        default=None,
+        description="쉼표로 구분한 조회 필드(예: id,title,created_dt), id는 항상 포함됩니다.",
+    ),
+    excerpt: int | None = Query(
+        default=None, ge=1, description="content를 앞에서부터 N자만 조회합니다."
+    ),
     auth_service: AuthService = Depends(Provide[Container.auth_service]),
     post_service: PostService = Depends(Provide[Container.post_service]),
 ) -> ResponsePostList:
     user_id, token = current_user
     await auth_service.check_blacklist(token)
 
-    data = await post_service.list_posts(board_id, user_id, cursor_id, limit)
+    page = await post_service.list_posts(
+        board_id, user_id, cursor_id, limit, cursor, order, fields, excerpt
+    )
     return ResponsePostList(
-        code=status.HTTP_200_OK, message="게시글 목록 조회 성공", data=data
+        code=status.HTTP_200_OK,
+        message="게시글 목록 조회 성공",
+        data=page.items,
+        next_cursor=page.next_cursor,
+        prev_cursor=page.prev_cursor,
+        has_more=page.has_more,
     )
@@ -0,0 +1,138 @@
+import asyncio
+import functools
+from contextlib import aclosing
+from typing import Any, AsyncGenerator, Callable, Coroutine, Sequence
+
+import anyio
+import orjson
+from fastapi import Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+from starlette.types import Send
+
+from app.config import settings
+
+
+def _model_fields(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.__dict__
+    raise TypeError
+
+
+def _is_plain_model(model: type[BaseModel], seen: set[type[BaseModel]]) -> bool:
+    # __dict__ is only equal to .dict() without aliases and private attributes
+    if model in seen:
+        return True
+    seen.add(model)
+    if model.__private_attributes__:
+        return False
+    for field in model.__fields__.values():
+        if field.alias != field.name:
+            return False
+        if isinstance(field.type_, type) and issubclass(field.type_, BaseModel):
+            if not _is_plain_model(field.type_, seen):
+                return False
+    return True
+
+
+def _set_model_fields(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        fields_set = obj.__fields_set__
+        return {
+            name: value for name, value in obj.__dict__.items() if name in fields_set
+        }
+    raise TypeError
+
+
+class ModelORJSONResponse(ORJSONResponse):
+    default = staticmethod(_model_fields)
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=self.default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+
+
+class SetModelORJSONResponse(ModelORJSONResponse):
+    # the equivalent of .dict(exclude_unset=True)
+    default = staticmethod(_set_model_fields)
+
+
+class ClosingStreamingResponse(StreamingResponse):
+    async def stream_response(self, send: Send) -> None:
+        try:
+            await super().stream_response(send)
+        finally:
+            # a client disconnect leaves the body iterator suspended, close it so
+            # it releases what it holds, e.g. a database cursor
+            if isinstance(self.body_iterator, AsyncGenerator):
+                with anyio.CancelScope(shield=True):
+                    await self.body_iterator.aclose()
+
+
+async def ndjson_lines(
+    batches: AsyncGenerator[Sequence[BaseModel], None],
+) -> AsyncGenerator[bytes, None]:
+    # one chunk per batch, each model on its own line
+    async with aclosing(batches):
+        async for models in batches:
+            yield b"".join(
+                orjson.dumps(model, default=_model_fields) + b"\n" for model in models
+            )
+
+
+class FastJSONRoute(APIRoute):
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        if (
+            settings.FAST_JSON_RESPONSE
+            and self.response_model is not None
+            and asyncio.iscoroutinefunction(self.dependant.call)
+        ):
+            self.dependant.call = self._render_response_model(self.dependant.call)
+        return super().get_route_handler()
+
+    def _render_response_model(
+        self, call: Callable[..., Coroutine[Any, Any, Any]]
+    ) -> Callable[..., Coroutine[Any, Any, Any]]:
+        @functools.wraps(call)
+        async def endpoint(*args: Any, **kwargs: Any) -> Any:
+            content = await call(*args, **kwargs)
+            # only the exact response model is trusted, a subclass may carry
+            # fields the response model is meant to filter out
+            if type(content) is self.response_model:
+                return self.render(content)
+            return content
+
+        return endpoint
+
+    @functools.cached_property
+    def _dump_model(self) -> bool:
+        return (
+            self.response_model_include is None
+            and self.response_model_exclude is None
+            and not self.response_model_exclude_defaults
+            and not self.response_model_exclude_none
+            and _is_plain_model(self.response_model, set())
+        )
+
+    def render(self, content: BaseModel) -> Response:
+        # returning a Response skips FastAPI's second validation and jsonable_encoder
+        status_code = self.status_code or 200
+        if self._dump_model:
+            if self.response_model_exclude_unset:
+                return SetModelORJSONResponse(content, status_code=status_code)
+            return ModelORJSONResponse(content, status_code=status_code)
+        return ORJSONResponse(
+            content.dict(
+                include=self.response_model_include,  # type: ignore[arg-type]
+                exclude=self.response_model_exclude,  # type: ignore[arg-type]
+                by_alias=self.response_model_by_alias,
+                exclude_unset=self.response_model_exclude_unset,
+                exclude_defaults=self.response_model_exclude_defaults,
+                exclude_none=self.response_model_exclude_none,
+            ),
+            status_code=status_code,
+        )
@@ -3,6 +3,7 @@ from typing import Annotated
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Body, Depends, status
 
+from app.api.routing import FastJSONRoute
 from app.containers import Container
 from app.schemas.base import ResponseBase
 from app.schemas.user import (
@@ -12,7 +13,7 @@ from app.schemas.user import (
 )
 from app.services.user import UserService
 
-router = APIRouter(tags=["user"])
+router = APIRouter(tags=["user"], route_class=FastJSONRoute)
 
 
 @router.post(
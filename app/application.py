@@ -1,19 +1,39 @@
-from fastapi import FastAPI, status
+import logging
+
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, PlainTextResponse
 
+import app.errors.exceptions as ex
 from app.api import board, post, user
 from app.config import settings
 from app.containers import Container
-from app.middlewares.request import base_http_middleware
+from app.middlewares.metrics import MetricsMiddleware
+from app.middlewares.profiler import QueryProfilerMiddleware
+from app.middlewares.request import APIExceptionMiddleware
 from app.schemas.base import ResponseBase
+from app.utils import metrics
+from app.warmup import warm_up
+
+logger = logging.getLogger(__name__)
 
 container = Container()
 
+worker_snapshots = (
+    metrics.WorkerSnapshots(
+        metrics.registry, settings.METRICS_DIR, settings.METRICS_WRITE_INTERVAL
+    )
+    if settings.METRICS_DIR
+    else None
+)
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.PROJECT_VERSION,
     description=settings.PROJECT_DESCRIPTION,
+    default_response_class=(
+        ORJSONResponse if settings.FAST_JSON_RESPONSE else JSONResponse
+    ),
 )
 
 app.add_middleware(
@@ -24,9 +44,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-app.add_middleware(middleware_class=BaseHTTPMiddleware, dispatch=base_http_middleware)
+app.add_middleware(APIExceptionMiddleware)
+
+app.add_middleware(QueryProfilerMiddleware, server_timing=settings.DEBUG)
+
+# outermost, so error responses are counted with their final status
+app.add_middleware(MetricsMiddleware)
 
 app.container = container  # type: ignore
+app.state.ready = False
 
 app.include_router(user.router, prefix="/api/v1")
 app.include_router(board.router, prefix="/api/v1")
@@ -35,11 +61,37 @@ app.include_router(post.router, prefix="/api/v1")
 
 @app.on_event("startup")
 async def startup() -> None:
-    pass
+    token_blacklist = await container.token_blacklist.async_()
+    await token_blacklist.start()
+    board_cache = await container.board_cache.async_()
+    await board_cache.start()
+    post_cache = await container.post_cache.async_()
+    await post_cache.start()
+    await container.db().start()
+    if worker_snapshots is not None:
+        await worker_snapshots.start()
+    if settings.WARMUP:
+        try:
+            await warm_up(container, settings.WARMUP_CONNECTIONS)
+        except Exception:
+            # a cold worker is slower, not broken
+            logger.exception("Warm-up failed")
+    app.state.ready = True
 
 
 @app.on_event("shutdown")
 async def shutdown() -> None:
+    app.state.ready = False
+    if worker_snapshots is not None:
+        await worker_snapshots.stop()
+    token_blacklist = await container.token_blacklist.async_()
+    await token_blacklist.stop()
+    board_cache = await container.board_cache.async_()
+    await board_cache.stop()
+    post_cache = await container.post_cache.async_()
+    await post_cache.stop()
+    await container.post_write_coalescer().close()
+    container.password_executor().shutdown()
     db = container.db()
     await db.disconnect()
 
@@ -60,3 +112,38 @@ async def health_check() -> ResponseBase:
         message="Server Alive",
         data={"status": "alive"},
     )
+
+
+@app.get(
+    "/ready",
+    response_model=ResponseBase,
+    responses={
+        200: {"description": "Server Ready"},
+        503: {"description": "서버가 아직 준비되지 않았습니다."},
+    },
+    status_code=status.HTTP_200_OK,
+    description="Readiness Check API",
+    summary="Readiness Check",
+)
+async def readiness_check(request: Request) -> ResponseBase:
+    if not request.app.state.ready:
+        raise ex.NotReadyError()
+    return ResponseBase(
+        code=status.HTTP_200_OK,
+        message="Server Ready",
+        data={"status": "ready"},
+    )
+
+
+@app.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    description="Prometheus Metrics API",
+    summary="Metrics",
+)
+async def metrics_endpoint() -> PlainTextResponse:
+    if worker_snapshots is not None:
+        content = metrics.render(await worker_snapshots.collect())
+    else:
+        content = metrics.registry.render()
+    return PlainTextResponse(content, media_type=metrics.CONTENT_TYPE)
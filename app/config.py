@@ -13,6 +13,11 @@ class DatabaseSettings(BaseSettings):
         f"postgresql+asyncpg://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
     )
 
+    # comma separated, reads are spread over them
+    db_replica_urls: list[str] = [
+        url for url in os.environ.get("POSTGRES_REPLICA_URLS", "").split(",") if url
+    ]
+
     redis_host: str = os.environ.get("REDIS_HOST", "127.0.0.1")
     redis_port: str = os.environ.get("REDIS_PORT", "6379")
     redis_url: str = f"redis://{redis_host}:{redis_port}"
@@ -23,9 +28,24 @@ class ApplicationSettings(BaseSettings):
 
     PROJECT_NAME: str = "FastAPI Project"
     PROJECT_VERSION: str = "1.0.0"
-    PROJECT_DESCRIPTION: str = "현제 FastAPI를 이용한 프로젝트의 코딩 스타일을 확인할 수 있습니다."
+    PROJECT_DESCRIPTION: str = (
+        "현제 FastAPI를 이용한 프로젝트의 코딩 스타일을 확인할 수 있습니다."
+    )
+
+    EXCEPT_PATH_LIST: list[str] = ["/health", "/metrics", "/openapi.json"]
+
+    # shared by the workers of one server so /metrics covers all of them, set by
+    # cli.serve. samples of the other workers are up to the interval old
+    METRICS_DIR: str = os.environ.get("METRICS_DIR", "")
+    METRICS_WRITE_INTERVAL: float = float(os.environ.get("METRICS_WRITE_INTERVAL", "5"))
 
-    EXCEPT_PATH_LIST: list[str] = ["/health", "/openapi.json"]
+    # adds a Server-Timing header with the query count and time of each request
+    DEBUG: bool = os.environ.get("DEBUG", "false") == "true"
+    # statements slower than this many seconds are logged with their route
+    SLOW_QUERY_THRESHOLD: float = float(os.environ.get("SLOW_QUERY_THRESHOLD", "0.2"))
+
+    # serialize response models straight to orjson without revalidating them
+    FAST_JSON_RESPONSE: bool = os.environ.get("FAST_JSON_RESPONSE", "false") == "true"
 
     # JWT
     SECRET_KEY: str = os.environ.get("SECRET_KEY", "secret key")
@@ -33,6 +53,44 @@ class ApplicationSettings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: str = os.environ.get(
         "ACCESS_TOKEN_EXPIRE_MINUTES", "30"
     )
+    TOKEN_CACHE_MAX_SIZE: int = int(os.environ.get("TOKEN_CACHE_MAX_SIZE", "10000"))
+
+    # bcrypt
+    PASSWORD_HASH_WORKERS: int = int(os.environ.get("PASSWORD_HASH_WORKERS", "4"))
+    PASSWORD_HASH_QUEUE_SIZE: int = int(
+        os.environ.get("PASSWORD_HASH_QUEUE_SIZE", "64")
+    )
+
+    # rows fetched per round trip while streaming a board export
+    EXPORT_FETCH_SIZE: int = int(os.environ.get("EXPORT_FETCH_SIZE", "500"))
+
+    BATCH_GET_MAX_SIZE: int = int(os.environ.get("BATCH_GET_MAX_SIZE", "500"))
+    POST_BATCH_MAX_SIZE: int = int(os.environ.get("POST_BATCH_MAX_SIZE", "1000"))
+
+    # group concurrent post inserts into one multi-row insert and commit
+    POST_WRITE_COALESCING: bool = (
+        os.environ.get("POST_WRITE_COALESCING", "false") == "true"
+    )
+    POST_WRITE_MAX_BATCH_SIZE: int = int(
+        os.environ.get("POST_WRITE_MAX_BATCH_SIZE", "100")
+    )
+    POST_WRITE_MAX_DELAY: float = float(os.environ.get("POST_WRITE_MAX_DELAY", "0.002"))
+
+    # seconds a client that wrote keeps reading from the primary, and between
+    # replica health checks
+    READ_YOUR_WRITES_WINDOW: float = float(
+        os.environ.get("READ_YOUR_WRITES_WINDOW", "5")
+    )
+    REPLICA_CHECK_INTERVAL: float = float(os.environ.get("REPLICA_CHECK_INTERVAL", "5"))
+
+    # open pool connections, ping Redis and run the hot statements before ready
+    WARMUP: bool = os.environ.get("WARMUP", "true") == "true"
+    WARMUP_CONNECTIONS: int = int(os.environ.get("WARMUP_CONNECTIONS", "5"))
+
+    # board and post cache
+    ENTITY_CACHE_MAX_SIZE: int = int(os.environ.get("ENTITY_CACHE_MAX_SIZE", "10000"))
+    ENTITY_CACHE_TTL: float = float(os.environ.get("ENTITY_CACHE_TTL", "30"))
+    ENTITY_CACHE_REDIS_TTL: int = int(os.environ.get("ENTITY_CACHE_REDIS_TTL", "300"))
 
 
 settings = ApplicationSettings()
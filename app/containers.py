@@ -1,20 +1,28 @@
 from dependency_injector import containers, providers
 
-from app.config import ApplicationSettings
+from app.config import settings
+from app.databases.blacklist import TokenBlacklist
+from app.databases.cache import ReadThroughCache
+from app.databases.coalescer import WriteCoalescer
 from app.databases.rdb import RDBDatabase
 from app.databases.redis import get_redis
+from app.databases.replica import RecentWriters
 from app.repositories.board import BoardRepository
 from app.repositories.post import PostRepository
 from app.repositories.user import UserRepository
+from app.schemas.board import ResponseBoardDto
+from app.schemas.post import ResponsePostDto
 from app.services.auth import AuthService
 from app.services.board import BoardService
 from app.services.post import PostService
 from app.services.user import UserService
+from app.utils.executor import BoundedExecutor
 
 
 class Container(containers.DeclarativeContainer):
     wiring_config = containers.WiringConfiguration(
         modules=[
+            "app.api.dependencies",
             "app.api.user",
             "app.api.board",
             "app.api.post",
@@ -22,12 +30,15 @@ class Container(containers.DeclarativeContainer):
     )
 
     config = providers.Configuration()
-    config.from_pydantic(ApplicationSettings())
+    config.from_pydantic(settings)
 
     db = providers.Singleton(
         RDBDatabase,
         db_url=config.db.db_url,
         echo=False,
+        slow_query_threshold=config.SLOW_QUERY_THRESHOLD,
+        replica_urls=config.db.db_replica_urls,
+        replica_check_interval=config.REPLICA_CHECK_INTERVAL,
     )
 
     redis = providers.Resource(
@@ -35,43 +46,103 @@ class Container(containers.DeclarativeContainer):
         redis_url=config.db.redis_url,
     )
 
-    auth_service = providers.Factory(
+    recent_writers = providers.Singleton(
+        RecentWriters,
+        redis=redis,
+        window=config.READ_YOUR_WRITES_WINDOW,
+    )
+
+    token_blacklist = providers.Singleton(
+        TokenBlacklist,
+        redis=redis,
+    )
+
+    board_cache = providers.Singleton(
+        ReadThroughCache,
+        redis=redis,
+        namespace="board",
+        model=ResponseBoardDto,
+        max_size=config.ENTITY_CACHE_MAX_SIZE,
+        ttl=config.ENTITY_CACHE_TTL,
+        redis_ttl=config.ENTITY_CACHE_REDIS_TTL,
+    )
+
+    post_cache = providers.Singleton(
+        ReadThroughCache,
+        redis=redis,
+        namespace="post",
+        model=ResponsePostDto,
+        max_size=config.ENTITY_CACHE_MAX_SIZE,
+        ttl=config.ENTITY_CACHE_TTL,
+        redis_ttl=config.ENTITY_CACHE_REDIS_TTL,
+    )
+
+    password_executor = providers.Singleton(
+        BoundedExecutor,
+        max_workers=config.PASSWORD_HASH_WORKERS,
+        max_queue_size=config.PASSWORD_HASH_QUEUE_SIZE,
+        thread_name_prefix="password-hash",
+    )
+
+    # services and repositories keep no per request state, the session comes from
+    # the unit of work context and the user is passed to every call
+    auth_service = providers.Singleton(
         AuthService,
         secret_key=config.SECRET_KEY,
         algorithms=config.ALGORITHM,
         access_token_expire_minutes=config.ACCESS_TOKEN_EXPIRE_MINUTES,
         redis=redis,
+        token_blacklist=token_blacklist,
+        password_executor=password_executor,
     )
 
-    user_repository = providers.Factory(
+    user_repository = providers.Singleton(
         UserRepository,
         session_factory=db.provided.session,
         redis=redis,
+        token_blacklist=token_blacklist,
     )
 
-    user_service = providers.Factory(
+    user_service = providers.Singleton(
         UserService,
         auth_service=auth_service,
         user_repository=user_repository,
     )
 
-    board_repository = providers.Factory(
+    board_repository = providers.Singleton(
         BoardRepository,
         session_factory=db.provided.session,
+        cache=board_cache,
     )
 
-    board_service = providers.Factory(
+    board_service = providers.Singleton(
         BoardService,
         board_repository=board_repository,
     )
 
-    post_repository = providers.Factory(
+    post_writer = providers.Singleton(
+        PostRepository,
+        session_factory=db.provided.session,
+    )
+
+    post_write_coalescer = providers.Singleton(
+        WriteCoalescer,
+        flush=post_writer.provided.add_all,
+        enabled=config.POST_WRITE_COALESCING,
+        max_batch_size=config.POST_WRITE_MAX_BATCH_SIZE,
+        max_delay=config.POST_WRITE_MAX_DELAY,
+    )
+
+    post_repository = providers.Singleton(
         PostRepository,
         session_factory=db.provided.session,
+        cache=post_cache,
+        coalescer=post_write_coalescer,
     )
 
-    post_service = providers.Factory(
+    post_service = providers.Singleton(
         PostService,
         post_repository=post_repository,
         board_service=board_service,
+        export_fetch_size=config.EXPORT_FETCH_SIZE,
     )
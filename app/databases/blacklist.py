@@ -0,0 +1,118 @@
+import asyncio
+import logging
+import time
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.utils.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+# sorted set of blacklisted tokens scored by their expire timestamp
+BLACKLIST_KEY = "token-blacklist"
+BLACKLIST_CHANNEL = "token-blacklist"
+
+REDIS_COMMAND_DURATION = registry.histogram(
+    "redis_command_duration_seconds",
+    "Redis round trip latency by operation",
+    ("operation",),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+)
+
+
+# In-process mirror of the Redis token blacklist. Kept up to date through pub/sub
+# and reloaded from the sorted set whenever the subscription (re)connects.
+# Callers must fall back to Redis while the mirror is not synced.
+class TokenBlacklist:
+    def __init__(
+        self,
+        redis: aioredis.Redis,
+        reconnect_interval: float = 1.0,
+        prune_interval: float = 60.0,
+    ) -> None:
+        self.redis = redis
+        self.reconnect_interval = reconnect_interval
+        self.prune_interval = prune_interval
+        self._tokens: dict[str, float] = {}
+        self._next_prune = 0.0
+        self._synced = False
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def synced(self) -> bool:
+        return self._synced
+
+    def contains(self, token: str) -> bool:
+        expires_at = self._tokens.get(token)
+        if expires_at is None:
+            return False
+        if expires_at <= time.time():
+            self._tokens.pop(token, None)
+            return False
+        return True
+
+    def add(self, token: str, expires_at: float) -> None:
+        self._tokens[token] = expires_at
+        # expired tokens are dropped now and then rather than on every revocation
+        now = time.time()
+        if now >= self._next_prune:
+            self._prune(now)
+
+    def _prune(self, now: float) -> None:
+        self._tokens = {
+            key: value for key, value in self._tokens.items() if value > now
+        }
+        self._next_prune = now + self.prune_interval
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _resync(self) -> None:
+        now = time.time()
+        await self.redis.zremrangebyscore(BLACKLIST_KEY, "-inf", now)
+        tokens = await self.redis.zrangebyscore(
+            BLACKLIST_KEY, now, "+inf", withscores=True
+        )
+        self._tokens = {token: expires_at for token, expires_at in tokens}
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                # subscribe before loading the snapshot so no revocation is missed
+                await pubsub.subscribe(BLACKLIST_CHANNEL)
+                await self._resync()
+                self._synced = True
+
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    try:
+                        expires_at, token = message["data"].split(" ", 1)
+                        self.add(token, float(expires_at))
+                    except (AttributeError, TypeError, ValueError):
+                        # one bad message must not stop the mirror
+                        logger.warning(
+                            "Ignoring malformed token blacklist message %r",
+                            message["data"],
+                        )
+            except RedisError:
+                logger.warning(
+                    "Token blacklist subscription lost, falling back to Redis"
+                )
+            finally:
+                self._synced = False
+                await pubsub.aclose()  # type: ignore
+
+            await asyncio.sleep(self.reconnect_interval)
@@ -0,0 +1,190 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Generic, TypeVar
+
+from pydantic import BaseModel
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError, WatchError
+
+from app.databases.rdb import detached_context, has_pending_commit
+from app.utils.cache import TTLCache
+from app.utils.metrics import register_cache
+
+logger = logging.getLogger(__name__)
+
+CACHE_INVALIDATION_CHANNEL = "cache-invalidation"
+
+M = TypeVar("M", bound=BaseModel)
+
+
+# Read-through cache with an in-process LRU in front of Redis. Every process drops
+# its local copy through pub/sub when a key is invalidated, and the local tier is
+# skipped while that subscription is down. Concurrent misses for a key share one load.
+# Invalidations bump a version key, and a load only writes Redis when the version
+# is still the one it saw before reading the database, so a load racing a write
+# never puts the old row back for every process.
+class ReadThroughCache(Generic[M]):
+    def __init__(
+        self,
+        redis: aioredis.Redis,
+        namespace: str,
+        model: type[M],
+        max_size: int,
+        ttl: float,
+        redis_ttl: int,
+        reconnect_interval: float = 1.0,
+    ) -> None:
+        self.redis = redis
+        self.namespace = namespace
+        self.model = model
+        self.redis_ttl = redis_ttl
+        self.reconnect_interval = reconnect_interval
+        self._local: TTLCache[int, M] = TTLCache(max_size, ttl)
+        register_cache(namespace, self._local)
+        self._inflight: dict[int, asyncio.Task[M | None]] = {}
+        self._generation = 0
+        self._synced = False
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def synced(self) -> bool:
+        return self._synced
+
+    def redis_key(self, key: int) -> str:
+        return f"cache:{self.namespace}:{key}"
+
+    def version_key(self, key: int) -> str:
+        return f"cache:{self.namespace}:{key}:version"
+
+    async def get(self, key: int, load: Callable[[], Awaitable[M | None]]) -> M | None:
+        if has_pending_commit():
+            # read our own uncommitted writes straight from the database
+            return await load()
+
+        if self._synced:
+            value = self._local.get(key)
+            if value is not None:
+                return value
+
+        task = self._inflight.get(key)
+        if task is None:
+            # shared by every waiting request, so it stays out of the caller's unit
+            # of work and survives the caller being cancelled. That costs a second
+            # pooled connection for the miss, its queries count for the caller.
+            task = asyncio.get_running_loop().create_task(
+                self._load(key, load), context=detached_context()
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._forget(key, task))
+        return await asyncio.shield(task)
+
+    async def invalidate(self, key: int) -> None:
+        self._drop(key)
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.incr(self.version_key(key))
+                # outlives any load that saw the previous version
+                pipe.expire(self.version_key(key), self.redis_ttl)
+                pipe.delete(self.redis_key(key))
+                pipe.publish(CACHE_INVALIDATION_CHANNEL, self.redis_key(key))
+                await pipe.execute()
+        except RedisError:
+            logger.warning("Cache invalidation of %s failed", self.redis_key(key))
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _forget(self, key: int, task: "asyncio.Task[M | None]") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    def _drop(self, key: int) -> None:
+        self._generation += 1
+        self._local.delete(key)
+        # later readers must not join a load that may have read the old row
+        self._inflight.pop(key, None)
+
+    async def _load(
+        self, key: int, load: Callable[[], Awaitable[M | None]]
+    ) -> M | None:
+        generation = self._generation
+        value, version = await self._get_remote(key)
+        if value is None:
+            value = await load()
+            # an invalidation during the load may have come after the row was read
+            if value is not None and generation == self._generation:
+                await self._set_remote(key, value, version)
+
+        if value is not None and self._synced and generation == self._generation:
+            self._local.set(key, value)
+        return value
+
+    async def _get_remote(self, key: int) -> tuple[M | None, str | None]:
+        try:
+            raw, version = await self.redis.mget(
+                self.redis_key(key), self.version_key(key)
+            )
+        except RedisError:
+            logger.warning("Cache read of %s failed", self.redis_key(key))
+            return None, None
+        return self.model.parse_raw(raw) if raw is not None else None, version
+
+    async def _set_remote(self, key: int, value: M, version: str | None) -> None:
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                await pipe.watch(self.version_key(key))
+                if await pipe.get(self.version_key(key)) != version:
+                    return
+                pipe.multi()  # type: ignore[no-untyped-call]
+                pipe.set(self.redis_key(key), value.json(), ex=self.redis_ttl)
+                await pipe.execute()
+        except WatchError:
+            # invalidated between the version check and the write
+            pass
+        except RedisError:
+            logger.warning("Cache write of %s failed", self.redis_key(key))
+
+    async def _listen(self) -> None:
+        prefix = f"cache:{self.namespace}:"
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.subscribe(CACHE_INVALIDATION_CHANNEL)
+                # invalidations may have been missed while unsubscribed
+                self._generation += 1
+                self._local.clear()
+                self._synced = True
+
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    if not message["data"].startswith(prefix):
+                        continue
+                    try:
+                        key = int(message["data"][len(prefix) :])
+                    except ValueError:
+                        # one bad message must not stop the invalidations
+                        logger.warning(
+                            "Ignoring malformed cache invalidation %r", message["data"]
+                        )
+                        continue
+                    self._drop(key)
+            except RedisError:
+                logger.warning(
+                    "Cache invalidation subscription lost, skipping local cache"
+                )
+            finally:
+                self._synced = False
+                await pubsub.aclose()  # type: ignore
+
+            await asyncio.sleep(self.reconnect_interval)
@@ -0,0 +1,82 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Generic, TypeVar
+
+from app.databases.rdb import detached_context
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+# Group commit for concurrent writes. Items submitted within max_delay seconds of
+# each other, up to max_batch_size, are written by one flush call in one
+# transaction and every caller gets its own result back. When a batch fails the
+# items are retried one by one, so a bad item only fails its own caller.
+class WriteCoalescer(Generic[T, R]):
+    def __init__(
+        self,
+        flush: Callable[[list[T]], Awaitable[list[R]]],
+        enabled: bool,
+        max_batch_size: int,
+        max_delay: float,
+    ) -> None:
+        self.flush = flush
+        self.enabled = enabled
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._batch: list[tuple[T, asyncio.Future[R]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(self, item: T) -> R:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[R] = loop.create_future()
+        self._batch.append((item, future))
+        if len(self._batch) >= self.max_batch_size:
+            self._flush_batch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._flush_batch)
+        return await future
+
+    async def close(self) -> None:
+        self._flush_batch()
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    def _flush_batch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._batch:
+            return
+
+        batch, self._batch = self._batch, []
+        # the batch is written and committed on its own session, outside the
+        # submitters' unit of work. Its queries count for the submitter that started
+        # the batch.
+        task = asyncio.get_running_loop().create_task(
+            self._write(batch), context=detached_context()
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _write(self, batch: list[tuple[T, "asyncio.Future[R]"]]) -> None:
+        try:
+            results = await self.flush([item for item, _ in batch])
+        except Exception as e:
+            if len(batch) > 1:
+                logger.warning("Batch write of %d items failed, retrying", len(batch))
+                for entry in batch:
+                    await self._write([entry])
+                return
+            _, future = batch[0]
+            if not future.done():
+                future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            # a cancelled caller's row is still written
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,85 @@
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+QUERY_START = "query_start"
+
+
+class QueryStats:
+    def __init__(
+        self,
+        label: Callable[[], str] | None = None,
+        parent: "QueryStats | None" = None,
+    ) -> None:
+        self.label = label
+        self.parent = parent
+        self.count = 0
+        self.duration = 0.0
+
+    def record(self, duration: float) -> None:
+        stats: QueryStats | None = self
+        # nested profiles, e.g. a test around a request, see the inner queries too
+        while stats is not None:
+            stats.count += 1
+            stats.duration += duration
+            stats = stats.parent
+
+    def describe(self) -> str:
+        stats: QueryStats | None = self
+        while stats is not None:
+            if stats.label is not None:
+                return stats.label()
+            stats = stats.parent
+        return "-"
+
+
+_query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def profile_queries(label: Callable[[], str] | None = None) -> Iterator[QueryStats]:
+    stats = QueryStats(label, _query_stats.get())
+    token = _query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _query_stats.reset(token)
+
+
+def attach_profiler(engine: AsyncEngine, slow_query_threshold: float) -> None:
+    def before_cursor_execute(conn: Connection, *args: Any) -> None:
+        conn.info.setdefault(QUERY_START, []).append(time.perf_counter())
+
+    def after_cursor_execute(
+        conn: Connection, cursor: Any, statement: str, *args: Any
+    ) -> None:
+        duration = time.perf_counter() - conn.info[QUERY_START].pop()
+        stats = _query_stats.get()
+        if stats is not None:
+            stats.record(duration)
+        if duration >= slow_query_threshold:
+            logger.warning(
+                "Slow query took %.1fms on %s: %s",
+                duration * 1000,
+                stats.describe() if stats is not None else "-",
+                statement,
+            )
+
+    def handle_error(context: ExceptionContext) -> None:
+        # a failed statement never reaches after_cursor_execute
+        if context.connection is not None:
+            starts = context.connection.info.get(QUERY_START)
+            if starts:
+                starts.pop()
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", after_cursor_execute)
+    event.listen(engine.sync_engine, "handle_error", handle_error)
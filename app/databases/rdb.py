@@ -1,17 +1,177 @@
 import logging
-from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from contextvars import Context, ContextVar, copy_context
+from typing import Any, AsyncGenerator, Awaitable, Callable, Sequence, cast
 
+import anyio
+from sqlalchemy import make_url, text
+from sqlalchemy.engine.default import DefaultDialect
 from sqlalchemy.ext.asyncio import (
     AsyncAttrs,
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from app.databases.profiler import attach_profiler
+from app.databases.replica import (
+    REPLICA_ROUTER,
+    USE_PRIMARY,
+    WROTE,
+    Replica,
+    ReplicaRouter,
+    RoutingSession,
+)
+from app.errors.exceptions import APIException
+from app.utils.metrics import registry
 
 logger = logging.getLogger(__name__)
 
+# unit of work session shared by every repository call of the current request
+_unit_of_work_session: ContextVar[AsyncSession | None] = ContextVar(
+    "unit_of_work_session", default=None
+)
+
+# every session of the request reads from the primary, e.g. after a recent write
+_use_primary: ContextVar[bool] = ContextVar("use_primary", default=False)
+
+AFTER_COMMIT = "after_commit"
+
+DB_POOL_CHECKED_OUT = registry.gauge(
+    "db_pool_checked_out_connections", "Connections checked out of the pool", ("pool",)
+)
+DB_POOL_OVERFLOW = registry.gauge(
+    "db_pool_overflow_connections",
+    "Connections open beyond the pool size, negative while the pool is not full",
+    ("pool",),
+)
+DB_POOL_SIZE = registry.gauge("db_pool_size", "Configured pool size", ("pool",))
+DB_POOL_CHECKOUT_DURATION = registry.histogram(
+    "db_pool_checkout_duration_seconds",
+    "Time to get a connection from the pool, including waits for a free one",
+    ("pool",),
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+
+
+def after_commit(
+    session: AsyncSession, callback: Callable[[], Awaitable[None]]
+) -> None:
+    session.info.setdefault(AFTER_COMMIT, []).append(callback)
+
+
+def mark_written(session: AsyncSession) -> None:
+    # for writes that bypass the session, e.g. a coalesced insert
+    session.info[WROTE] = True
+
+
+def detached_context() -> Context:
+    # the caller's context, profiling included, minus its unit of work session, for
+    # tasks that outlive the caller and commit on their own session
+    context = copy_context()
+    context.run(_unit_of_work_session.set, None)
+    return context
+
+
+def has_written(session: AsyncSession) -> bool:
+    return bool(session.info.get(WROTE))
+
+
+def reads_from_primary() -> bool:
+    # for reads that outlive the current unit of work, e.g. a streamed response
+    session = _unit_of_work_session.get()
+    return _use_primary.get() or (session is not None and has_written(session))
+
+
+def has_pending_commit() -> bool:
+    # the current unit of work wrote something other requests must not see yet
+    session = _unit_of_work_session.get()
+    return session is not None and bool(session.info.get(AFTER_COMMIT))
+
+
+async def _run_after_commit(session: AsyncSession) -> None:
+    for callback in session.info.pop(AFTER_COMMIT, []):
+        try:
+            await callback()
+        except Exception:
+            logger.exception("PostgreSQL after commit callback failed")
+
+
+async def _close(session: AsyncSession) -> None:
+    # a cancelled request, e.g. a client leaving a streamed response, would
+    # otherwise interrupt the close and terminate the connection instead of
+    # returning it to the pool
+    with anyio.CancelScope(shield=True):
+        await session.close()
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics_label = self.logging_name or "default"
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_DURATION.observe(
+                time.perf_counter() - start, self.metrics_label
+            )
+
+
+def _pool_class(db_url: str) -> type[Pool]:
+    url = make_url(db_url)
+    dialect = cast(type[DefaultDialect], url.get_dialect(_is_async=True))
+    pool_class: type[Pool] = dialect.get_pool_class(url)
+    # special pools, like the StaticPool of in-memory SQLite, are kept as they are
+    if issubclass(pool_class, AsyncAdaptedQueuePool):
+        return TimedQueuePool
+    return pool_class
+
+
+def _create_engine(
+    db_url: str, echo: bool, name: str, slow_query_threshold: float
+) -> AsyncEngine:
+    engine = create_async_engine(
+        db_url,
+        echo=echo,
+        pool_recycle=3600,
+        poolclass=_pool_class(db_url),
+        pool_logging_name=name,
+    )
+    attach_profiler(engine, slow_query_threshold)
+    _register_pool_metrics(engine, name)
+    return engine
+
+
+def _register_pool_metrics(engine: AsyncEngine, name: str) -> None:
+    if not isinstance(engine.pool, QueuePool):
+        return
+
+    # disconnect replaces the engine's pool, so it is looked up when scraped
+    def pool() -> QueuePool:
+        return cast(QueuePool, engine.pool)
+
+    DB_POOL_CHECKED_OUT.set_function(lambda: pool().checkedout(), name)
+    DB_POOL_OVERFLOW.set_function(lambda: pool().overflow(), name)
+    DB_POOL_SIZE.set_function(lambda: pool().size(), name)
+
+
+async def _warm_up_engine(engine: AsyncEngine, connections: int) -> None:
+    if isinstance(engine.pool, QueuePool):
+        # overflow connections are closed on release instead of pooled
+        connections = min(connections, engine.pool.size())
+    # held together, otherwise the pool hands out the same connection again
+    async with AsyncExitStack() as stack:
+        for _ in range(connections):
+            conn = await stack.enter_async_context(engine.connect())
+            await conn.execute(text("SELECT 1"))
+
 
 class Base(AsyncAttrs, DeclarativeBase):
     pass
@@ -22,29 +182,108 @@ class RDBDatabase:
         self,
         db_url: str,
         echo: bool,
+        name: str = "primary",
+        slow_query_threshold: float = 0.2,
+        replica_urls: Sequence[str] = (),
+        replica_check_interval: float = 5.0,
     ) -> None:
-        self._engine = create_async_engine(
-            db_url,
-            echo=echo,
-            pool_recycle=3600,
+        self._engine = _create_engine(db_url, echo, name, slow_query_threshold)
+        self._router: ReplicaRouter | None = None
+        if replica_urls:
+            self._router = ReplicaRouter(
+                [
+                    Replica(
+                        f"replica-{index}",
+                        _create_engine(
+                            url, echo, f"replica-{index}", slow_query_threshold
+                        ),
+                    )
+                    for index, url in enumerate(replica_urls)
+                ],
+                replica_check_interval,
+            )
+        self._session_factory = async_sessionmaker(
+            self._engine, expire_on_commit=False, sync_session_class=RoutingSession
         )
-        self._session_factory = async_sessionmaker(self._engine, expire_on_commit=False)
+
+    @property
+    def _queue_pool(self) -> QueuePool:
+        return cast(QueuePool, self._engine.pool)
+
+    @property
+    def _engines(self) -> list[AsyncEngine]:
+        replicas = self._router.replicas if self._router is not None else []
+        return [self._engine, *(replica.engine for replica in replicas)]
+
+    def _new_session(self) -> AsyncSession:
+        session = self._session_factory()
+        if self._router is not None:
+            session.info[REPLICA_ROUTER] = self._router
+            if _use_primary.get():
+                session.info[USE_PRIMARY] = True
+        return session
+
+    @property
+    def has_replicas(self) -> bool:
+        return self._router is not None
+
+    async def start(self) -> None:
+        if self._router is not None:
+            await self._router.start()
 
     async def connect(self) -> None:
         async with self._engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
 
     async def disconnect(self) -> None:
-        await self._engine.dispose()
+        if self._router is not None:
+            await self._router.stop()
+        for engine in self._engines:
+            await engine.dispose()
+
+    async def warm_up(self, connections: int) -> None:
+        for engine in self._engines:
+            await _warm_up_engine(engine, connections)
+
+    @asynccontextmanager
+    async def unit_of_work(
+        self, use_primary: bool = False
+    ) -> AsyncGenerator[AsyncSession, None]:
+        use_primary_token = _use_primary.set(use_primary)
+        session = self._new_session()
+        token = _unit_of_work_session.set(session)
+        try:
+            yield session
+            await session.commit()
+            await _run_after_commit(session)
+        except APIException:
+            await session.rollback()
+            raise
+        except Exception:
+            logger.exception("PostgreSQL UnitOfWork rollback because of exception")
+            await session.rollback()
+            raise
+        finally:
+            _unit_of_work_session.reset(token)
+            _use_primary.reset(use_primary_token)
+            await _close(session)
 
     @asynccontextmanager
     async def session(self) -> AsyncGenerator[AsyncSession, None]:
-        session = self._session_factory()
+        current_session = _unit_of_work_session.get()
+        if current_session is not None:
+            # commit and rollback belong to the surrounding unit of work
+            yield current_session
+            return
+
+        session = self._new_session()
         try:
             yield session
+            await session.commit()
+            await _run_after_commit(session)
         except Exception:
             logger.exception("PostgreSQL Session rollback because of exception")
             await session.rollback()
             raise
         finally:
-            await session.close()
+            await _close(session)
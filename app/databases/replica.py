@@ -0,0 +1,162 @@
+import asyncio
+import hashlib
+import itertools
+import logging
+import time
+from typing import Any
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+from sqlalchemy import Select, event, text
+from sqlalchemy.engine import Connection, Engine, ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+from app.utils.cache import TTLCache
+from app.utils.metrics import register_cache, registry
+
+logger = logging.getLogger(__name__)
+
+# session.info keys, and the execution option that keeps a read on the primary
+REPLICA_ROUTER = "replica_router"
+USE_PRIMARY = "use_primary"
+WROTE = "wrote"
+
+DB_REPLICA_HEALTHY = registry.gauge(
+    "db_replica_healthy", "1 while the replica passes its health check", ("pool",)
+)
+
+
+class Replica:
+    def __init__(self, name: str, engine: AsyncEngine) -> None:
+        self.name = name
+        self.engine = engine
+        self.healthy = True
+        event.listen(engine.sync_engine, "handle_error", self._handle_error)
+        DB_REPLICA_HEALTHY.set_function(lambda: float(self.healthy), name)
+
+    def _handle_error(self, context: ExceptionContext) -> None:
+        # taken out right away, the health check brings it back
+        if context.is_disconnect and self.healthy:
+            logger.warning("Replica %s disconnected", self.name)
+            self.healthy = False
+
+    async def check(self, timeout: float) -> None:
+        try:
+            async with asyncio.timeout(timeout):
+                async with self.engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+        except Exception:
+            if self.healthy:
+                logger.warning("Replica %s failed its health check", self.name)
+            self.healthy = False
+            return
+        if not self.healthy:
+            logger.info("Replica %s is healthy again", self.name)
+        self.healthy = True
+
+
+class ReplicaRouter:
+    def __init__(self, replicas: list[Replica], check_interval: float) -> None:
+        self.replicas = replicas
+        self.check_interval = check_interval
+        self._counter = itertools.count()
+        self._task: asyncio.Task[None] | None = None
+
+    def pick(self) -> Replica | None:
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+        return healthy[next(self._counter) % len(healthy)]
+
+    async def check(self) -> None:
+        await asyncio.gather(
+            *(replica.check(self.check_interval) for replica in self.replicas)
+        )
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._check_forever())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _check_forever(self) -> None:
+        while True:
+            await self.check()
+            await asyncio.sleep(self.check_interval)
+
+
+# Remembers for window seconds who committed a write, in Redis so every worker
+# sends that client's reads to the primary. Keys are hashes of the client's token.
+# Writers are also kept in-process until their marker expires, so the requests a
+# worker serves after a write skip the Redis lookup.
+class RecentWriters:
+    def __init__(
+        self, redis: aioredis.Redis, window: float, local_max_size: int = 10_000
+    ) -> None:
+        self.redis = redis
+        self.window = window
+        self._local: TTLCache[str, bool] = TTLCache(max_size=local_max_size)
+        register_cache("recent_writers", self._local)
+
+    def redis_key(self, consistency_key: str) -> str:
+        return "rw:" + hashlib.sha256(consistency_key.encode()).hexdigest()
+
+    async def wrote_recently(self, consistency_key: str) -> bool:
+        key = self.redis_key(consistency_key)
+        if self._local.get(key):
+            return True
+        try:
+            # milliseconds left, negative without a marker
+            remaining = await self.redis.pttl(key)
+        except RedisError:
+            # unknown, so the client may have just written
+            logger.warning("Read-your-writes lookup failed, reading from the primary")
+            return True
+        if remaining <= 0:
+            return False
+        self._local.set(key, True, expires_at=time.time() + remaining / 1000)
+        return True
+
+    async def remember(self, consistency_key: str) -> None:
+        key = self.redis_key(consistency_key)
+        self._local.set(key, True, expires_at=time.time() + self.window)
+        try:
+            await self.redis.set(key, 1, px=max(1, int(self.window * 1000)))
+        except RedisError:
+            logger.warning("Read-your-writes marker could not be stored")
+
+
+def _is_read(clause: Any) -> bool:
+    return isinstance(clause, Select) and clause._for_update_arg is None
+
+
+# Sends plain SELECTs to a healthy replica and everything else, flushes and
+# locking reads included, to the primary. Once a session has written, or is
+# marked USE_PRIMARY, all of its statements go to the primary so it reads its
+# own writes. A read with the USE_PRIMARY option goes to the primary without
+# counting as a write.
+class RoutingSession(Session):
+    def get_bind(
+        self, mapper: Any = None, *, clause: Any = None, **kw: Any
+    ) -> Engine | Connection:
+        router: ReplicaRouter | None = self.info.get(REPLICA_ROUTER)
+        if router is not None:
+            if not _is_read(clause):
+                self.info[WROTE] = True
+            elif (
+                not self.info.get(WROTE)
+                and not self.info.get(USE_PRIMARY)
+                and not clause.get_execution_options().get(USE_PRIMARY, False)
+            ):
+                replica = router.pick()
+                if replica is not None:
+                    return replica.engine.sync_engine
+        return super().get_bind(mapper, clause=clause, **kw)
@@ -3,10 +3,12 @@ from typing import Optional
 
 class StatusCode:
     HTTP_500 = 500
+    HTTP_400 = 400
     HTTP_401 = 401
     HTTP_403 = 403
     HTTP_404 = 404
     HTTP_409 = 409
+    HTTP_503 = 503
 
 
 class APIException(Exception):
@@ -105,3 +107,39 @@ class PostNotFoundError(APIException):
             code=f"{StatusCode.HTTP_403}{'9'.zfill(3)}",
             message="게시글을 찾을 수 없습니다.",
         )
+
+
+class ServerBusyError(APIException):
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=StatusCode.HTTP_503,
+            code=f"{StatusCode.HTTP_503}{'10'.zfill(3)}",
+            message="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해 주세요.",
+        )
+
+
+class InvalidCursorError(APIException):
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=StatusCode.HTTP_400,
+            code=f"{StatusCode.HTTP_400}{'11'.zfill(3)}",
+            message="유효하지 않은 페이지 커서입니다.",
+        )
+
+
+class InvalidFieldError(APIException):
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=StatusCode.HTTP_400,
+            code=f"{StatusCode.HTTP_400}{'12'.zfill(3)}",
+            message="조회할 수 없는 필드입니다.",
+        )
+
+
+class NotReadyError(APIException):
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=StatusCode.HTTP_503,
+            code=f"{StatusCode.HTTP_503}{'13'.zfill(3)}",
+            message="서버가 아직 준비되지 않았습니다.",
+        )
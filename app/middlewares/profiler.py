@@ -0,0 +1,35 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.databases.profiler import profile_queries
+from app.middlewares.metrics import route_label
+
+
+class QueryProfilerMiddleware:
+    def __init__(self, app: ASGIApp, server_timing: bool = False) -> None:
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with profile_queries(
+            lambda: f"{scope['method']} {route_label(scope)}"
+        ) as stats:
+            if not self.server_timing:
+                await self.app(scope, receive, send)
+                return
+
+            async def _send(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    # queries of a streamed body run after the headers are sent
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries"',
+                    )
+                await send(message)
+
+            await self.app(scope, receive, _send)
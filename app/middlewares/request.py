@@ -1,32 +1,42 @@
-from typing import Awaitable, Callable, Union
-
-from fastapi import Request
-from starlette.responses import JSONResponse, StreamingResponse
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.config import settings
 from app.errors.exceptions import APIException
 
 
-async def base_http_middleware(
-    request: Request, call_next: Callable[[Request], Awaitable[StreamingResponse]]
-) -> Union[StreamingResponse, JSONResponse]:
-    url = request.url.path
-
-    if url in settings.EXCEPT_PATH_LIST:
-        response: StreamingResponse = await call_next(request)
-        return response
-
-    try:
-        response = await call_next(request)
-        return response
-    except Exception as e:
-        error = await exception_handler(e)
-        error_dict = {
-            "status_code": error.status_code,
-            "code": error.code,
-            "message": error.message,
-        }
-        return JSONResponse(status_code=error.status_code, content=error_dict)
+class APIExceptionMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        url = scope.get("root_path", "") + scope.get("path", "")
+        if scope["type"] != "http" or url in settings.EXCEPT_PATH_LIST:
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def _send(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, _send)
+        except Exception as e:
+            # too late to replace a response that is already on the wire
+            if response_started:
+                raise
+            error = await exception_handler(e)
+            error_dict = {
+                "status_code": error.status_code,
+                "code": error.code,
+                "message": error.message,
+            }
+            response = JSONResponse(status_code=error.status_code, content=error_dict)
+            await response(scope, receive, send)
 
 
 async def exception_handler(error: Exception) -> APIException:
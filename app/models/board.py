@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import BaseModel
@@ -6,7 +6,18 @@ from app.models.base import BaseModel
 
 class Board(BaseModel):
     __tablename__ = "board"
+    __table_args__ = (
+        Index("ix_board_user_id_id", "user_id", "id"),
+        Index("ix_board_user_id_created_dt_id", "user_id", "created_dt", "id"),
+        Index("ix_board_public_id", "id", postgresql_where=text("public")),
+        Index(
+            "ix_board_public_created_dt_id",
+            "created_dt",
+            "id",
+            postgresql_where=text("public"),
+        ),
+    )
 
     name: Mapped[str] = mapped_column(String(255), unique=True)
     public: Mapped[bool] = mapped_column(nullable=False)
-    user_id: Mapped[int] = mapped_column(ForeignKey("user.id"), index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("user.id"))
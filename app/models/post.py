@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy import ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import BaseModel
@@ -6,8 +6,19 @@ from app.models.base import BaseModel
 
 class Post(BaseModel):
     __tablename__ = "post"
+    __table_args__ = (
+        Index("ix_post_board_id_user_id_id", "board_id", "user_id", "id"),
+        Index(
+            "ix_post_board_id_user_id_created_dt_id",
+            "board_id",
+            "user_id",
+            "created_dt",
+            "id",
+        ),
+    )
 
-    title: Mapped[str] = mapped_column(String(255), index=True)
-    content: Mapped[str] = mapped_column(Text)
+    title: Mapped[str] = mapped_column(String(255))
+    # unbounded, only loaded by the queries that return it
+    content: Mapped[str] = mapped_column(Text, deferred=True, deferred_raiseload=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("user.id"))
     board_id: Mapped[int] = mapped_column(ForeignKey("board.id"))
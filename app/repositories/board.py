@@ -1,25 +1,32 @@
 from contextlib import AbstractAsyncContextManager
+from functools import partial
 from typing import Callable
 
-from sqlalchemy import delete, or_, select, update
+from sqlalchemy import delete, or_, select, union, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from app.databases.cache import ReadThroughCache
+from app.databases.rdb import after_commit
 from app.models.board import Board
-from app.schemas.board import BoardCreate, BoardUpdate
+from app.schemas.board import BoardCreate, BoardUpdate, ResponseBoardDto
+from app.utils.pagination import Cursor, Page, PageOrder, build_page, keyset_paginate
 
 
 class BoardRepository:
     def __init__(
         self,
         session_factory: Callable[..., AbstractAsyncContextManager[AsyncSession]],
+        cache: ReadThroughCache[ResponseBoardDto] | None = None,
     ) -> None:
         self.session_factory = session_factory
+        self.cache = cache
 
     async def add(self, board_create: BoardCreate) -> Board:
         async with self.session_factory() as session:
             board = Board(**board_create.dict())
             session.add(board)
-            await session.commit()
+            await session.flush()
             await session.refresh(board)
             return board
 
@@ -27,46 +34,100 @@ class BoardRepository:
         async with self.session_factory() as session:
             stmt = select(Board).where(
                 Board.id == board_id,
-                or_(Board.user_id == user_id, Board.public.is_(True)),
+                or_(Board.user_id == user_id, Board.public),
             )
             result = await session.execute(stmt)
             return result.scalars().one_or_none()
 
-    async def get_board_by_board_id(self, board_id: int) -> Board | None:
+    async def get_boards(self, board_ids: list[int], user_id: int) -> list[Board]:
         async with self.session_factory() as session:
             stmt = select(Board).where(
-                Board.id == board_id,
+                Board.id.in_(board_ids),
+                or_(Board.user_id == user_id, Board.public),
             )
             result = await session.execute(stmt)
-            return result.scalars().one_or_none()
+            return list(result.scalars().all())
 
-    async def list_boards(self, user_id: int, cursor_id: int, limit: int) -> list[Board]:
+    async def get_board_by_board_id(self, board_id: int) -> Board | None:
+        if self.cache is None:
+            board_dto = await self._load_board(board_id)
+        else:
+            board_dto = await self.cache.get(
+                board_id, partial(self._load_board, board_id)
+            )
+        # a detached copy, cached entries are shared between requests
+        return Board(**board_dto.dict()) if board_dto else None
+
+    async def _load_board(self, board_id: int) -> ResponseBoardDto | None:
         async with self.session_factory() as session:
+            # cached for every request, a lagging replica would keep a stale row
             stmt = (
                 select(Board)
-                .where(
-                    Board.id > cursor_id,
-                    or_(Board.user_id == user_id, Board.public.is_(True))
-                )
-                .order_by(Board.id)
-                .limit(limit)
+                .where(Board.id == board_id)
+                .execution_options(use_primary=True)
             )
+            result = await session.execute(stmt)
+            board = result.scalars().one_or_none()
+            return ResponseBoardDto.from_row(board) if board else None
 
+    async def list_boards(
+        self,
+        user_id: int,
+        limit: int,
+        order: PageOrder = PageOrder.ID,
+        cursor: Cursor | None = None,
+    ) -> Page[Board]:
+        # a page per branch of "user_id = ? OR public", each read in order from its
+        # own index, then merged. with the OR the planner either sorts every
+        # visible board or walks the primary key filtering each one
+        branches = [
+            select(
+                keyset_paginate(
+                    select(Board).where(visible),
+                    [getattr(Board, key) for key in order.keys],
+                    order,
+                    cursor,
+                    limit,
+                ).subquery()
+            )
+            for visible in (Board.user_id == user_id, Board.public)
+        ]
+        # union drops the public boards of the user that both branches return
+        board = aliased(Board, union(*branches).subquery())
+        async with self.session_factory() as session:
+            stmt = keyset_paginate(
+                select(board),
+                [getattr(board, key) for key in order.keys],
+                order,
+                cursor,
+                limit,
+            )
             result = await session.execute(stmt)
-            return list(result.scalars().all())
+            return build_page(result.scalars().all(), order, cursor, limit)
 
-    async def update(self, board: BoardUpdate) -> None:
+    async def update(self, board: BoardUpdate) -> Board | None:
         async with self.session_factory() as session:
             stmt = (
                 update(Board)
                 .where(Board.id == board.id, Board.user_id == board.user_id)
                 .values(name=board.name, public=board.public)
+                .returning(Board)
             )
-            await session.execute(stmt)
-            await session.commit()
+            result = await session.execute(stmt)
+            updated_board = result.scalars().one_or_none()
+            if updated_board is not None and self.cache is not None:
+                after_commit(session, partial(self.cache.invalidate, board.id))
+            return updated_board
 
-    async def delete(self, board_id: int) -> None:
+    async def delete(self, board_id: int, user_id: int) -> int | None:
         async with self.session_factory() as session:
-            stmt = delete(Board).where(Board.id == board_id)
-            await session.execute(stmt)
-            await session.commit()
+            stmt = (
+                delete(Board)
+                .where(Board.id == board_id, Board.user_id == user_id)
+                .returning(Board.id)
+            )
+            result = await session.execute(stmt)
+            deleted_id = result.scalar_one_or_none()
+            if deleted_id is not None and self.cache is not None:
+                after_commit(session, partial(self.cache.invalidate, board_id))
+            return deleted_id
@@ -1,75 +1,306 @@
 from contextlib import AbstractAsyncContextManager
-from typing import Callable
+from functools import partial
+from typing import Any, AsyncGenerator, Callable, Sequence
 
-from sqlalchemy import delete, or_, select, update
+import anyio
+from sqlalchemy import (
+    Row,
+    delete,
+    func,
+    insert,
+    literal_column,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
+from app.databases.cache import ReadThroughCache
+from app.databases.coalescer import WriteCoalescer
+from app.databases.rdb import after_commit, mark_written, reads_from_primary
 from app.models.board import Board
 from app.models.post import Post
-from app.schemas.post import PostCreate, PostUpdate
+from app.schemas.post import PostCreate, PostUpdate, ResponsePostDto
+from app.utils.pagination import (
+    Cursor,
+    Page,
+    PageOrder,
+    RankCursor,
+    build_page,
+    keyset_paginate,
+)
+
+POST_FIELDS = tuple(ResponsePostDto.__fields__)
+
+# generated by Postgres, see the add_post_search_vector migration. it is not
+# mapped on Post so that the model still works on databases without it
+SEARCH_VECTOR = literal_column("post.search_vector", TSVECTOR)
+SEARCH_CONFIG = "simple"
+SNIPPET_OPTIONS = (
+    "MaxWords=35, MinWords=15, MaxFragments=2, StartSel=<mark>, StopSel=</mark>"
+)
+# ampersand first so the other entities are not escaped twice
+HTML_ESCAPES = (
+    ("&", "&amp;"),
+    ("<", "&lt;"),
+    (">", "&gt;"),
+    ('"', "&quot;"),
+    ("'", "&#39;"),
+)
+
+
+def escape_html(column: Any) -> Any:
+    # the parser reads entities as single tokens, so they are never highlighted
+    for char, entity in HTML_ESCAPES:
+        column = func.replace(column, char, entity)
+    return column
 
 
 class PostRepository:
     def __init__(
         self,
         session_factory: Callable[..., AbstractAsyncContextManager[AsyncSession]],
+        cache: ReadThroughCache[ResponsePostDto] | None = None,
+        coalescer: WriteCoalescer[PostCreate, Post] | None = None,
     ) -> None:
         self.session_factory = session_factory
+        self.cache = cache
+        self.coalescer = coalescer
 
     async def add(self, post_create: PostCreate) -> Post:
-        async with self.session_factory() as session:
-            post = Post(**post_create.dict())
-            session.add(post)
-            await session.commit()
-            await session.refresh(post)
+        if self.coalescer is not None and self.coalescer.enabled:
+            # inserted and committed together with concurrent adds, outside the
+            # caller's unit of work
+            post = await self.coalescer.submit(post_create)
+            async with self.session_factory() as session:
+                mark_written(session)
             return post
 
+        async with self.session_factory() as session:
+            stmt = (
+                insert(Post)
+                .values(**post_create.dict())
+                .returning(Post)
+                .options(undefer(Post.content))
+            )
+            result = await session.execute(stmt)
+            return result.scalars().one()
+
+    async def add_all(self, post_creates: list[PostCreate]) -> list[Post]:
+        async with self.session_factory() as session:
+            # one multi-row INSERT ... RETURNING, rows come back in input order
+            stmt = (
+                insert(Post)
+                .returning(Post, sort_by_parameter_order=True)
+                .options(undefer(Post.content))
+            )
+            result = await session.scalars(
+                stmt, [post_create.dict() for post_create in post_creates]
+            )
+            return list(result.all())
+
     async def get_post_by_post_id(self, post_id: int) -> Post | None:
+        if self.cache is None:
+            post_dto = await self._load_post(post_id)
+        else:
+            post_dto = await self.cache.get(post_id, partial(self._load_post, post_id))
+        # a detached copy, cached entries are shared between requests
+        return Post(**post_dto.dict()) if post_dto else None
+
+    async def _load_post(self, post_id: int) -> ResponsePostDto | None:
         async with self.session_factory() as session:
-            stmt = select(Post).where(Post.id == post_id)
+            # cached for every request, a lagging replica would keep a stale row
+            stmt = (
+                select(Post)
+                .where(Post.id == post_id)
+                .options(undefer(Post.content))
+                .execution_options(use_primary=True)
+            )
             result = await session.execute(stmt)
-            return result.scalars().one_or_none()
+            post = result.scalars().one_or_none()
+            return ResponsePostDto.from_row(post) if post else None
 
-    async def update(self, post: PostUpdate) -> None:
+    async def update(self, post: PostUpdate) -> Post | None:
         async with self.session_factory() as session:
             stmt = (
                 update(Post)
                 .where(Post.id == post.id, Post.user_id == post.user_id)
                 .values(title=post.title, content=post.content)
+                .returning(Post)
+                .options(undefer(Post.content))
             )
-            await session.execute(stmt)
-            await session.commit()
+            result = await session.execute(stmt)
+            updated_post = result.scalars().one_or_none()
+            if updated_post is not None and self.cache is not None:
+                after_commit(session, partial(self.cache.invalidate, post.id))
+            return updated_post
 
-    async def delete(self, post_id: int, user_id: int) -> None:
+    async def delete(self, post_id: int, user_id: int) -> int | None:
         async with self.session_factory() as session:
-            stmt = delete(Post).where(Post.id == post_id, Post.user_id == user_id)
-            await session.execute(stmt)
-            await session.commit()
+            stmt = (
+                delete(Post)
+                .where(Post.id == post_id, Post.user_id == user_id)
+                .returning(Post.id)
+            )
+            result = await session.execute(stmt)
+            deleted_id = result.scalar_one_or_none()
+            if deleted_id is not None and self.cache is not None:
+                after_commit(session, partial(self.cache.invalidate, post_id))
+            return deleted_id
 
     async def get_post(self, post_id: int, user_id: int) -> Post | None:
         async with self.session_factory() as session:
             stmt = (
                 select(Post)
+                .options(undefer(Post.content))
                 .join(Board)
                 .where(
                     Post.id == post_id,
-                    or_(Post.user_id == user_id, Board.public.is_(True)),
+                    or_(Post.user_id == user_id, Board.public),
                 )
             )
             result = await session.execute(stmt)
             return result.scalars().one_or_none()
 
-    async def list_posts(
-        self, board_id: int, user_id: int, cursor_id: int, limit: int
-    ) -> list[Post]:
+    async def get_posts(self, post_ids: list[int], user_id: int) -> list[Post]:
         async with self.session_factory() as session:
             stmt = (
                 select(Post)
+                .options(undefer(Post.content))
+                .join(Board)
                 .where(
-                    Post.id > cursor_id,
-                    Post.board_id == board_id,
-                    Post.user_id == user_id)
-                .limit(limit)
+                    Post.id.in_(post_ids),
+                    or_(Post.user_id == user_id, Board.public),
+                )
             )
             result = await session.execute(stmt)
             return list(result.scalars().all())
+
+    async def list_posts(
+        self,
+        board_id: int,
+        user_id: int,
+        limit: int,
+        order: PageOrder = PageOrder.ID,
+        cursor: Cursor | None = None,
+        fields: Sequence[str] = POST_FIELDS,
+        excerpt: int | None = None,
+    ) -> Page[Row[Any]]:
+        # only the requested columns, plus the keys the cursor is built from
+        names = dict.fromkeys(["id", *order.keys, *fields])
+        columns = [
+            func.substr(Post.content, 1, excerpt).label("content")
+            if name == "content" and excerpt is not None
+            else getattr(Post, name)
+            for name in names
+        ]
+        async with self.session_factory() as session:
+            stmt = keyset_paginate(
+                select(*columns).where(
+                    Post.board_id == board_id, Post.user_id == user_id
+                ),
+                [getattr(Post, key) for key in order.keys],
+                order,
+                cursor,
+                limit,
+            )
+            result = await session.execute(stmt)
+            return build_page(result.all(), order, cursor, limit)
+
+    def stream_posts(
+        self, board_id: int, user_id: int, fetch_size: int
+    ) -> AsyncGenerator[Sequence[Post], None]:
+        # read once the unit of work has ended, so its routing is captured now
+        return self._stream_posts(board_id, user_id, fetch_size, reads_from_primary())
+
+    async def _stream_posts(
+        self, board_id: int, user_id: int, fetch_size: int, use_primary: bool
+    ) -> AsyncGenerator[Sequence[Post], None]:
+        async with self.session_factory() as session:
+            stmt = (
+                select(Post)
+                .options(undefer(Post.content))
+                .join(Board)
+                .where(
+                    Post.board_id == board_id,
+                    or_(Post.user_id == user_id, Board.public),
+                )
+                .order_by(Post.id)
+                .execution_options(yield_per=fetch_size, use_primary=use_primary)
+            )
+            # a server-side cursor, the next rows are only fetched once the
+            # previous partition has been consumed
+            result = await session.stream_scalars(stmt)
+            partitions = result.partitions()
+            while True:
+                # a cancelled request, e.g. a client disconnecting, stops here. a
+                # fetch interrupted halfway would leave the connection unusable
+                await anyio.lowlevel.checkpoint()
+                with anyio.CancelScope(shield=True):
+                    partition = await anext(partitions, None)
+                if partition is None:
+                    return
+                yield partition
+
+    async def search_posts(
+        self,
+        user_id: int,
+        query: str,
+        limit: int,
+        cursor: RankCursor | None = None,
+    ) -> Page[Row[Any]]:
+        async with self.session_factory() as session:
+            ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+            rank = func.ts_rank(SEARCH_VECTOR, ts_query)
+            stmt = (
+                select(Post.id, rank.label("rank"))
+                .join(Board)
+                .where(
+                    SEARCH_VECTOR.op("@@")(ts_query),
+                    or_(Post.user_id == user_id, Board.public),
+                )
+            )
+            if cursor is not None:
+                stmt = stmt.where(tuple_(rank, Post.id) < (cursor.rank, cursor.id))
+            matches = (
+                stmt.order_by(rank.desc(), Post.id.desc()).limit(limit + 1).subquery()
+            )
+
+            # snippets are only built for the rows of the page
+            stmt = (
+                select(
+                    Post.id,
+                    Post.title,
+                    Post.user_id,
+                    Post.board_id,
+                    Post.created_dt,
+                    Post.updated_dt,
+                    matches.c.rank,
+                    # the snippet is rendered as html, only the <mark> tags are
+                    # left unescaped
+                    func.ts_headline(
+                        SEARCH_CONFIG,
+                        escape_html(Post.content),
+                        ts_query,
+                        SNIPPET_OPTIONS,
+                    ).label("snippet"),
+                )
+                .join(matches, matches.c.id == Post.id)
+                .order_by(matches.c.rank.desc(), Post.id.desc())
+            )
+            rows = (await session.execute(stmt)).all()
+
+        items = list(rows[:limit])
+        has_more = len(rows) > limit
+        return Page(
+            items=items,
+            next_cursor=(
+                RankCursor(rank=items[-1].rank, id=items[-1].id).encode()
+                if has_more
+                else None
+            ),
+            has_more=has_more,
+        )
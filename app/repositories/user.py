@@ -1,3 +1,4 @@
+import time
 from contextlib import AbstractAsyncContextManager
 from datetime import timedelta
 from typing import Callable
@@ -6,6 +7,12 @@ from redis import asyncio as aioredis
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.databases.blacklist import (
+    BLACKLIST_CHANNEL,
+    BLACKLIST_KEY,
+    REDIS_COMMAND_DURATION,
+    TokenBlacklist,
+)
 from app.models.user import User
 from app.schemas.user import RequestUserRegisterDto
 
@@ -15,23 +22,45 @@ class UserRepository:
         self,
         session_factory: Callable[..., AbstractAsyncContextManager[AsyncSession]],
         redis: aioredis.Redis,
+        token_blacklist: TokenBlacklist | None = None,
     ) -> None:
         self.session_factory = session_factory
         self.redis = redis
+        self.token_blacklist = token_blacklist
 
     async def add(self, user_dto: RequestUserRegisterDto) -> User:
         async with self.session_factory() as session:
             user = User(**user_dto.dict())
             session.add(user)
-            await session.commit()
+            await session.flush()
             await session.refresh(user)
             return user
 
     async def get_user_by_email(self, email: str) -> User | None:
         async with self.session_factory() as session:
-            stmt = select(User).where(User.email == email)
+            # credentials and the duplicate check must see a user registered a
+            # moment ago, which a lagging replica may not have yet
+            stmt = (
+                select(User)
+                .where(User.email == email)
+                .execution_options(use_primary=True)
+            )
             result = await session.execute(stmt)
             return result.scalars().one_or_none()
 
     async def blacklist_token(self, token: str, expire_delta: timedelta) -> None:
-        await self.redis.set(token, "blacklist", ex=expire_delta)
+        expires_at = time.time() + expire_delta.total_seconds()
+        start = time.perf_counter()
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.set(token, "blacklist", ex=expire_delta)
+                pipe.zadd(BLACKLIST_KEY, {token: expires_at})
+                pipe.publish(BLACKLIST_CHANNEL, f"{expires_at} {token}")
+                await pipe.execute()
+        finally:
+            REDIS_COMMAND_DURATION.observe(
+                time.perf_counter() - start, "blacklist_token"
+            )
+
+        if self.token_blacklist is not None:
+            self.token_blacklist.add(token, expires_at)
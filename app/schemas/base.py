@@ -1,7 +1,9 @@
-from typing import Any
+from typing import Any, Type, TypeVar
 
 from pydantic import BaseModel, Field
 
+DtoT = TypeVar("DtoT", bound="ResponseDtoModel")
+
 
 class ResponseBaseModel(BaseModel):
     code: int = Field(title="응답 코드", example=200)
@@ -10,3 +12,16 @@ class ResponseBaseModel(BaseModel):
 
 class ResponseBase(ResponseBaseModel):
     data: dict[str, Any] = Field(title="응답 데이터", default={})
+
+
+class ResponseCursorPageModel(ResponseBaseModel):
+    next_cursor: str | None = Field(title="다음 페이지 커서", default=None)
+    prev_cursor: str | None = Field(title="이전 페이지 커서", default=None)
+    has_more: bool = Field(title="조회 방향의 다음 데이터 존재 여부", default=False)
+
+
+class ResponseDtoModel(BaseModel):
+    @classmethod
+    def from_row(cls: Type[DtoT], row: Any) -> DtoT:
+        # rows loaded from the database are trusted, skip validation
+        return cls.construct(**{name: getattr(row, name) for name in cls.__fields__})
@@ -2,7 +2,12 @@ from datetime import datetime
 
 from pydantic import BaseModel, Field
 
-from app.schemas.base import ResponseBaseModel
+from app.config import settings
+from app.schemas.base import (
+    ResponseBaseModel,
+    ResponseCursorPageModel,
+    ResponseDtoModel,
+)
 
 
 class RequestBoardCreateDto(BaseModel):
@@ -14,6 +19,15 @@ class BoardCreate(RequestBoardCreateDto):
     user_id: int = Field(title="유저 ID", example=1)
 
 
+class RequestBoardBatchGetDto(BaseModel):
+    ids: list[int] = Field(
+        title="조회할 게시판 ID 목록",
+        min_items=1,
+        max_items=settings.BATCH_GET_MAX_SIZE,
+        example=[1, 2],
+    )
+
+
 class RequestBoardUpdateDto(BaseModel):
     name: str | None = Field(title="게시판 명", example="게시판")
     public: bool | None = Field(title="공개여부", example=True)
@@ -24,7 +38,7 @@ class BoardUpdate(RequestBoardUpdateDto):
     user_id: int = Field(title="유저 ID", example=1)
 
 
-class ResponseBoardDto(BaseModel):
+class ResponseBoardDto(ResponseDtoModel):
     id: int = Field(title="게시판 ID", example=1)
     name: str = Field(title="게시판 명", example="게시판")
     public: bool = Field(title="공개여부", example=True)
@@ -37,5 +51,17 @@ class ResponseBoard(ResponseBaseModel):
     data: ResponseBoardDto
 
 
-class ResponseBoardList(ResponseBaseModel):
+class ResponseBoardList(ResponseCursorPageModel):
     data: list[ResponseBoardDto]
+
+
+class ResponseBoardBatchGetItemDto(BaseModel):
+    id: int = Field(title="게시판 ID", example=1)
+    status_code: int = Field(title="응답 코드", example=200)
+    code: str | None = Field(title="오류 코드", default=None, example=None)
+    message: str | None = Field(title="오류 메시지", default=None, example=None)
+    data: ResponseBoardDto | None = Field(title="게시판", default=None)
+
+
+class ResponseBoardBatchGet(ResponseBaseModel):
+    data: list[ResponseBoardBatchGetItemDto]
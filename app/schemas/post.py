@@ -2,7 +2,12 @@ from datetime import datetime
 
 from pydantic import BaseModel, Field
 
-from app.schemas.base import ResponseBaseModel
+from app.config import settings
+from app.schemas.base import (
+    ResponseBaseModel,
+    ResponseCursorPageModel,
+    ResponseDtoModel,
+)
 
 
 class RequestPostCreateDto(BaseModel):
@@ -15,6 +20,23 @@ class PostCreate(RequestPostCreateDto):
     user_id: int = Field(title="유저 ID", example=1)
 
 
+class RequestPostBatchCreateDto(BaseModel):
+    posts: list[RequestPostCreateDto] = Field(
+        title="생성할 게시글 목록",
+        min_items=1,
+        max_items=settings.POST_BATCH_MAX_SIZE,
+    )
+
+
+class RequestPostBatchGetDto(BaseModel):
+    ids: list[int] = Field(
+        title="조회할 게시글 ID 목록",
+        min_items=1,
+        max_items=settings.BATCH_GET_MAX_SIZE,
+        example=[1, 2],
+    )
+
+
 class RequestPostUpdateDto(BaseModel):
     title: str | None = Field(title="게시글 제목", example="수정된 게시글 제목")
     content: str | None = Field(title="게시글 내용", example="수정된 게시글 내용")
@@ -25,7 +47,7 @@ class PostUpdate(RequestPostUpdateDto):
     user_id: int = Field(title="유저 ID", example=1)
 
 
-class ResponsePostDto(BaseModel):
+class ResponsePostDto(ResponseDtoModel):
     id: int = Field(title="게시글 ID", example=1)
     title: str | None = Field(title="게시글 제목", example="수정된 게시글 제목")
     content: str | None = Field(title="게시글 내용", example="수정된 게시글 내용")
@@ -39,5 +61,69 @@ class ResponsePost(ResponseBaseModel):
     data: ResponsePostDto
 
 
-class ResponsePostList(ResponseBaseModel):
-    data: list[ResponsePostDto]
+class ResponsePostListDto(ResponseDtoModel):
+    # only the fields selected with fields= are set
+    id: int = Field(title="게시글 ID", example=1)
+    title: str | None = Field(title="게시글 제목", default=None, example="게시글 제목")
+    content: str | None = Field(
+        title="게시글 내용, excerpt 지정 시 앞부분만",
+        default=None,
+        example="게시글 내용",
+    )
+    user_id: int | None = Field(title="유저 ID", default=None, example=1)
+    board_id: int | None = Field(title="게시판 ID", default=None, example=1)
+    created_dt: datetime | None = Field(
+        title="생성일", default=None, example="2024-01-01 00:00:00"
+    )
+    updated_dt: datetime | None = Field(
+        title="수정일", default=None, example="2024-01-01 00:00:00"
+    )
+
+
+class ResponsePostList(ResponseCursorPageModel):
+    data: list[ResponsePostListDto]
+
+
+class ResponsePostSearchDto(ResponseDtoModel):
+    id: int = Field(title="게시글 ID", example=1)
+    title: str = Field(title="게시글 제목", example="새 게시글")
+    user_id: int = Field(title="유저 ID", example=1)
+    board_id: int = Field(title="게시판 ID", example=1)
+    created_dt: datetime = Field(title="생성일", example="2024-01-01 00:00:00")
+    updated_dt: datetime = Field(title="수정일", example="2024-01-01 00:00:00")
+    rank: float = Field(title="검색 점수", example=0.6)
+    snippet: str = Field(
+        title="검색어가 강조된 본문 일부",
+        description="HTML 이스케이프된 본문에 <mark> 태그만 추가됩니다.",
+        example="<mark>게시글</mark> 내용 &lt;b&gt;",
+    )
+
+
+class ResponsePostSearchList(ResponseBaseModel):
+    data: list[ResponsePostSearchDto]
+    next_cursor: str | None = Field(title="다음 페이지 커서", default=None)
+    has_more: bool = Field(title="다음 데이터 존재 여부", default=False)
+
+
+class ResponsePostBatchItemDto(BaseModel):
+    index: int = Field(title="요청 목록에서의 위치", example=0)
+    status_code: int = Field(title="응답 코드", example=201)
+    code: str | None = Field(title="오류 코드", default=None, example=None)
+    message: str | None = Field(title="오류 메시지", default=None, example=None)
+    data: ResponsePostDto | None = Field(title="생성된 게시글", default=None)
+
+
+class ResponsePostBatch(ResponseBaseModel):
+    data: list[ResponsePostBatchItemDto]
+
+
+class ResponsePostBatchGetItemDto(BaseModel):
+    id: int = Field(title="게시글 ID", example=1)
+    status_code: int = Field(title="응답 코드", example=200)
+    code: str | None = Field(title="오류 코드", default=None, example=None)
+    message: str | None = Field(title="오류 메시지", default=None, example=None)
+    data: ResponsePostDto | None = Field(title="게시글", default=None)
+
+
+class ResponsePostBatchGet(ResponseBaseModel):
+    data: list[ResponsePostBatchGetItemDto]
@@ -1,5 +1,7 @@
+import asyncio
+import time
 from datetime import datetime, timedelta
-from typing import Annotated, Optional, Union
+from typing import Annotated, Callable, Optional, ParamSpec, TypeVar, Union
 
 from fastapi import Security
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
@@ -10,23 +12,39 @@ from redis import asyncio as aioredis
 
 import app.errors.exceptions as ex
 from app.config import settings
+from app.databases.blacklist import REDIS_COMMAND_DURATION, TokenBlacklist
+from app.utils.cache import TTLCache
+from app.utils.executor import BoundedExecutor
+from app.utils.metrics import register_cache
 
 oauth2_scheme = HTTPBearer()
 
+P = ParamSpec("P")
+R = TypeVar("R")
+
 
 class AuthService:
+    # token -> (user_id, exp), entries expire at the exp claim of the token
+    token_cache: TTLCache[str, tuple[int, int]] = TTLCache(
+        max_size=settings.TOKEN_CACHE_MAX_SIZE
+    )
+
     def __init__(
         self,
         secret_key: str,
         algorithms: str,
         access_token_expire_minutes: str,
         redis: aioredis.Redis,
+        token_blacklist: TokenBlacklist | None = None,
+        password_executor: BoundedExecutor | None = None,
     ) -> None:
         self.secret_key = secret_key
         self.algorithms = algorithms
         self.access_token_expire_minutes = int(access_token_expire_minutes)
         self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
         self.redis = redis
+        self.token_blacklist = token_blacklist
+        self.password_executor = password_executor
 
     @staticmethod
     def get_current_user(
@@ -34,21 +52,21 @@ class AuthService:
             Union[HTTPAuthorizationCredentials, str], Security(oauth2_scheme)
         ],
     ) -> tuple[int, str]:
+        if isinstance(credentials, str):
+            token = credentials
+        else:
+            token = credentials.credentials
+
+        cached = AuthService.token_cache.get(token)
+        if cached is not None:
+            return cached[0], token
+
         try:
-            if isinstance(credentials, str):
-                token = credentials
-                payload = jwt.decode(
-                    token=credentials,
-                    key=settings.SECRET_KEY,
-                    algorithms=[settings.ALGORITHM],
-                )
-            else:
-                token = credentials.credentials
-                payload = jwt.decode(
-                    token=credentials.credentials,
-                    key=settings.SECRET_KEY,
-                    algorithms=[settings.ALGORITHM],
-                )
+            payload = jwt.decode(
+                token=token,
+                key=settings.SECRET_KEY,
+                algorithms=[settings.ALGORITHM],
+            )
             user_id = payload.get("sub")
             if user_id is None:
                 raise ex.InvalidTokenError()
@@ -56,10 +74,26 @@ class AuthService:
             raise ex.ExpiredSignatureError() from ExpiredSignatureError
         except JWTError:
             raise ex.InvalidTokenError() from JWTError
+
+        exp = payload.get("exp")
+        if isinstance(exp, int):
+            AuthService.token_cache.set(token, (int(user_id), exp), expires_at=exp)
         return int(user_id), token
 
     async def check_blacklist(self, token: str) -> None:
-        if await self.redis.get(token):
+        if self.token_blacklist is not None and self.token_blacklist.synced:
+            if self.token_blacklist.contains(token):
+                raise ex.InvalidTokenError()
+            return
+
+        start = time.perf_counter()
+        try:
+            blacklisted = await self.redis.get(token)
+        finally:
+            REDIS_COMMAND_DURATION.observe(
+                time.perf_counter() - start, "check_blacklist"
+            )
+        if blacklisted:
             raise ex.InvalidTokenError()
 
     def create_access_token(
@@ -76,8 +110,33 @@ class AuthService:
         )
         return encoded_jwt
 
+    def load_password_backend(self) -> None:
+        # passlib picks and self tests the bcrypt backend on first use
+        self.pwd_context.handler().get_backend()
+
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         return self.pwd_context.verify(plain_password, hashed_password)
 
     def get_password_hash(self, password: str) -> str:
         return self.pwd_context.hash(password)
+
+    async def verify_password_async(
+        self, plain_password: str, hashed_password: str
+    ) -> bool:
+        return await self._run_password_task(
+            self.verify_password, plain_password, hashed_password
+        )
+
+    async def get_password_hash_async(self, password: str) -> str:
+        return await self._run_password_task(self.get_password_hash, password)
+
+    async def _run_password_task(
+        self, func: Callable[P, R], *args: P.args, **kwargs: P.kwargs
+    ) -> R:
+        # bcrypt releases the GIL, so a thread keeps the event loop responsive
+        if self.password_executor is None:
+            return await asyncio.to_thread(func, *args, **kwargs)
+        return await self.password_executor.run(func, *args, **kwargs)
+
+
+register_cache("token", AuthService.token_cache)
@@ -6,8 +6,10 @@ from app.schemas.board import (
     BoardUpdate,
     RequestBoardCreateDto,
     RequestBoardUpdateDto,
+    ResponseBoardBatchGetItemDto,
     ResponseBoardDto,
 )
+from app.utils.pagination import Page, PageOrder, resolve_cursor
 
 
 class BoardService:
@@ -24,16 +26,52 @@ class BoardService:
             raise ex.AlreadyExistsBoardError()
 
     async def get_board(self, board_id: int, user_id: int) -> ResponseBoardDto:
-        board = await self._repository.get_board(board_id, user_id)
-        if not board:
+        board = await self._repository.get_board_by_board_id(board_id)
+        if not board or not (board.public or board.user_id == user_id):
             raise ex.BoardNotFoundError()
-        return ResponseBoardDto(**board.__dict__)
+        return ResponseBoardDto.from_row(board)
+
+    async def get_boards(
+        self, board_ids: list[int], user_id: int
+    ) -> list[ResponseBoardBatchGetItemDto]:
+        boards = await self._repository.get_boards(
+            list(dict.fromkeys(board_ids)), user_id
+        )
+        found = {board.id: ResponseBoardDto.from_row(board) for board in boards}
+        not_found = ex.BoardNotFoundError()
+        return [
+            ResponseBoardBatchGetItemDto(
+                id=board_id, status_code=200, data=found[board_id]
+            )
+            if board_id in found
+            else ResponseBoardBatchGetItemDto(
+                id=board_id,
+                status_code=not_found.status_code,
+                code=not_found.code,
+                message=not_found.message,
+            )
+            for board_id in board_ids
+        ]
+
+    async def is_public_board(self, board_id: int) -> bool:
+        board = await self._repository.get_board_by_board_id(board_id)
+        return board is not None and board.public
 
     async def list_boards(
-        self, user_id: int, cursor_id: int, limit: int
-    ) -> list[ResponseBoardDto]:
-        board_list = await self._repository.list_boards(user_id, cursor_id, limit)
-        return [ResponseBoardDto(**board.__dict__) for board in board_list]
+        self,
+        user_id: int,
+        cursor_id: int,
+        limit: int,
+        cursor: str | None = None,
+        order: PageOrder = PageOrder.ID,
+    ) -> Page[ResponseBoardDto]:
+        page_cursor = resolve_cursor(cursor, cursor_id)
+        if page_cursor:
+            order = page_cursor.order
+        board_page = await self._repository.list_boards(
+            user_id, limit, order, page_cursor
+        )
+        return board_page.map(ResponseBoardDto.from_row)
 
     async def check_board_authorized(self, board_id: int, user_id: int) -> None:
         board = await self._repository.get_board_by_board_id(board_id)
@@ -45,12 +83,12 @@ class BoardService:
     async def update_board(
         self, board_id: int, user_id: int, board_update_dto: RequestBoardUpdateDto
     ) -> None:
-        await self.check_board_authorized(board_id, user_id)
         board_update = BoardUpdate(
             id=board_id, user_id=user_id, **board_update_dto.dict()
         )
-        await self._repository.update(board_update)
+        if await self._repository.update(board_update) is None:
+            await self.check_board_authorized(board_id, user_id)
 
     async def delete_board(self, board_id: int, user_id: int) -> None:
-        await self.check_board_authorized(board_id, user_id)
-        await self._repository.delete(board_id)
+        if await self._repository.delete(board_id, user_id) is None:
+            await self.check_board_authorized(board_id, user_id)
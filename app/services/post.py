@@ -1,14 +1,22 @@
+from contextlib import aclosing
+from typing import AsyncGenerator, Sequence
+
 import app.errors.exceptions as ex
 from app.models.post import Post
-from app.repositories.post import PostRepository
+from app.repositories.post import POST_FIELDS, PostRepository
 from app.schemas.post import (
     PostCreate,
     PostUpdate,
     RequestPostCreateDto,
     RequestPostUpdateDto,
+    ResponsePostBatchGetItemDto,
+    ResponsePostBatchItemDto,
     ResponsePostDto,
+    ResponsePostListDto,
+    ResponsePostSearchDto,
 )
 from app.services.board import BoardService
+from app.utils.pagination import Page, PageOrder, RankCursor, resolve_cursor
 
 
 class PostService:
@@ -16,9 +24,11 @@ class PostService:
         self,
         post_repository: PostRepository,
         board_service: BoardService,
+        export_fetch_size: int = 500,
     ):
         self._repository = post_repository
         self.board_service = board_service
+        self.export_fetch_size = export_fetch_size
 
     async def create_post(
         self, user_id: int, post_create_dto: RequestPostCreateDto
@@ -29,6 +39,50 @@ class PostService:
         post_create = PostCreate(user_id=user_id, **post_create_dto.dict())
         return await self._repository.add(post_create)
 
+    async def create_posts(
+        self, user_id: int, post_create_dtos: list[RequestPostCreateDto]
+    ) -> list[ResponsePostBatchItemDto]:
+        board_errors: dict[int, ex.APIException] = {}
+        for board_id in dict.fromkeys(dto.board_id for dto in post_create_dtos):
+            try:
+                await self.board_service.check_board_authorized(board_id, user_id)
+            except ex.APIException as e:
+                board_errors[board_id] = e
+
+        creatable = [
+            (index, PostCreate(user_id=user_id, **dto.dict()))
+            for index, dto in enumerate(post_create_dtos)
+            if dto.board_id not in board_errors
+        ]
+        posts = (
+            await self._repository.add_all([post for _, post in creatable])
+            if creatable
+            else []
+        )
+        created = {index: post for (index, _), post in zip(creatable, posts)}
+
+        results = []
+        for index, dto in enumerate(post_create_dtos):
+            if index in created:
+                results.append(
+                    ResponsePostBatchItemDto(
+                        index=index,
+                        status_code=201,
+                        data=ResponsePostDto.from_row(created[index]),
+                    )
+                )
+                continue
+            error = board_errors[dto.board_id]
+            results.append(
+                ResponsePostBatchItemDto(
+                    index=index,
+                    status_code=error.status_code,
+                    code=error.code,
+                    message=error.message,
+                )
+            )
+        return results
+
     async def check_post_authorized(self, post_id: int, user_id: int) -> None:
         post = await self._repository.get_post_by_post_id(post_id)
         if post and post.user_id != user_id:
@@ -39,23 +93,98 @@ class PostService:
     async def update_post(
         self, post_id: int, user_id: int, post_update_dto: RequestPostUpdateDto
     ) -> None:
-        await self.check_post_authorized(post_id, user_id)
         post_update = PostUpdate(id=post_id, user_id=user_id, **post_update_dto.dict())
-        await self._repository.update(post_update)
+        if await self._repository.update(post_update) is None:
+            await self.check_post_authorized(post_id, user_id)
 
     async def delete_post(self, post_id: int, user_id: int) -> None:
-        await self.check_post_authorized(post_id, user_id)
-        await self._repository.delete(post_id, user_id)
+        if await self._repository.delete(post_id, user_id) is None:
+            await self.check_post_authorized(post_id, user_id)
 
     async def get_post(self, post_id: int, user_id: int) -> ResponsePostDto:
-        post = await self._repository.get_post(post_id, user_id)
-        if not post:
+        post = await self._repository.get_post_by_post_id(post_id)
+        if not post or not (
+            post.user_id == user_id
+            or await self.board_service.is_public_board(post.board_id)
+        ):
             raise ex.PostNotFoundError()
-        return ResponsePostDto(**post.__dict__)
+        return ResponsePostDto.from_row(post)
+
+    async def get_posts(
+        self, post_ids: list[int], user_id: int
+    ) -> list[ResponsePostBatchGetItemDto]:
+        posts = await self._repository.get_posts(list(dict.fromkeys(post_ids)), user_id)
+        found = {post.id: ResponsePostDto.from_row(post) for post in posts}
+        not_found = ex.PostNotFoundError()
+        return [
+            ResponsePostBatchGetItemDto(
+                id=post_id, status_code=200, data=found[post_id]
+            )
+            if post_id in found
+            else ResponsePostBatchGetItemDto(
+                id=post_id,
+                status_code=not_found.status_code,
+                code=not_found.code,
+                message=not_found.message,
+            )
+            for post_id in post_ids
+        ]
 
     async def list_posts(
-        self, board_id: int, user_id: int, cursor_id: int, limit: int
-    ) -> list[ResponsePostDto]:
+        self,
+        board_id: int,
+        user_id: int,
+        cursor_id: int,
+        limit: int,
+        cursor: str | None = None,
+        order: PageOrder = PageOrder.ID,
+        fields: str | None = None,
+        excerpt: int | None = None,
+    ) -> Page[ResponsePostListDto]:
+        page_cursor = resolve_cursor(cursor, cursor_id)
+        if page_cursor:
+            order = page_cursor.order
+        selected = POST_FIELDS
+        if fields:
+            selected = tuple(
+                dict.fromkeys(["id", *(name.strip() for name in fields.split(","))])
+            )
+            if not set(selected) <= set(POST_FIELDS):
+                raise ex.InvalidFieldError()
         await self.board_service.check_board_authorized(board_id, user_id)
-        post_list = await self._repository.list_posts(board_id, user_id, cursor_id, limit)
-        return [ResponsePostDto(**post.__dict__) for post in post_list]
+        post_page = await self._repository.list_posts(
+            board_id, user_id, limit, order, page_cursor, selected, excerpt
+        )
+        # fields left unset are dropped from the response
+        return post_page.map(
+            lambda row: ResponsePostListDto.construct(
+                **{name: row._mapping[name] for name in selected}
+            )
+        )
+
+    async def export_posts(
+        self, board_id: int, user_id: int
+    ) -> AsyncGenerator[list[ResponsePostDto], None]:
+        # checked up front, the response has started once the stream is read
+        await self.board_service.get_board(board_id, user_id)
+        # created inside the unit of work so the stream reads from the same database
+        partitions = self._repository.stream_posts(
+            board_id, user_id, self.export_fetch_size
+        )
+        return self._export_posts(partitions)
+
+    async def _export_posts(
+        self, partitions: AsyncGenerator[Sequence[Post], None]
+    ) -> AsyncGenerator[list[ResponsePostDto], None]:
+        async with aclosing(partitions):
+            async for posts in partitions:
+                yield [ResponsePostDto.from_row(post) for post in posts]
+
+    async def search_posts(
+        self, user_id: int, query: str, limit: int, cursor: str | None = None
+    ) -> Page[ResponsePostSearchDto]:
+        rank_cursor = RankCursor.decode(cursor) if cursor else None
+        post_page = await self._repository.search_posts(
+            user_id, query, limit, rank_cursor
+        )
+        return post_page.map(ResponsePostSearchDto.from_row)
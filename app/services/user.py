@@ -1,7 +1,5 @@
 from datetime import datetime, timedelta
 
-from passlib.context import CryptContext
-
 import app.errors.exceptions as ex
 from app.models.user import User
 from app.repositories.user import UserRepository
@@ -17,10 +15,11 @@ class UserService:
     ) -> None:
         self.auth_service: AuthService = auth_service
         self._repository: UserRepository = user_repository
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
     async def register(self, user_dto: RequestUserRegisterDto) -> User:
-        user_dto.password = self.auth_service.get_password_hash(user_dto.password)
+        user_dto.password = await self.auth_service.get_password_hash_async(
+            user_dto.password
+        )
         return await self._repository.add(user_dto)
 
     async def check_register_user(self, email: str) -> None:
@@ -47,7 +46,7 @@ class UserService:
 
     async def authenticate_user(self, email: str, password: str) -> User:
         user = await self.get_user(email)
-        if not self.auth_service.verify_password(password, user.password):
+        if not await self.auth_service.verify_password_async(password, user.password):
             raise ex.IncorrectUserError()
 
         return user
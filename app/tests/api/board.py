@@ -0,0 +1,70 @@
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+
+from app.utils.pagination import PageOrder
+
+
+async def _login(client: AsyncClient, email: str) -> dict[str, str]:
+    user = {"fullname": "test", "email": email, "password": "password"}
+    await client.post("/api/v1/user/register", json=user)
+    response = await client.post(
+        "/api/v1/auth/login", json={"email": email, "password": "password"}
+    )
+    return {"Authorization": f"Bearer {response.json()['data']['access_token']}"}
+
+
+async def _list_page(
+    client: AsyncClient, headers: dict[str, str], order: PageOrder, cursor: str | None
+) -> dict[str, Any]:
+    params = {"limit": 2, "order": order.value}
+    if cursor is not None:
+        params["cursor"] = cursor
+    response = await client.get("/api/v1/boards", params=params, headers=headers)
+    assert response.status_code == 200
+    page: dict[str, Any] = response.json()
+    return page
+
+
+@pytest.mark.asyncio
+# sqlite stores now() to the second, created_dt cursors only work on postgres
+@pytest.mark.parametrize("order", [PageOrder.ID, PageOrder.ID_DESC])
+async def test_list_boards_pages(api_client: AsyncClient, order: PageOrder) -> None:
+    owner = await _login(api_client, "owner@test.com")
+    other = await _login(api_client, "other@test.com")
+    # own boards, public or not, and only the public boards of others
+    for headers, name, public in (
+        (owner, "own-private", False),
+        (other, "other-public-1", True),
+        (owner, "own-public", True),
+        (other, "other-private", False),
+        (owner, "own-private-2", False),
+        (other, "other-public-2", True),
+    ):
+        await api_client.post(
+            "/api/v1/board", json={"name": name, "public": public}, headers=headers
+        )
+    expected = [
+        "own-private",
+        "other-public-1",
+        "own-public",
+        "own-private-2",
+        "other-public-2",
+    ]
+    if order.descending:
+        expected.reverse()
+
+    pages = [await _list_page(api_client, owner, order, None)]
+    while pages[-1]["next_cursor"] is not None:
+        pages.append(
+            await _list_page(api_client, owner, order, pages[-1]["next_cursor"])
+        )
+    names = [board["name"] for page in pages for board in page["data"]]
+    assert names == expected
+
+    # walking back from the last page returns the same pages
+    page = pages[-1]
+    for previous in reversed(pages[:-1]):
+        page = await _list_page(api_client, owner, order, page["prev_cursor"])
+        assert page["data"] == previous["data"]
@@ -0,0 +1,106 @@
+from contextlib import AbstractContextManager
+from typing import Callable
+
+import pytest
+from httpx import AsyncClient
+
+from app.databases.profiler import QueryStats
+
+AssertMaxQueries = Callable[[int], AbstractContextManager[QueryStats]]
+
+
+async def login(client: AsyncClient) -> dict[str, str]:
+    user = {"fullname": "test", "email": "queries@test.com", "password": "password"}
+    await client.post("/api/v1/user/register", json=user)
+    response = await client.post(
+        "/api/v1/auth/login", json={"email": user["email"], "password": "password"}
+    )
+    return {"Authorization": f"Bearer {response.json()['data']['access_token']}"}
+
+
+@pytest.mark.asyncio
+async def test_user_query_budget(
+    api_client: AsyncClient, assert_max_queries: AssertMaxQueries
+) -> None:
+    user = {"fullname": "test", "email": "budget@test.com", "password": "password"}
+
+    with assert_max_queries(3):
+        response = await api_client.post("/api/v1/user/register", json=user)
+    assert response.status_code == 201
+
+    with assert_max_queries(1):
+        response = await api_client.post(
+            "/api/v1/auth/login", json={"email": user["email"], "password": "password"}
+        )
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_board_query_budget(
+    api_client: AsyncClient, assert_max_queries: AssertMaxQueries
+) -> None:
+    headers = await login(api_client)
+
+    with assert_max_queries(2):
+        response = await api_client.post(
+            "/api/v1/board", json={"name": "board", "public": True}, headers=headers
+        )
+    assert response.status_code == 201
+    # every test starts from an empty database
+    board_id = 1
+
+    # the cache miss loads the board for this request
+    with assert_max_queries(1) as stats:
+        response = await api_client.get(f"/api/v1/board/{board_id}", headers=headers)
+    assert response.status_code == 200
+    assert stats.count == 1
+
+    with assert_max_queries(0):
+        response = await api_client.get(f"/api/v1/board/{board_id}", headers=headers)
+    assert response.status_code == 200
+
+    with assert_max_queries(1):
+        response = await api_client.get(
+            "/api/v1/boards", params={"limit": 10}, headers=headers
+        )
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_post_query_budget(
+    api_client: AsyncClient, assert_max_queries: AssertMaxQueries
+) -> None:
+    headers = await login(api_client)
+    await api_client.post(
+        "/api/v1/board", json={"name": "board", "public": True}, headers=headers
+    )
+    board_id = 1
+
+    with assert_max_queries(2):
+        response = await api_client.post(
+            "/api/v1/post",
+            json={"board_id": board_id, "title": "title", "content": "content"},
+            headers=headers,
+        )
+    assert response.status_code == 201
+    post_id = 1
+
+    # the cache miss loads the post for this request
+    with assert_max_queries(1) as stats:
+        response = await api_client.get(f"/api/v1/post/{post_id}", headers=headers)
+    assert response.status_code == 200
+    assert stats.count == 1
+
+    with assert_max_queries(0):
+        response = await api_client.get(f"/api/v1/post/{post_id}", headers=headers)
+    assert response.status_code == 200
+
+    with assert_max_queries(2):
+        response = await api_client.get(
+            f"/api/v1/posts/{board_id}", params={"limit": 10}, headers=headers
+        )
+    assert response.status_code == 200
+
+    with assert_max_queries(2):
+        response = await api_client.delete(f"/api/v1/post/{post_id}", headers=headers)
+    assert response.status_code == 200
@@ -0,0 +1,161 @@
+import asyncio
+import json
+from datetime import datetime
+from typing import AsyncGenerator
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from httpx import ASGITransport, AsyncClient
+from pydantic import BaseModel
+from starlette.types import Message
+
+from app.api.routing import ClosingStreamingResponse, FastJSONRoute, ndjson_lines
+from app.config import settings
+from app.models.post import Post
+from app.schemas.base import ResponseBase
+from app.schemas.post import (
+    ResponsePost,
+    ResponsePostDto,
+    ResponsePostList,
+    ResponsePostListDto,
+)
+
+POST = Post(
+    id=1,
+    title="title",
+    content="content",
+    user_id=1,
+    board_id=1,
+    created_dt=datetime(2024, 1, 1, 12, 30, 15, 123456),
+    updated_dt=datetime(2024, 1, 1),
+)
+
+
+class ResponseBaseWithSecret(ResponseBase):
+    secret: str
+
+
+def create_app() -> FastAPI:
+    router = APIRouter(route_class=FastJSONRoute)
+
+    @router.get("/post", response_model=ResponsePost)
+    async def get_post() -> ResponsePost:
+        return ResponsePost(code=200, message="ok", data=ResponsePostDto.from_row(POST))
+
+    @router.get(
+        "/post-unset", response_model=ResponseBase, response_model_exclude_unset=True
+    )
+    async def get_post_unset() -> ResponseBase:
+        return ResponseBase(code=200, message="ok")
+
+    @router.get(
+        "/posts-projected",
+        response_model=ResponsePostList,
+        response_model_exclude_unset=True,
+    )
+    async def list_posts_projected() -> ResponsePostList:
+        return ResponsePostList(
+            code=200,
+            message="ok",
+            data=[ResponsePostListDto.construct(id=1, title="title")],
+            next_cursor=None,
+            prev_cursor=None,
+            has_more=False,
+        )
+
+    @router.get("/subclass", response_model=ResponseBase, status_code=201)
+    async def get_subclass() -> ResponseBase:
+        return ResponseBaseWithSecret(code=201, message="ok", secret="secret")
+
+    application = FastAPI()
+    application.include_router(router)
+    return application
+
+
+async def get_responses(path: str) -> tuple[dict[str, object], dict[str, object]]:
+    bodies = []
+    for fast in (False, True):
+        settings.FAST_JSON_RESPONSE = fast
+        try:
+            transport = ASGITransport(app=create_app())
+            async with AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                response = await client.get(path)
+        finally:
+            settings.FAST_JSON_RESPONSE = False
+        bodies.append(response.json())
+    return bodies[0], bodies[1]
+
+
+def test_from_row() -> None:
+    post_dto = ResponsePostDto.from_row(POST)
+
+    assert post_dto == ResponsePostDto(**POST.__dict__)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "path", ["/post", "/post-unset", "/posts-projected", "/subclass"]
+)
+async def test_fast_json_route_matches_default(path: str) -> None:
+    default_body, fast_body = await get_responses(path)
+
+    assert fast_body == default_body
+
+
+@pytest.mark.parametrize("fast", [False, True])
+def test_fast_json_route_opt_in(fast: bool) -> None:
+    settings.FAST_JSON_RESPONSE = fast
+    try:
+        route = next(
+            route for route in create_app().routes if getattr(route, "path") == "/post"
+        )
+    finally:
+        settings.FAST_JSON_RESPONSE = False
+
+    assert isinstance(route, FastJSONRoute)
+    assert (route.dependant.call is not route.endpoint) == fast
+
+
+@pytest.mark.asyncio
+async def test_closing_streaming_response_closes_body_on_disconnect() -> None:
+    closed = False
+    sent = asyncio.Event()
+
+    async def body() -> AsyncGenerator[bytes, None]:
+        nonlocal closed
+        try:
+            while True:
+                yield b"line\n"
+        finally:
+            closed = True
+
+    async def receive() -> Message:
+        await sent.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        if message["type"] == "http.response.body":
+            sent.set()
+            # a slow client, the body is suspended while the send is pending
+            await asyncio.Event().wait()
+
+    response = ClosingStreamingResponse(body(), media_type="application/x-ndjson")
+    await response({"type": "http", "asgi": {"spec_version": "2.4"}}, receive, send)
+
+    assert closed
+
+
+@pytest.mark.asyncio
+async def test_ndjson_lines() -> None:
+    async def batches() -> AsyncGenerator[list[BaseModel], None]:
+        yield [ResponsePostDto.from_row(POST)]
+        yield [ResponseBase(code=200, message="ok")]
+
+    lines = b"".join([chunk async for chunk in ndjson_lines(batches())])
+
+    assert [json.loads(line) for line in lines.splitlines()] == [
+        json.loads(ResponsePostDto.from_row(POST).json()),
+        {"code": 200, "message": "ok", "data": {}},
+    ]
@@ -24,7 +24,8 @@ pytest_plugins = [
 
 @pytest.fixture(scope="session")
 def test_app() -> FastAPI:
-    container = Container()
+    # the application's container is the one wired into the routes
+    container: Container = app.container  # type: ignore
 
     container.db.override(
         providers.Singleton(
@@ -33,6 +34,5 @@ def test_app() -> FastAPI:
             echo=False,
         )
     )
-
-    app.container = container  # type: ignore
+    container.reset_singletons()
     return app
@@ -0,0 +1,19 @@
+import pytest
+
+from app.application import app
+from app.containers import Container
+from app.databases.rdb import RDBDatabase
+
+
+@pytest.mark.asyncio
+async def test_services_are_singletons(sqlite_db: RDBDatabase) -> None:
+    container: Container = app.container  # type: ignore
+
+    post_service = await container.post_service.async_()
+    user_service = await container.user_service.async_()
+
+    assert await container.post_service.async_() is post_service
+    assert post_service.board_service is await container.board_service.async_()
+    assert user_service.auth_service is await container.auth_service.async_()
+    # bound to the database the test overrode, not one resolved earlier
+    assert post_service._repository.session_factory == sqlite_db.session
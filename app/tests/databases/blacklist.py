@@ -0,0 +1,61 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+from fakeredis import aioredis as fakeredis
+
+from app.databases.blacklist import BLACKLIST_CHANNEL, TokenBlacklist
+
+
+def test_contains() -> None:
+    token_blacklist = TokenBlacklist(redis=AsyncMock())
+    token_blacklist.add("token", time.time() + 60)
+    token_blacklist.add("expired_token", time.time() - 1)
+
+    assert token_blacklist.contains("token")
+    assert not token_blacklist.contains("expired_token")
+    assert not token_blacklist.contains("other_token")
+
+
+@pytest.mark.asyncio
+async def test_resync() -> None:
+    expires_at = time.time() + 60
+    redis_mock = AsyncMock()
+    redis_mock.zrangebyscore.return_value = [("token", expires_at)]
+    token_blacklist = TokenBlacklist(redis=redis_mock)
+    token_blacklist.add("removed_token", expires_at)
+
+    await token_blacklist._resync()
+
+    assert token_blacklist.contains("token")
+    assert not token_blacklist.contains("removed_token")
+    redis_mock.zremrangebyscore.assert_awaited_once()
+
+
+def test_add_prunes_expired_tokens() -> None:
+    token_blacklist = TokenBlacklist(redis=AsyncMock(), prune_interval=60)
+    token_blacklist.add("token", time.time() + 60)
+    # not pruned again until the interval has passed
+    token_blacklist.add("expired_token", time.time() - 1)
+    assert len(token_blacklist._tokens) == 2
+
+    token_blacklist._next_prune = 0
+    token_blacklist.add("other_token", time.time() + 60)
+    assert set(token_blacklist._tokens) == {"token", "other_token"}
+
+
+@pytest.mark.asyncio
+async def test_listen_skips_malformed_messages() -> None:
+    redis = fakeredis.FakeRedis(decode_responses=True)
+    token_blacklist = TokenBlacklist(redis=redis)
+    await token_blacklist.start()
+    await asyncio.sleep(0.01)
+
+    await redis.publish(BLACKLIST_CHANNEL, "garbage")
+    await redis.publish(BLACKLIST_CHANNEL, f"{time.time() + 60} token")
+    await asyncio.sleep(0.01)
+
+    assert token_blacklist.synced
+    assert token_blacklist.contains("token")
+    await token_blacklist.stop()
@@ -0,0 +1,195 @@
+import asyncio
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+from fakeredis import aioredis as fakeredis
+
+from app.databases.cache import CACHE_INVALIDATION_CHANNEL, ReadThroughCache
+from app.databases.rdb import RDBDatabase
+from app.schemas.board import ResponseBoardDto
+
+
+@pytest.fixture
+def test_cache() -> ReadThroughCache[ResponseBoardDto]:
+    return ReadThroughCache(
+        redis=fakeredis.FakeRedis(decode_responses=True),
+        namespace="board",
+        model=ResponseBoardDto,
+        max_size=10,
+        ttl=60,
+        redis_ttl=60,
+    )
+
+
+def board_dto(board_id: int = 1, public: bool = True) -> ResponseBoardDto:
+    return ResponseBoardDto(
+        id=board_id,
+        name=f"name{board_id}",
+        public=public,
+        user_id=1,
+        created_dt=datetime(2024, 1, 1),
+        updated_dt=datetime(2024, 1, 1),
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_single_flight(
+    test_cache: ReadThroughCache[ResponseBoardDto],
+) -> None:
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def _load() -> ResponseBoardDto:
+        started.set()
+        await release.wait()
+        return board_dto()
+
+    load = AsyncMock(side_effect=_load)
+    readers = [asyncio.create_task(test_cache.get(1, load)) for _ in range(10)]
+    await started.wait()
+    release.set()
+    results = await asyncio.gather(*readers)
+
+    assert all(result == board_dto() for result in results)
+    load.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_from_redis(
+    test_cache: ReadThroughCache[ResponseBoardDto],
+) -> None:
+    await test_cache.get(1, AsyncMock(return_value=board_dto()))
+
+    load = AsyncMock()
+    result = await test_cache.get(1, load)
+
+    assert result == board_dto()
+    load.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_invalidate(
+    test_cache: ReadThroughCache[ResponseBoardDto],
+) -> None:
+    await test_cache.start()
+    await asyncio.sleep(0.01)
+    assert test_cache.synced
+
+    await test_cache.get(1, AsyncMock(return_value=board_dto()))
+    await test_cache.invalidate(1)
+    result = await test_cache.get(1, AsyncMock(return_value=board_dto(public=False)))
+    await test_cache.stop()
+
+    assert result == board_dto(public=False)
+
+
+@pytest.mark.asyncio
+async def test_invalidate_from_other_process(
+    test_cache: ReadThroughCache[ResponseBoardDto],
+) -> None:
+    other_cache = ReadThroughCache(
+        redis=test_cache.redis,
+        namespace="board",
+        model=ResponseBoardDto,
+        max_size=10,
+        ttl=60,
+        redis_ttl=60,
+    )
+    await test_cache.start()
+    await asyncio.sleep(0.01)
+
+    await test_cache.get(1, AsyncMock(return_value=board_dto()))
+    await other_cache.invalidate(1)
+    await asyncio.sleep(0.01)
+    result = await test_cache.get(1, AsyncMock(return_value=board_dto(public=False)))
+    await test_cache.stop()
+
+    assert result == board_dto(public=False)
+
+
+@pytest.mark.asyncio
+async def test_listen_skips_malformed_messages(
+    test_cache: ReadThroughCache[ResponseBoardDto],
+) -> None:
+    await test_cache.start()
+    await asyncio.sleep(0.01)
+
+    await test_cache.get(1, AsyncMock(return_value=board_dto()))
+    # only the local copy is left, as if another process invalidated it
+    await test_cache.redis.delete(test_cache.redis_key(1))
+    await test_cache.redis.publish(CACHE_INVALIDATION_CHANNEL, "cache:board:garbage")
+    await test_cache.redis.publish(CACHE_INVALIDATION_CHANNEL, test_cache.redis_key(1))
+    await asyncio.sleep(0.01)
+    assert test_cache.synced
+    result = await test_cache.get(1, AsyncMock(return_value=board_dto(public=False)))
+    await test_cache.stop()
+
+    assert result == board_dto(public=False)
+
+
+@pytest.mark.asyncio
+async def test_invalidate_during_load(
+    test_cache: ReadThroughCache[ResponseBoardDto],
+) -> None:
+    other_cache = ReadThroughCache(
+        redis=test_cache.redis,
+        namespace="board",
+        model=ResponseBoardDto,
+        max_size=10,
+        ttl=60,
+        redis_ttl=60,
+    )
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def _slow_load() -> ResponseBoardDto:
+        # read before the board was made private
+        started.set()
+        await release.wait()
+        return board_dto()
+
+    for cache in (test_cache, other_cache):
+        reader = asyncio.create_task(test_cache.get(1, _slow_load))
+        await started.wait()
+        await cache.invalidate(1)
+        release.set()
+        assert await reader == board_dto()
+        started.clear()
+        release.clear()
+
+        # the stale row was not written back for other processes
+        assert await test_cache.redis.get(test_cache.redis_key(1)) is None
+        result = await test_cache.get(
+            1, AsyncMock(return_value=board_dto(public=False))
+        )
+        assert result == board_dto(public=False)
+        await test_cache.redis.delete(test_cache.redis_key(1))
+
+
+request_id: ContextVar[str | None] = ContextVar("request_id", default=None)
+
+
+@pytest.mark.asyncio
+async def test_load_outside_unit_of_work(
+    test_cache: ReadThroughCache[ResponseBoardDto], tmp_path: Path
+) -> None:
+    db = RDBDatabase(db_url=f"sqlite+aiosqlite:///{tmp_path / 'test.db'}", echo=False)
+    seen: dict[str, object] = {}
+
+    async def _load() -> ResponseBoardDto:
+        seen["request_id"] = request_id.get()
+        async with db.session() as session:
+            seen["session"] = session
+        return board_dto()
+
+    request_id.set("request-1")
+    async with db.unit_of_work() as uow_session:
+        await test_cache.get(1, _load)
+    await db.disconnect()
+
+    # the rest of the caller's context is kept
+    assert seen["request_id"] == "request-1"
+    assert seen["session"] is not uow_session
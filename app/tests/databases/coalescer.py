@@ -0,0 +1,96 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+
+from app.databases.coalescer import WriteCoalescer
+from app.databases.profiler import profile_queries
+from app.databases.rdb import RDBDatabase
+
+
+def create_coalescer(
+    batches: list[list[int]], max_batch_size: int = 10, max_delay: float = 0.01
+) -> WriteCoalescer[int, int]:
+    async def flush(items: list[int]) -> list[int]:
+        batches.append(items)
+        if len(items) > 1 and any(item < 0 for item in items):
+            raise ValueError("batch rejected")
+        if items == [-1]:
+            raise ValueError("bad item")
+        return [item * 10 for item in items]
+
+    return WriteCoalescer(
+        flush=flush, enabled=True, max_batch_size=max_batch_size, max_delay=max_delay
+    )
+
+
+@pytest.mark.asyncio
+async def test_submit_coalesces_concurrent_writes() -> None:
+    batches: list[list[int]] = []
+    coalescer = create_coalescer(batches)
+
+    results = await asyncio.gather(*(coalescer.submit(item) for item in range(5)))
+
+    assert results == [0, 10, 20, 30, 40]
+    assert batches == [[0, 1, 2, 3, 4]]
+
+
+@pytest.mark.asyncio
+async def test_submit_flushes_full_batches() -> None:
+    batches: list[list[int]] = []
+    coalescer = create_coalescer(batches, max_batch_size=2, max_delay=60)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(coalescer.submit(item) for item in range(4))), timeout=1
+    )
+
+    assert results == [0, 10, 20, 30]
+    assert batches == [[0, 1], [2, 3]]
+
+
+@pytest.mark.asyncio
+async def test_submit_retries_failed_batch_per_item() -> None:
+    batches: list[list[int]] = []
+    coalescer = create_coalescer(batches)
+
+    results = await asyncio.gather(
+        *(coalescer.submit(item) for item in (1, -1, 2)), return_exceptions=True
+    )
+
+    assert results[0] == 10
+    assert isinstance(results[1], ValueError)
+    assert results[2] == 20
+    assert batches == [[1, -1, 2], [1], [-1], [2]]
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_pending_writes() -> None:
+    batches: list[list[int]] = []
+    coalescer = create_coalescer(batches, max_delay=60)
+
+    pending = asyncio.ensure_future(coalescer.submit(1))
+    await asyncio.sleep(0)
+    await coalescer.close()
+
+    assert await pending == 10
+    assert batches == [[1]]
+
+
+@pytest.mark.asyncio
+async def test_flush_queries_are_profiled(tmp_path: Path) -> None:
+    db = RDBDatabase(db_url=f"sqlite+aiosqlite:///{tmp_path / 'test.db'}", echo=False)
+
+    async def flush(items: list[int]) -> list[int]:
+        async with db.session() as session:
+            await session.execute(text("SELECT 1"))
+        return items
+
+    coalescer = WriteCoalescer(
+        flush=flush, enabled=True, max_batch_size=10, max_delay=0
+    )
+    with profile_queries() as stats:
+        assert await coalescer.submit(1) == 1
+    await db.disconnect()
+
+    assert stats.count == 1
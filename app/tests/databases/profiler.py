@@ -0,0 +1,58 @@
+import logging
+from contextlib import AbstractContextManager
+from pathlib import Path
+from typing import Callable
+
+import pytest
+from sqlalchemy import text
+
+from app.databases.profiler import QueryStats, profile_queries
+from app.databases.rdb import RDBDatabase
+
+
+@pytest.mark.asyncio
+async def test_profile_queries(tmp_path: Path) -> None:
+    db = RDBDatabase(db_url=f"sqlite+aiosqlite:///{tmp_path / 'test.db'}", echo=False)
+
+    with profile_queries() as outer:
+        async with db.session() as session:
+            await session.execute(text("SELECT 1"))
+            with profile_queries() as inner:
+                await session.execute(text("SELECT 2"))
+
+    assert outer.count == 2
+    assert inner.count == 1
+    assert outer.duration >= inner.duration > 0
+    await db.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_slow_query_log(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    db = RDBDatabase(
+        db_url=f"sqlite+aiosqlite:///{tmp_path / 'test.db'}",
+        echo=False,
+        slow_query_threshold=0,
+    )
+
+    with caplog.at_level(logging.WARNING, logger="app.databases.profiler"):
+        with profile_queries(lambda: "GET /api/v1/post/{id}"):
+            async with db.session() as session:
+                await session.execute(text("SELECT 1"))
+
+    assert "on GET /api/v1/post/{id}: SELECT 1" in caplog.text
+    await db.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_assert_max_queries(
+    tmp_path: Path,
+    assert_max_queries: Callable[[int], AbstractContextManager[QueryStats]],
+) -> None:
+    db = RDBDatabase(db_url=f"sqlite+aiosqlite:///{tmp_path / 'test.db'}", echo=False)
+
+    with pytest.raises(AssertionError, match="2 queries were executed"):
+        with assert_max_queries(1):
+            async with db.session() as session:
+                await session.execute(text("SELECT 1"))
+                await session.execute(text("SELECT 2"))
+    await db.disconnect()
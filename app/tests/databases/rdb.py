@@ -0,0 +1,71 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+import app.errors.exceptions as ex
+from app.databases.rdb import RDBDatabase
+
+
+@pytest.fixture
+def test_rdb() -> tuple[RDBDatabase, list[AsyncMock]]:
+    db = RDBDatabase(db_url="postgresql+asyncpg://test@localhost/test", echo=False)
+    sessions: list[AsyncMock] = []
+
+    def _session_factory() -> AsyncMock:
+        session = AsyncMock()
+        session.info = {}
+        sessions.append(session)
+        return session
+
+    db._session_factory = _session_factory  # type: ignore
+    return db, sessions
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_shares_session(
+    test_rdb: tuple[RDBDatabase, list[AsyncMock]],
+) -> None:
+    db, sessions = test_rdb
+
+    async with db.unit_of_work() as uow_session:
+        async with db.session() as first_session:
+            pass
+        async with db.session() as second_session:
+            pass
+
+    assert first_session is uow_session
+    assert second_session is uow_session
+    assert len(sessions) == 1
+    sessions[0].commit.assert_awaited_once()
+    sessions[0].close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_rollback(
+    test_rdb: tuple[RDBDatabase, list[AsyncMock]],
+) -> None:
+    db, sessions = test_rdb
+
+    with pytest.raises(ex.PostNotFoundError):
+        async with db.unit_of_work():
+            async with db.session():
+                raise ex.PostNotFoundError()
+
+    sessions[0].commit.assert_not_awaited()
+    sessions[0].rollback.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_session_without_unit_of_work(
+    test_rdb: tuple[RDBDatabase, list[AsyncMock]],
+) -> None:
+    db, sessions = test_rdb
+
+    async with db.session():
+        pass
+    async with db.session():
+        pass
+
+    assert len(sessions) == 2
+    sessions[0].commit.assert_awaited_once()
+    sessions[1].commit.assert_awaited_once()
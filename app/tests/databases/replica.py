@@ -0,0 +1,272 @@
+import asyncio
+import json
+from pathlib import Path
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from fakeredis import aioredis as fakeredis
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+import app.errors.exceptions as ex
+from app.application import app
+from app.databases.rdb import Base, RDBDatabase, has_written
+from app.databases.replica import RecentWriters, ReplicaRouter
+from app.models.board import Board
+from app.tests.fixtures.api import use_database
+
+
+async def _seed(engine: AsyncEngine, name: str) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine) as session:
+        session.add(Board(name=name, public=True, user_id=1))
+        await session.commit()
+
+
+@pytest_asyncio.fixture
+async def replicated_db(tmp_path: Path) -> AsyncGenerator[RDBDatabase, None]:
+    # the same board is named after the database it is read from
+    db = RDBDatabase(
+        db_url=f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}",
+        echo=False,
+        replica_urls=[f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}"],
+    )
+    await _seed(db._engine, "primary")
+    await _seed(_router(db).replicas[0].engine, "replica")
+    try:
+        yield db
+    finally:
+        await db.disconnect()
+
+
+def _router(db: RDBDatabase) -> ReplicaRouter:
+    assert db._router is not None
+    return db._router
+
+
+async def _read_from(db: RDBDatabase) -> str | None:
+    async with db.session() as session:
+        result = await session.execute(select(Board.name).where(Board.id == 1))
+        return result.scalar_one_or_none()
+
+
+async def _write(session: AsyncSession) -> None:
+    session.add(Board(name="written", public=True, user_id=1))
+    await session.flush()
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_replica(replicated_db: RDBDatabase) -> None:
+    assert await _read_from(replicated_db) == "replica"
+
+
+@pytest.mark.asyncio
+async def test_use_primary_option(replicated_db: RDBDatabase) -> None:
+    async with replicated_db.session() as session:
+        name = await session.scalar(
+            select(Board.name).where(Board.id == 1).execution_options(use_primary=True)
+        )
+
+    assert name == "primary"
+
+
+@pytest.mark.asyncio
+async def test_use_primary_read_is_not_a_write(replicated_db: RDBDatabase) -> None:
+    async with replicated_db.unit_of_work() as session:
+        name = await session.scalar(
+            select(Board.name).where(Board.id == 1).execution_options(use_primary=True)
+        )
+        assert name == "primary"
+        assert await _read_from(replicated_db) == "replica"
+    assert not has_written(session)
+
+
+@pytest.mark.asyncio
+async def test_reads_after_write_go_to_primary(replicated_db: RDBDatabase) -> None:
+    async with replicated_db.unit_of_work() as session:
+        assert await _read_from(replicated_db) == "replica"
+        await _write(session)
+        assert await _read_from(replicated_db) == "primary"
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_use_primary(replicated_db: RDBDatabase) -> None:
+    async with replicated_db.unit_of_work(use_primary=True) as session:
+        assert await _read_from(replicated_db) == "primary"
+    assert not has_written(session)
+
+    async with replicated_db.unit_of_work() as session:
+        await _write(session)
+    assert has_written(session)
+
+
+@pytest.mark.asyncio
+async def test_recent_writers() -> None:
+    redis = fakeredis.FakeRedis(decode_responses=True)
+    recent_writers = RecentWriters(redis, window=0.2)
+
+    await recent_writers.remember("Bearer writer")
+
+    assert await recent_writers.wrote_recently("Bearer writer")
+    assert not await recent_writers.wrote_recently("Bearer reader")
+    # the token itself is never stored
+    assert await redis.keys() == [recent_writers.redis_key("Bearer writer")]
+    assert "writer" not in recent_writers.redis_key("Bearer writer")
+
+    await asyncio.sleep(0.3)
+    assert not await recent_writers.wrote_recently("Bearer writer")
+
+
+@pytest.mark.asyncio
+async def test_recent_writers_local() -> None:
+    redis = fakeredis.FakeRedis(decode_responses=True)
+    worker = RecentWriters(redis, window=60)
+    other_worker = RecentWriters(redis, window=60)
+
+    await worker.remember("Bearer writer")
+    await redis.flushall()
+
+    # this worker saw the write and no longer asks Redis
+    assert await worker.wrote_recently("Bearer writer")
+    assert not await other_worker.wrote_recently("Bearer writer")
+
+    await worker.remember("Bearer other")
+    assert await other_worker.wrote_recently("Bearer other")
+    await redis.flushall()
+    assert await other_worker.wrote_recently("Bearer other")
+
+
+@pytest.mark.asyncio
+async def test_failover_to_primary(replicated_db: RDBDatabase) -> None:
+    replica = _router(replicated_db).replicas[0]
+    replica.healthy = False
+    assert await _read_from(replicated_db) == "primary"
+
+    await _router(replicated_db).check()
+
+    assert replica.healthy
+    assert await _read_from(replicated_db) == "replica"
+
+
+@pytest.mark.asyncio
+async def test_health_check_marks_replica_down(tmp_path: Path) -> None:
+    db = RDBDatabase(
+        db_url=f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}",
+        echo=False,
+        replica_urls=[f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'replica.db'}"],
+    )
+    await _seed(db._engine, "primary")
+    try:
+        await _router(db).check()
+
+        assert not _router(db).replicas[0].healthy
+        assert await _read_from(db) == "primary"
+    finally:
+        await db.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_register_then_login(replicated_db: RDBDatabase) -> None:
+    # the replica never receives the new user, as if it lagged behind forever
+    user = {"fullname": "test", "email": "replica@test.com", "password": "password"}
+    transport = ASGITransport(app=app)
+    with use_database(replicated_db):
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post("/api/v1/user/register", json=user)
+            assert response.status_code == 201
+
+            response = await client.post(
+                "/api/v1/auth/login",
+                json={"email": user["email"], "password": user["password"]},
+            )
+            assert response.status_code == 200
+
+            response = await client.post("/api/v1/user/register", json=user)
+            assert response.json()["code"] == ex.AlreadyExistsUserError().code
+
+
+async def _login(client: AsyncClient, email: str) -> dict[str, str]:
+    user = {"fullname": "test", "email": email, "password": "password"}
+    await client.post("/api/v1/user/register", json=user)
+    response = await client.post(
+        "/api/v1/auth/login", json={"email": email, "password": "password"}
+    )
+    return {"Authorization": f"Bearer {response.json()['data']['access_token']}"}
+
+
+@pytest.mark.asyncio
+async def test_read_your_writes(replicated_db: RDBDatabase) -> None:
+    transport = ASGITransport(app=app)
+    with use_database(replicated_db):
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            writer = await _login(client, "writer@test.com")
+            reader = await _login(client, "reader@test.com")
+
+            response = await client.post(
+                "/api/v1/board",
+                json={"name": "written", "public": True},
+                headers=writer,
+            )
+            assert response.status_code == 201
+
+            # the marker is in Redis, so any worker routes the writer to the primary
+            for headers, expected in (
+                (writer, ["primary", "written"]),
+                (reader, ["replica"]),
+            ):
+                response = await client.get(
+                    "/api/v1/boards", params={"limit": 10}, headers=headers
+                )
+                names = sorted(board["name"] for board in response.json()["data"])
+                assert names == expected
+
+
+@pytest.mark.asyncio
+async def test_export_reads_your_writes(replicated_db: RDBDatabase) -> None:
+    transport = ASGITransport(app=app)
+    with use_database(replicated_db):
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            writer = await _login(client, "writer@test.com")
+            await client.post(
+                "/api/v1/board",
+                json={"name": "exported", "public": True},
+                headers=writer,
+            )
+            # the seeded board is 1, only the primary has this one
+            response = await client.post(
+                "/api/v1/post",
+                json={"board_id": 2, "title": "title", "content": "content"},
+                headers=writer,
+            )
+            assert response.status_code == 201
+
+            # the stream runs after the unit of work, on a session of its own
+            response = await client.get("/api/v1/board/2/export", headers=writer)
+            assert response.status_code == 200
+            lines = response.text.splitlines()
+            assert [json.loads(line)["title"] for line in lines] == ["title"]
+
+
+@pytest.mark.asyncio
+async def test_unsafe_method_reads_from_primary(replicated_db: RDBDatabase) -> None:
+    transport = ASGITransport(app=app)
+    with use_database(replicated_db):
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            # logged in only, so there is no read-your-writes marker
+            headers = await _login(client, "client@test.com")
+
+            response = await client.get(
+                "/api/v1/boards", params={"limit": 10}, headers=headers
+            )
+            assert [board["name"] for board in response.json()["data"]] == ["replica"]
+
+            # no marker lookup, a POST may write and so reads from the primary
+            response = await client.post(
+                "/api/v1/boards:batchGet", json={"ids": [1]}, headers=headers
+            )
+            assert [item["data"]["name"] for item in response.json()["data"]] == [
+                "primary"
+            ]
@@ -0,0 +1,49 @@
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, AsyncGenerator, Iterator
+
+import pytest_asyncio
+from dependency_injector import providers
+from fakeredis import aioredis as fakeredis
+from httpx import ASGITransport, AsyncClient
+from redis import asyncio as aioredis
+
+from app.application import app
+from app.databases.rdb import RDBDatabase
+
+
+async def _fake_redis() -> AsyncGenerator[aioredis.Redis, Any]:
+    yield fakeredis.FakeRedis(decode_responses=True)
+
+
+@contextmanager
+def use_database(db: RDBDatabase) -> Iterator[None]:
+    container = app.container  # type: ignore
+    container.db.override(providers.Object(db))
+    container.redis.override(providers.Resource(_fake_redis))
+    # services and repositories are singletons bound to the overridden db
+    container.reset_singletons()
+    try:
+        yield
+    finally:
+        container.db.reset_override()
+        container.redis.reset_override()
+        container.reset_singletons()
+
+
+@pytest_asyncio.fixture
+async def sqlite_db(tmp_path: Path) -> AsyncGenerator[RDBDatabase, None]:
+    db = RDBDatabase(db_url=f"sqlite+aiosqlite:///{tmp_path / 'test.db'}", echo=False)
+    await db.connect()
+    try:
+        with use_database(db):
+            yield db
+    finally:
+        await db.disconnect()
+
+
+@pytest_asyncio.fixture
+async def api_client(sqlite_db: RDBDatabase) -> AsyncGenerator[AsyncClient, None]:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
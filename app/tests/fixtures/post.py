@@ -0,0 +1,30 @@
+from datetime import datetime
+from typing import Any, Callable, Dict
+
+import pytest
+
+from app.models.post import Post
+
+
+@pytest.fixture
+def post_fixture() -> Callable[..., Post]:
+    count = 0
+
+    def _post_fixture(**kwargs: Dict[str, Any]) -> Post:
+        nonlocal count
+        count += 1
+
+        post = Post(
+            id=kwargs.pop("id", count),
+            title=kwargs.pop("title", f"title{count}"),
+            content=kwargs.pop("content", f"content{count}"),
+            user_id=kwargs.pop("user_id", count),
+            board_id=kwargs.pop("board_id", count),
+            created_dt=kwargs.pop("created_dt", datetime.now()),
+            updated_dt=kwargs.pop("updated_dt", datetime.now()),
+            **kwargs,
+        )
+
+        return post
+
+    return _post_fixture
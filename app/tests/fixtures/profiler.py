@@ -0,0 +1,19 @@
+from contextlib import AbstractContextManager, contextmanager
+from typing import Callable, Iterator
+
+import pytest
+
+from app.databases.profiler import QueryStats, profile_queries
+
+
+@pytest.fixture
+def assert_max_queries() -> Callable[[int], AbstractContextManager[QueryStats]]:
+    @contextmanager
+    def _assert_max_queries(max_queries: int) -> Iterator[QueryStats]:
+        with profile_queries() as stats:
+            yield stats
+        assert (
+            stats.count <= max_queries
+        ), f"{stats.count} queries were executed, expected at most {max_queries}"
+
+    return _assert_max_queries
@@ -0,0 +1,57 @@
+import pytest
+from fastapi import FastAPI, status
+from httpx import ASGITransport, AsyncClient
+
+from app.middlewares.metrics import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS_IN_FLIGHT,
+    MetricsMiddleware,
+)
+
+
+@pytest.fixture
+def test_client() -> AsyncClient:
+    application = FastAPI()
+    application.add_middleware(MetricsMiddleware)
+
+    @application.get("/items/{item_id}", status_code=status.HTTP_201_CREATED)
+    async def item(item_id: int) -> dict[str, int]:
+        return {"id": item_id}
+
+    transport = ASGITransport(app=application)
+    return AsyncClient(transport=transport, base_url="http://test")
+
+
+def request_count(*labels: str) -> int:
+    series = HTTP_REQUEST_DURATION._series.get(labels)
+    return 0 if series is None else int(sum(series[:-1]))
+
+
+@pytest.mark.asyncio
+async def test_route_template_label(test_client: AsyncClient) -> None:
+    before = request_count("GET", "/items/{item_id}", "201")
+
+    await test_client.get("/items/1")
+    await test_client.get("/items/2")
+
+    assert request_count("GET", "/items/{item_id}", "201") == before + 2
+    assert HTTP_REQUESTS_IN_FLIGHT._values[()] == 0
+
+
+@pytest.mark.asyncio
+async def test_unmatched_route_label(test_client: AsyncClient) -> None:
+    before = request_count("GET", "unmatched", "404")
+
+    response = await test_client.get("/missing/path")
+
+    assert response.status_code == 404
+    assert request_count("GET", "unmatched", "404") == before + 1
+
+
+@pytest.mark.asyncio
+async def test_plain_route_label(test_client: AsyncClient) -> None:
+    before = request_count("GET", "/openapi.json", "200")
+
+    await test_client.get("/openapi.json")
+
+    assert request_count("GET", "/openapi.json", "200") == before + 1
@@ -0,0 +1,39 @@
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+
+from app.databases.rdb import RDBDatabase
+from app.middlewares.profiler import QueryProfilerMiddleware
+
+
+def create_app(db: RDBDatabase, server_timing: bool) -> FastAPI:
+    application = FastAPI()
+    application.add_middleware(QueryProfilerMiddleware, server_timing=server_timing)
+
+    @application.get("/items")
+    async def items() -> list[int]:
+        async with db.session() as session:
+            await session.execute(text("SELECT 1"))
+            await session.execute(text("SELECT 2"))
+        return [1, 2]
+
+    return application
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("server_timing", [True, False])
+async def test_server_timing(tmp_path: Path, server_timing: bool) -> None:
+    db = RDBDatabase(db_url=f"sqlite+aiosqlite:///{tmp_path / 'test.db'}", echo=False)
+    transport = ASGITransport(app=create_app(db, server_timing))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/items")
+    await db.disconnect()
+
+    if server_timing:
+        assert response.headers["Server-Timing"].startswith("db;dur=")
+        assert response.headers["Server-Timing"].endswith('desc="2 queries"')
+    else:
+        assert "Server-Timing" not in response.headers
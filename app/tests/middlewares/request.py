@@ -0,0 +1,74 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+import app.errors.exceptions as ex
+from app.middlewares.request import APIExceptionMiddleware
+
+
+async def ok(request: Request) -> Response:
+    return JSONResponse({"status": "ok"})
+
+
+async def api_error(request: Request) -> Response:
+    raise ex.PostNotFoundError()
+
+
+async def unknown_error(request: Request) -> Response:
+    raise RuntimeError()
+
+
+@pytest.fixture
+def test_client() -> AsyncClient:
+    application = Starlette(
+        routes=[
+            Route("/ok", ok),
+            Route("/api-error", api_error),
+            Route("/unknown-error", unknown_error),
+            Route("/health", unknown_error),
+        ],
+        middleware=[Middleware(APIExceptionMiddleware)],
+    )
+    transport = ASGITransport(app=application, raise_app_exceptions=False)
+    return AsyncClient(transport=transport, base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_response_passes_through(test_client: AsyncClient) -> None:
+    response = await test_client.get("/ok")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+
+@pytest.mark.asyncio
+async def test_api_exception(test_client: AsyncClient) -> None:
+    response = await test_client.get("/api-error")
+    error = ex.PostNotFoundError()
+
+    assert response.status_code == error.status_code
+    assert response.json() == {
+        "status_code": error.status_code,
+        "code": error.code,
+        "message": error.message,
+    }
+
+
+@pytest.mark.asyncio
+async def test_unknown_exception(test_client: AsyncClient) -> None:
+    response = await test_client.get("/unknown-error")
+
+    assert response.status_code == ex.StatusCode.HTTP_500
+    assert response.json()["code"] == ex.APIException().code
+
+
+@pytest.mark.asyncio
+async def test_except_path_bypass(test_client: AsyncClient) -> None:
+    response = await test_client.get("/health")
+
+    assert response.status_code == ex.StatusCode.HTTP_500
+    assert response.text == "Internal Server Error"
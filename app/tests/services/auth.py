@@ -1,3 +1,4 @@
+import time
 from datetime import datetime, timedelta
 from typing import Callable
 from unittest.mock import AsyncMock
@@ -6,6 +7,7 @@ import pytest
 
 import app.errors.exceptions as ex
 from app.config import settings
+from app.databases.blacklist import TokenBlacklist
 from app.models.user import User
 from app.services.auth import AuthService
 
@@ -68,6 +70,21 @@ async def test_check_not_blacklist(
     await test_auth_service.check_blacklist("token")
 
 
+@pytest.mark.asyncio
+async def test_check_blacklist_local_mirror(test_auth_service: AuthService) -> None:
+    token_blacklist = TokenBlacklist(redis=AsyncMock())
+    token_blacklist._synced = True
+    token_blacklist.add("token", time.time() + 60)
+    test_auth_service.token_blacklist = token_blacklist
+    test_auth_service.redis.get = AsyncMock(return_value=None)
+
+    with pytest.raises(ex.InvalidTokenError):
+        await test_auth_service.check_blacklist("token")
+    await test_auth_service.check_blacklist("other_token")
+
+    test_auth_service.redis.get.assert_not_called()
+
+
 def test_get_current_user_expired(
     test_auth_service: AuthService, user_fixture: Callable[..., User]
 ) -> None:
@@ -80,6 +97,39 @@ def test_get_current_user_expired(
         test_auth_service.get_current_user(mock_access_token)
 
 
+def test_get_current_user_cached(
+    test_auth_service: AuthService, user_fixture: Callable[..., User]
+) -> None:
+    AuthService.token_cache.clear()
+    user_id = user_fixture().id
+    token = test_auth_service.create_access_token(
+        {"sub": str(user_id)},
+        datetime.utcnow() + timedelta(minutes=30),
+    )
+
+    assert test_auth_service.get_current_user(token) == (user_id, token)
+    assert test_auth_service.get_current_user(token) == (user_id, token)
+
+    assert AuthService.token_cache.misses == 1
+    assert AuthService.token_cache.hits == 1
+
+
+def test_get_current_user_cached_expired(
+    test_auth_service: AuthService, user_fixture: Callable[..., User]
+) -> None:
+    AuthService.token_cache.clear()
+    user_id = user_fixture().id
+    expire = datetime.utcnow() - timedelta(minutes=30)
+    token = test_auth_service.create_access_token({"sub": str(user_id)}, expire)
+    AuthService.token_cache.set(
+        token, (user_id, int(expire.timestamp())), expires_at=time.time() - 1
+    )
+
+    with pytest.raises(ex.ExpiredSignatureError):
+        test_auth_service.get_current_user(token)
+    assert token not in AuthService.token_cache._data
+
+
 def test_verify_password(
     test_auth_service: AuthService, user_fixture: Callable[..., User]
 ) -> None:
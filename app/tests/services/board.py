@@ -13,6 +13,7 @@ from app.schemas.board import (
     RequestBoardUpdateDto,
 )
 from app.services.board import BoardService
+from app.utils.pagination import Page
 
 
 @pytest.fixture
@@ -49,12 +50,29 @@ async def test_get_board_not_found(
 ) -> None:
     board_service, board_repository_mock = test_board_service
 
-    board_repository_mock.get_board.return_value = None
+    board_repository_mock.get_board_by_board_id.return_value = None
 
     with pytest.raises(ex.BoardNotFoundError):
         await board_service.get_board(1, 1)
 
 
+@pytest.mark.asyncio
+async def test_get_board_private(
+    test_board_service: tuple[BoardService, AsyncMock],
+    board_fixture: Callable[..., Board],
+) -> None:
+    board_service, board_repository_mock = test_board_service
+
+    board = board_fixture(public=False)
+    board_repository_mock.get_board_by_board_id.return_value = board
+
+    result = await board_service.get_board(board.id, board.user_id)
+
+    assert result.id == board.id
+    with pytest.raises(ex.BoardNotFoundError):
+        await board_service.get_board(board.id, board.user_id + 1)
+
+
 @pytest.mark.asyncio
 async def test_list_boards(
     test_board_service: tuple[BoardService, AsyncMock],
@@ -63,12 +81,12 @@ async def test_list_boards(
     board_service, board_repository_mock = test_board_service
 
     board_list = [board_fixture() for _ in range(2)]
-    board_repository_mock.list_boards.return_value = board_list
+    board_repository_mock.list_boards.return_value = Page(items=board_list)
 
     result = await board_service.list_boards(1, 0, 10)
 
-    assert len(result) == len(board_list)
-    for board_dto, board in zip(result, board_list):
+    assert len(result.items) == len(board_list)
+    for board_dto, board in zip(result.items, board_list):
         assert board_dto.name == board.name
         assert board_dto.public == board.public
 
@@ -86,10 +104,11 @@ async def test_update_board(
         id=board.id, name=board.name, public=board.public, user_id=board.user_id
     )
 
-    board_repository_mock.get_board_by_board_id.return_value = board
+    board_repository_mock.update.return_value = board
 
     await board_service.update_board(board.id, board.user_id, board_update_dto)
     board_repository_mock.update.assert_called_once_with(board_update)
+    board_repository_mock.get_board_by_board_id.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -103,6 +122,7 @@ async def test_update_board_permission_error(
     not_my_board = board_fixture()
     board_update_dto = RequestBoardUpdateDto(name=my_board.name, public=my_board.public)
 
+    board_repository_mock.update.return_value = None
     board_repository_mock.get_board_by_board_id.return_value = not_my_board
 
     with pytest.raises(ex.PermissionUserError):
@@ -119,7 +139,44 @@ async def test_delete_board(
     board_service, board_repository_mock = test_board_service
 
     board = board_fixture()
-    board_repository_mock.get_board_by_board_id.return_value = board
+    board_repository_mock.delete.return_value = board.id
 
     await board_service.delete_board(board.id, board.user_id)
-    board_repository_mock.delete.assert_called_once_with(board.id)
+    board_repository_mock.delete.assert_called_once_with(board.id, board.user_id)
+    board_repository_mock.get_board_by_board_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_delete_board_not_found(
+    test_board_service: tuple[BoardService, AsyncMock],
+    board_fixture: Callable[..., Board],
+) -> None:
+    board_service, board_repository_mock = test_board_service
+
+    board_repository_mock.delete.return_value = None
+    board_repository_mock.get_board_by_board_id.return_value = None
+
+    with pytest.raises(ex.BoardNotFoundError):
+        await board_service.delete_board(1, 1)
+
+
+@pytest.mark.asyncio
+async def test_get_boards(
+    test_board_service: tuple[BoardService, AsyncMock],
+    board_fixture: Callable[..., Board],
+) -> None:
+    board_service, board_repository_mock = test_board_service
+
+    board = board_fixture(id=1)
+    board_repository_mock.get_boards.return_value = [board]
+
+    result = await board_service.get_boards([3, 1, 3], board.user_id)
+
+    assert [(item.id, item.status_code) for item in result] == [
+        (3, 403),
+        (1, 200),
+        (3, 403),
+    ]
+    assert result[0].code == ex.BoardNotFoundError().code
+    assert result[1].data and result[1].data.name == board.name
+    board_repository_mock.get_boards.assert_called_once_with([3, 1], board.user_id)
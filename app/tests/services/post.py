@@ -0,0 +1,188 @@
+from types import SimpleNamespace
+from typing import AsyncGenerator, Callable
+from unittest.mock import AsyncMock
+
+import pytest
+
+import app.errors.exceptions as ex
+from app.models.post import Post
+from app.repositories.post import PostRepository
+from app.schemas.post import PostCreate, RequestPostCreateDto
+from app.services.board import BoardService
+from app.services.post import PostService
+from app.utils.pagination import Page, PageOrder, RankCursor
+
+
+@pytest.fixture
+def test_post_service() -> tuple[PostService, AsyncMock, AsyncMock]:
+    post_repository_mock = AsyncMock(spec=PostRepository)
+    board_service_mock = AsyncMock(spec=BoardService)
+    post_service = PostService(
+        post_repository=post_repository_mock, board_service=board_service_mock
+    )
+    return post_service, post_repository_mock, board_service_mock
+
+
+@pytest.mark.asyncio
+async def test_create_posts(
+    test_post_service: tuple[PostService, AsyncMock, AsyncMock],
+    post_fixture: Callable[..., Post],
+) -> None:
+    post_service, post_repository_mock, board_service_mock = test_post_service
+
+    posts = [post_fixture(user_id=1, board_id=1) for _ in range(3)]
+    post_create_dtos = [
+        RequestPostCreateDto(board_id=1, title=post.title, content=post.content)
+        for post in posts
+    ]
+    post_repository_mock.add_all.return_value = posts
+
+    result = await post_service.create_posts(1, post_create_dtos)
+
+    assert [item.status_code for item in result] == [201, 201, 201]
+    assert [item.data.id for item in result if item.data] == [post.id for post in posts]
+    board_service_mock.check_board_authorized.assert_called_once_with(1, 1)
+    post_repository_mock.add_all.assert_called_once_with(
+        [PostCreate(user_id=1, **dto.dict()) for dto in post_create_dtos]
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_posts_partial_failure(
+    test_post_service: tuple[PostService, AsyncMock, AsyncMock],
+    post_fixture: Callable[..., Post],
+) -> None:
+    post_service, post_repository_mock, board_service_mock = test_post_service
+
+    async def check_board_authorized(board_id: int, user_id: int) -> None:
+        if board_id == 2:
+            raise ex.PermissionUserError()
+        if board_id == 3:
+            raise ex.BoardNotFoundError()
+
+    board_service_mock.check_board_authorized.side_effect = check_board_authorized
+    post_create_dtos = [
+        RequestPostCreateDto(board_id=board_id, title="title", content="content")
+        for board_id in (2, 1, 3, 1, 2)
+    ]
+    posts = [post_fixture(user_id=1, board_id=1) for _ in range(2)]
+    post_repository_mock.add_all.return_value = posts
+
+    result = await post_service.create_posts(1, post_create_dtos)
+
+    assert [item.index for item in result] == [0, 1, 2, 3, 4]
+    assert [item.status_code for item in result] == [403, 201, 403, 201, 403]
+    assert result[0].code == ex.PermissionUserError().code
+    assert result[2].code == ex.BoardNotFoundError().code
+    assert result[1].data and result[1].data.id == posts[0].id
+    assert result[3].data and result[3].data.id == posts[1].id
+    assert board_service_mock.check_board_authorized.call_count == 3
+    post_repository_mock.add_all.assert_called_once_with(
+        [PostCreate(user_id=1, **post_create_dtos[index].dict()) for index in (1, 3)]
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_posts(
+    test_post_service: tuple[PostService, AsyncMock, AsyncMock],
+    post_fixture: Callable[..., Post],
+) -> None:
+    post_service, post_repository_mock, _ = test_post_service
+
+    post = post_fixture()
+    row = SimpleNamespace(**post.__dict__, rank=0.5, snippet="<mark>title</mark>")
+    post_repository_mock.search_posts.return_value = Page(
+        items=[row], next_cursor="cursor", has_more=True
+    )
+    cursor = RankCursor(rank=0.6, id=2)
+
+    result = await post_service.search_posts(1, "title", 1, cursor.encode())
+
+    assert [item.id for item in result.items] == [post.id]
+    assert result.items[0].snippet == "<mark>title</mark>"
+    assert result.next_cursor == "cursor"
+    post_repository_mock.search_posts.assert_called_once_with(1, "title", 1, cursor)
+
+
+@pytest.mark.asyncio
+async def test_list_posts_fields(
+    test_post_service: tuple[PostService, AsyncMock, AsyncMock],
+) -> None:
+    post_service, post_repository_mock, _ = test_post_service
+
+    row = SimpleNamespace(_mapping={"id": 1, "title": "title"})
+    post_repository_mock.list_posts.return_value = Page(items=[row])
+
+    result = await post_service.list_posts(1, 1, 0, 10, fields="title")
+
+    assert [item.dict(exclude_unset=True) for item in result.items] == [
+        {"id": 1, "title": "title"}
+    ]
+    post_repository_mock.list_posts.assert_called_once_with(
+        1, 1, 10, PageOrder.ID, None, ("id", "title"), None
+    )
+    with pytest.raises(ex.InvalidFieldError):
+        await post_service.list_posts(1, 1, 0, 10, fields="title,password")
+
+
+@pytest.mark.asyncio
+async def test_export_posts(
+    test_post_service: tuple[PostService, AsyncMock, AsyncMock],
+    post_fixture: Callable[..., Post],
+) -> None:
+    post_service, post_repository_mock, board_service_mock = test_post_service
+
+    posts = [post_fixture(board_id=1) for _ in range(3)]
+
+    async def stream_posts(
+        board_id: int, user_id: int, fetch_size: int
+    ) -> AsyncGenerator[list[Post], None]:
+        yield posts[:2]
+        yield posts[2:]
+
+    post_repository_mock.stream_posts = stream_posts
+
+    batches = [batch async for batch in await post_service.export_posts(1, 1)]
+
+    assert [[post.id for post in batch] for batch in batches] == [
+        [posts[0].id, posts[1].id],
+        [posts[2].id],
+    ]
+    board_service_mock.get_board.assert_called_once_with(1, 1)
+
+
+@pytest.mark.asyncio
+async def test_export_posts_board_not_found(
+    test_post_service: tuple[PostService, AsyncMock, AsyncMock],
+) -> None:
+    post_service, post_repository_mock, board_service_mock = test_post_service
+
+    board_service_mock.get_board.side_effect = ex.BoardNotFoundError()
+
+    with pytest.raises(ex.BoardNotFoundError):
+        await post_service.export_posts(1, 1)
+    post_repository_mock.stream_posts.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_posts(
+    test_post_service: tuple[PostService, AsyncMock, AsyncMock],
+    post_fixture: Callable[..., Post],
+) -> None:
+    post_service, post_repository_mock, _ = test_post_service
+
+    posts = [post_fixture(id=post_id) for post_id in (1, 2)]
+    post_repository_mock.get_posts.return_value = posts[::-1]
+
+    result = await post_service.get_posts([2, 3, 1, 2], 1)
+
+    assert [(item.id, item.status_code) for item in result] == [
+        (2, 200),
+        (3, 403),
+        (1, 200),
+        (2, 200),
+    ]
+    assert result[1].code == ex.PostNotFoundError().code
+    assert result[1].data is None
+    assert result[2].data and result[2].data.id == 1
+    post_repository_mock.get_posts.assert_called_once_with([2, 3, 1], 1)
@@ -0,0 +1,33 @@
+import time
+
+from app.utils.cache import TTLCache
+
+
+def test_ttl_cache_get() -> None:
+    cache: TTLCache[str, int] = TTLCache(max_size=10)
+    cache.set("key", 1)
+
+    assert cache.get("key") == 1
+    assert cache.get("not_found") is None
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_ttl_cache_expired() -> None:
+    cache: TTLCache[str, int] = TTLCache(max_size=10, ttl=60)
+    cache.set("key", 1, expires_at=time.time() - 1)
+
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evict_least_recently_used() -> None:
+    cache: TTLCache[str, int] = TTLCache(max_size=2)
+    cache.set("first", 1)
+    cache.set("second", 2)
+    cache.get("first")
+    cache.set("third", 3)
+
+    assert cache.get("first") == 1
+    assert cache.get("second") is None
+    assert cache.get("third") == 3
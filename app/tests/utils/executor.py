@@ -0,0 +1,72 @@
+import asyncio
+import threading
+
+import pytest
+
+import app.errors.exceptions as ex
+from app.utils.executor import BoundedExecutor
+
+
+@pytest.mark.asyncio
+async def test_run() -> None:
+    executor = BoundedExecutor(max_workers=1, max_queue_size=1)
+
+    assert await executor.run(sum, [1, 2, 3]) == 6
+    assert executor.pending == 0
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_run_server_busy() -> None:
+    executor = BoundedExecutor(max_workers=1, max_queue_size=1)
+    release = threading.Event()
+
+    running = [
+        asyncio.create_task(executor.run(release.wait, 5)),
+        asyncio.create_task(executor.run(release.wait, 5)),
+    ]
+    await asyncio.sleep(0)
+    assert executor.queue_depth == 1
+
+    with pytest.raises(ex.ServerBusyError):
+        await executor.run(release.wait, 5)
+
+    release.set()
+    await asyncio.gather(*running)
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_run_cancelled_caller_keeps_slot() -> None:
+    executor = BoundedExecutor(max_workers=1, max_queue_size=0)
+    release = threading.Event()
+
+    task = asyncio.create_task(executor.run(release.wait, 5))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # the thread is still busy with the cancelled call
+    assert executor.pending == 1
+    with pytest.raises(ex.ServerBusyError):
+        await executor.run(release.wait, 5)
+
+    release.set()
+    for _ in range(100):
+        if executor.pending == 0:
+            break
+        await asyncio.sleep(0.01)
+    assert executor.pending == 0
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_run_after_shutdown_releases_slot() -> None:
+    executor = BoundedExecutor(max_workers=1, max_queue_size=0)
+    executor.shutdown()
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            await executor.run(sum, [1])
+    assert executor.pending == 0
@@ -0,0 +1,103 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from app.utils.cache import TTLCache
+from app.utils.metrics import (
+    Registry,
+    WorkerSnapshots,
+    register_cache,
+    registry,
+    remove_snapshot,
+    render,
+)
+
+
+def test_histogram_render() -> None:
+    registry = Registry()
+    histogram = registry.histogram(
+        "latency_seconds", "latency", ("route",), buckets=(0.1, 1.0)
+    )
+
+    histogram.observe(0.05, "/a")
+    histogram.observe(0.1, "/a")
+    histogram.observe(3.0, "/a")
+
+    assert registry.render().splitlines() == [
+        "# HELP latency_seconds latency",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{route="/a",le="0.1"} 2',
+        'latency_seconds_bucket{route="/a",le="1.0"} 2',
+        'latency_seconds_bucket{route="/a",le="+Inf"} 3',
+        'latency_seconds_sum{route="/a"} 3.15',
+        'latency_seconds_count{route="/a"} 3',
+    ]
+
+
+def test_gauge_render() -> None:
+    registry = Registry()
+    gauge = registry.gauge("in_flight", "in flight")
+    pool = registry.gauge("pool_size", "pool size", ("pool",))
+
+    gauge.inc()
+    gauge.inc()
+    gauge.dec()
+    pool.set_function(lambda: 5, 'a"b')
+
+    lines = registry.render().splitlines()
+    assert "in_flight 1.0" in lines
+    assert 'pool_size{pool="a\\"b"} 5.0' in lines
+
+
+def test_label_mismatch() -> None:
+    registry = Registry()
+    histogram = registry.histogram("latency_seconds", "latency", ("route",))
+
+    with pytest.raises(ValueError):
+        histogram.observe(0.1)
+    with pytest.raises(ValueError):
+        registry.gauge("latency_seconds", "duplicate")
+
+
+def test_cache_gauges() -> None:
+    cache: TTLCache[str, int] = TTLCache(max_size=10)
+    register_cache("test", cache)
+
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("a")
+    cache.get("b")
+
+    lines = registry.render().splitlines()
+    assert 'cache_hits{cache="test"} 2.0' in lines
+    assert 'cache_misses{cache="test"} 1.0' in lines
+    assert 'cache_size{cache="test"} 1.0' in lines
+
+
+@pytest.mark.asyncio
+async def test_worker_snapshots(tmp_path: Path) -> None:
+    worker = Registry()
+    other = Registry()
+    worker.gauge("in_flight", "in flight").inc()
+    other.gauge("in_flight", "in flight").set(3)
+    other.histogram("latency_seconds", "latency", buckets=(1.0,)).observe(0.5)
+
+    snapshots = WorkerSnapshots(worker, str(tmp_path), interval=60)
+    WorkerSnapshots(other, str(tmp_path), interval=60)._dump(other.collect(), 1)
+    await snapshots.start()
+    lines = render(await snapshots.collect()).splitlines()
+
+    pid = os.getpid()
+    assert lines.count("# TYPE in_flight gauge") == 1
+    assert f'in_flight{{worker="{pid}"}} 1.0' in lines
+    assert 'in_flight{worker="1"} 3.0' in lines
+    assert 'latency_seconds_bucket{worker="1",le="1.0"} 1' in lines
+    assert 'latency_seconds_sum{worker="1"} 0.5' in lines
+
+    # a worker that exited no longer shows up
+    remove_snapshot(str(tmp_path), 1)
+    await snapshots.stop()
+    assert not list(tmp_path.iterdir())
+    lines = render(await snapshots.collect()).splitlines()
+    assert 'in_flight{worker="1"} 3.0' not in lines
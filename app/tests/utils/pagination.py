@@ -0,0 +1,82 @@
+from datetime import datetime
+from typing import Callable
+
+import pytest
+
+import app.errors.exceptions as ex
+from app.models.board import Board
+from app.utils.pagination import (
+    Cursor,
+    PageDirection,
+    PageOrder,
+    RankCursor,
+    build_page,
+    resolve_cursor,
+)
+
+
+def test_cursor_encode_decode() -> None:
+    cursor = Cursor(
+        order=PageOrder.CREATED_DT_DESC,
+        direction=PageDirection.NEXT,
+        values=["2024-01-01T00:00:00", 1],
+    )
+
+    decoded = Cursor.decode(cursor.encode())
+
+    assert decoded == cursor
+    assert decoded.key() == (datetime(2024, 1, 1), 1)
+
+
+@pytest.mark.parametrize("cursor", ["invalid", "WyJpZCIsICJuZXh0IiwgW11d"])
+def test_cursor_decode_invalid(cursor: str) -> None:
+    with pytest.raises(ex.InvalidCursorError):
+        Cursor.decode(cursor)
+
+
+def test_rank_cursor_encode_decode() -> None:
+    cursor = RankCursor(rank=0.0607927143573761, id=10)
+
+    decoded = RankCursor.decode(cursor.encode())
+
+    assert decoded == cursor
+
+
+@pytest.mark.parametrize("cursor", ["invalid", "WyJpZCIsICJuZXh0IiwgW11d"])
+def test_rank_cursor_decode_invalid(cursor: str) -> None:
+    with pytest.raises(ex.InvalidCursorError):
+        RankCursor.decode(cursor)
+
+
+def test_resolve_cursor_legacy_cursor_id() -> None:
+    cursor = resolve_cursor(None, 10)
+
+    assert cursor is not None
+    assert cursor.order == PageOrder.ID
+    assert cursor.key() == (10,)
+    assert resolve_cursor(None, 0) is None
+
+
+def test_build_page_next(board_fixture: Callable[..., Board]) -> None:
+    boards = [board_fixture() for _ in range(3)]
+
+    page = build_page(boards, PageOrder.ID, None, 2)
+
+    assert page.items == boards[:2]
+    assert page.has_more
+    assert page.prev_cursor is None
+    assert page.next_cursor is not None
+    assert Cursor.decode(page.next_cursor).key() == (boards[1].id,)
+
+
+def test_build_page_prev(board_fixture: Callable[..., Board]) -> None:
+    boards = [board_fixture() for _ in range(2)]
+    cursor = Cursor(order=PageOrder.ID, direction=PageDirection.PREV, values=[3])
+
+    # rows of a backward page arrive in reverse order
+    page = build_page(list(reversed(boards)), PageOrder.ID, cursor, 2)
+
+    assert page.items == boards
+    assert not page.has_more
+    assert page.prev_cursor is None
+    assert page.next_cursor is not None
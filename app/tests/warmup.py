@@ -0,0 +1,36 @@
+import pytest
+from httpx import AsyncClient
+
+import app.errors.exceptions as ex
+from app.application import app
+from app.databases.rdb import RDBDatabase
+from app.warmup import warm_up
+
+
+@pytest.mark.asyncio
+async def test_warm_up(sqlite_db: RDBDatabase) -> None:
+    await warm_up(app.container, connections=3)  # type: ignore
+
+    assert sqlite_db._queue_pool.checkedin() == 3
+    assert sqlite_db._queue_pool.checkedout() == 0
+
+
+@pytest.mark.asyncio
+async def test_warm_up_caps_connections_at_pool_size(sqlite_db: RDBDatabase) -> None:
+    await sqlite_db.warm_up(100)
+
+    assert sqlite_db._queue_pool.checkedin() == sqlite_db._queue_pool.size()
+
+
+@pytest.mark.asyncio
+async def test_readiness(api_client: AsyncClient) -> None:
+    response = await api_client.get("/ready")
+    assert response.status_code == ex.StatusCode.HTTP_503
+    assert response.json()["code"] == ex.NotReadyError().code
+
+    app.state.ready = True
+    try:
+        response = await api_client.get("/ready")
+    finally:
+        app.state.ready = False
+    assert response.status_code == 200
@@ -0,0 +1,66 @@
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Callable, ParamSpec, TypeVar
+
+import app.errors.exceptions as ex
+from app.utils.metrics import registry
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+EXECUTOR_QUEUE_DEPTH = registry.gauge(
+    "executor_queue_depth", "Calls waiting for a free executor thread", ("executor",)
+)
+
+
+class BoundedExecutor:
+    def __init__(
+        self,
+        max_workers: int,
+        max_queue_size: int,
+        thread_name_prefix: str = "bounded-executor",
+    ) -> None:
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=thread_name_prefix
+        )
+        self._pending = 0
+        self._lock = threading.Lock()
+        EXECUTOR_QUEUE_DEPTH.set_function(lambda: self.queue_depth, thread_name_prefix)
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    @property
+    def queue_depth(self) -> int:
+        return max(0, self._pending - self.max_workers)
+
+    async def run(self, func: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+        # reject right away instead of queueing work the workers cannot catch up on
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue_size:
+                raise ex.ServerBusyError()
+            self._pending += 1
+
+        try:
+            future = self._executor.submit(partial(func, *args, **kwargs))
+        except BaseException:
+            # e.g. after shutdown, the job never ran so its slot is free again
+            with self._lock:
+                self._pending -= 1
+            raise
+        # a cancelled caller leaves a started job running, its slot is only free
+        # once the thread is done with it
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, future: "Future[R]") -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,326 @@
+import asyncio
+import bisect
+import glob
+import json
+import logging
+import math
+import os
+from typing import Any, Callable
+
+from app.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Prometheus text exposition without a client library. Samples are recorded
+# from the event loop thread only, so updates are plain dict and list writes
+# and need no locks.
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.075,
+    0.1,
+    0.25,
+    0.5,
+    0.75,
+    1.0,
+    2.5,
+    5.0,
+    7.5,
+    10.0,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LabelValues = tuple[str, ...]
+# metric name with its suffix, label names, label values and value
+Sample = tuple[str, tuple[str, ...], LabelValues, float]
+# one metric with its samples, plain data so it can be written out as json
+Family = dict[str, Any]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: LabelValues) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class Metric:
+    type = "untyped"
+
+    def __init__(
+        self, name: str, documentation: str, label_names: tuple[str, ...] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+
+    def _check_labels(self, values: LabelValues) -> None:
+        if len(values) != len(self.label_names):
+            raise ValueError(
+                f"{self.name} expects labels {self.label_names}, got {values}"
+            )
+
+    def samples(self) -> list[Sample]:
+        return []
+
+    def collect(self) -> Family:
+        return {
+            "name": self.name,
+            "type": self.type,
+            "documentation": self.documentation,
+            "samples": self.samples(),
+        }
+
+
+class Gauge(Metric):
+    type = "gauge"
+
+    def __init__(
+        self, name: str, documentation: str, label_names: tuple[str, ...] = ()
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self._values: dict[LabelValues, float] = {}
+        self._functions: dict[LabelValues, Callable[[], float]] = {}
+
+    def inc(self, *labels: str) -> None:
+        value = self._values.get(labels)
+        if value is None:
+            self._check_labels(labels)
+            value = 0
+        self._values[labels] = value + 1
+
+    def dec(self, *labels: str) -> None:
+        value = self._values.get(labels)
+        if value is None:
+            self._check_labels(labels)
+            value = 0
+        self._values[labels] = value - 1
+
+    def set(self, value: float, *labels: str) -> None:
+        self._check_labels(labels)
+        self._values[labels] = value
+
+    def set_function(self, function: Callable[[], float], *labels: str) -> None:
+        # read when scraped, for values the owner already keeps track of
+        self._check_labels(labels)
+        self._functions[labels] = function
+
+    def samples(self) -> list[Sample]:
+        values = {**self._values, **{k: f() for k, f in self._functions.items()}}
+        return [
+            (self.name, self.label_names, labels, float(value))
+            for labels, value in values.items()
+        ]
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # per label values: one count per bucket plus +Inf, then the sum
+        self._series: dict[LabelValues, list[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            self._check_labels(labels)
+            series = self._series[labels] = [0] * (len(self.buckets) + 2)
+        series[bisect.bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def samples(self) -> list[Sample]:
+        samples: list[Sample] = []
+        label_names = (*self.label_names, "le")
+        bounds = (*self.buckets, math.inf)
+        for labels, series in self._series.items():
+            cumulative = 0
+            for bound, count in zip(bounds, series):
+                cumulative += int(count)
+                samples.append(
+                    (
+                        f"{self.name}_bucket",
+                        label_names,
+                        (*labels, _format_value(bound)),
+                        cumulative,
+                    )
+                )
+            samples.append((f"{self.name}_sum", self.label_names, labels, series[-1]))
+            samples.append((f"{self.name}_count", self.label_names, labels, cumulative))
+        return samples
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+
+    def gauge(
+        self, name: str, documentation: str, label_names: tuple[str, ...] = ()
+    ) -> Gauge:
+        gauge = Gauge(name, documentation, label_names)
+        self.register(gauge)
+        return gauge
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        histogram = Histogram(name, documentation, label_names, buckets)
+        self.register(histogram)
+        return histogram
+
+    def collect(self) -> list[Family]:
+        return [metric.collect() for metric in self._metrics.values()]
+
+    def render(self) -> str:
+        return render(self.collect())
+
+
+def render(families: list[Family]) -> str:
+    lines: list[str] = []
+    for family in families:
+        lines.append(f"# HELP {family['name']} {family['documentation']}")
+        lines.append(f"# TYPE {family['name']} {family['type']}")
+        for name, label_names, labels, value in family["samples"]:
+            formatted = _format_labels(tuple(label_names), tuple(labels))
+            # bucket counts are integers, everything else is a float
+            rendered = str(value) if isinstance(value, int) else _format_value(value)
+            lines.append(f"{name}{formatted} {rendered}")
+    return "\n".join(lines) + "\n"
+
+
+def merge_workers(workers: dict[str, list[Family]]) -> list[Family]:
+    # one family per metric, each sample labelled with the worker it came from
+    merged: dict[str, Family] = {}
+    for worker, families in workers.items():
+        for family in families:
+            target = merged.setdefault(family["name"], {**family, "samples": []})
+            target["samples"].extend(
+                (name, ("worker", *label_names), (worker, *labels), value)
+                for name, label_names, labels, value in family["samples"]
+            )
+    return list(merged.values())
+
+
+def snapshot_path(directory: str, pid: int) -> str:
+    return os.path.join(directory, f"{pid}.json")
+
+
+def remove_snapshot(directory: str, pid: int) -> None:
+    try:
+        os.remove(snapshot_path(directory, pid))
+    except FileNotFoundError:
+        pass
+
+
+# Each pre-forked worker only sees its own samples. Workers write them to a
+# shared directory every interval seconds, and the one that is scraped merges
+# the other workers' files with its own live samples.
+class WorkerSnapshots:
+    def __init__(self, registry: Registry, directory: str, interval: float) -> None:
+        self.registry = registry
+        self.directory = directory
+        self.interval = interval
+        self._task: asyncio.Task[None] | None = None
+
+    async def write(self) -> None:
+        # collected on the event loop, gauge functions read loop-owned state
+        families = self.registry.collect()
+        await asyncio.to_thread(self._dump, families, os.getpid())
+
+    def _dump(self, families: list[Family], pid: int) -> None:
+        path = snapshot_path(self.directory, pid)
+        with open(f"{path}.tmp", "w") as file:
+            json.dump(families, file)
+        # readers never see a half written file
+        os.replace(f"{path}.tmp", path)
+
+    async def collect(self) -> list[Family]:
+        pid = os.getpid()
+        workers = {str(pid): self.registry.collect()}
+        others = await asyncio.to_thread(self._load, pid)
+        return merge_workers({**workers, **others})
+
+    def _load(self, pid: int) -> dict[str, list[Family]]:
+        workers = {}
+        for path in glob.glob(os.path.join(self.directory, "*.json")):
+            worker = os.path.basename(path).removesuffix(".json")
+            if worker == str(pid):
+                continue
+            try:
+                with open(path) as file:
+                    workers[worker] = json.load(file)
+            except (OSError, ValueError):
+                # the worker exited and the master removed it meanwhile
+                continue
+        return workers
+
+    async def start(self) -> None:
+        if self._task is None:
+            await self.write()
+            self._task = asyncio.create_task(self._write_forever())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        remove_snapshot(self.directory, os.getpid())
+
+    async def _write_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.write()
+            except OSError:
+                logger.warning("Metrics snapshot could not be written", exc_info=True)
+
+
+registry = Registry()
+
+
+CACHE_HITS = registry.gauge(
+    "cache_hits", "Lookups served by an in-process cache", ("cache",)
+)
+CACHE_MISSES = registry.gauge(
+    "cache_misses", "Lookups an in-process cache could not serve", ("cache",)
+)
+CACHE_SIZE = registry.gauge("cache_size", "Entries in an in-process cache", ("cache",))
+
+
+def register_cache(name: str, cache: TTLCache[Any, Any]) -> None:
+    CACHE_HITS.set_function(lambda: cache.hits, name)
+    CACHE_MISSES.set_function(lambda: cache.misses, name)
+    CACHE_SIZE.set_function(lambda: len(cache), name)
@@ -0,0 +1,178 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Generic, Sequence, TypeVar
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import ColumnElement, Select, tuple_
+
+import app.errors.exceptions as ex
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+
+class PageOrder(str, Enum):
+    ID = "id"
+    ID_DESC = "-id"
+    CREATED_DT = "created_dt"
+    CREATED_DT_DESC = "-created_dt"
+
+    @property
+    def descending(self) -> bool:
+        return self.value.startswith("-")
+
+    @property
+    def keys(self) -> tuple[str, ...]:
+        # id is always the tiebreaker so the key is unique
+        if self in (PageOrder.CREATED_DT, PageOrder.CREATED_DT_DESC):
+            return ("created_dt", "id")
+        return ("id",)
+
+
+class PageDirection(str, Enum):
+    NEXT = "next"
+    PREV = "prev"
+
+
+class Cursor(BaseModel):
+    order: PageOrder
+    direction: PageDirection
+    values: list[Any]
+
+    @classmethod
+    def from_row(cls, row: Any, order: PageOrder, direction: PageDirection) -> "Cursor":
+        values = [getattr(row, key) for key in order.keys]
+        return cls(
+            order=order,
+            direction=direction,
+            values=[v.isoformat() if isinstance(v, datetime) else v for v in values],
+        )
+
+    def encode(self) -> str:
+        raw = json.dumps([self.order.value, self.direction.value, self.values])
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str) -> "Cursor":
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            order, direction, values = json.loads(raw)
+            decoded = cls(order=order, direction=direction, values=values)
+            decoded.key()
+        except (binascii.Error, ValueError, TypeError, ValidationError):
+            raise ex.InvalidCursorError()
+        return decoded
+
+    def key(self) -> tuple[Any, ...]:
+        if len(self.values) != len(self.order.keys):
+            raise ValueError("cursor does not match its order")
+        return tuple(
+            datetime.fromisoformat(value) if key == "created_dt" else int(value)
+            for key, value in zip(self.order.keys, self.values)
+        )
+
+
+class RankCursor(BaseModel):
+    # search results are ordered by (rank, id) descending and only page forward
+    rank: float
+    id: int
+
+    def encode(self) -> str:
+        raw = json.dumps([self.rank, self.id])
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str) -> "RankCursor":
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            rank, id = json.loads(raw)
+            return cls(rank=rank, id=id)
+        except (binascii.Error, ValueError, TypeError, ValidationError):
+            raise ex.InvalidCursorError()
+
+
+class Page(Generic[T]):
+    def __init__(
+        self,
+        items: list[T],
+        next_cursor: str | None = None,
+        prev_cursor: str | None = None,
+        has_more: bool = False,
+    ) -> None:
+        self.items = items
+        self.next_cursor = next_cursor
+        self.prev_cursor = prev_cursor
+        self.has_more = has_more
+
+    def map(self, func: Callable[[T], U]) -> "Page[U]":
+        return Page(
+            items=[func(item) for item in self.items],
+            next_cursor=self.next_cursor,
+            prev_cursor=self.prev_cursor,
+            has_more=self.has_more,
+        )
+
+
+def resolve_cursor(cursor: str | None, cursor_id: int = 0) -> Cursor | None:
+    if cursor:
+        return Cursor.decode(cursor)
+    if cursor_id:
+        # legacy "id greater than" paging
+        return Cursor(
+            order=PageOrder.ID, direction=PageDirection.NEXT, values=[cursor_id]
+        )
+    return None
+
+
+def keyset_paginate(
+    stmt: Select[tuple[T]],
+    columns: Sequence[ColumnElement[Any]],
+    order: PageOrder,
+    cursor: Cursor | None,
+    limit: int,
+) -> Select[tuple[T]]:
+    backward = cursor is not None and cursor.direction == PageDirection.PREV
+    # walking backwards flips the scan direction, the page is reversed afterwards
+    descending = order.descending != backward
+
+    if cursor is not None:
+        key = tuple_(*columns)
+        values = tuple_(*cursor.key())
+        stmt = stmt.where(key < values if descending else key > values)
+
+    return stmt.order_by(
+        *(column.desc() if descending else column.asc() for column in columns)
+    ).limit(limit + 1)
+
+
+def build_page(
+    rows: Sequence[T], order: PageOrder, cursor: Cursor | None, limit: int
+) -> Page[T]:
+    backward = cursor is not None and cursor.direction == PageDirection.PREV
+    has_more = len(rows) > limit
+    items = list(rows[:limit])
+    if backward:
+        items.reverse()
+
+    if not items:
+        return Page(items=items, has_more=False)
+
+    has_next = True if backward else has_more
+    has_prev = has_more if backward else cursor is not None
+    return Page(
+        items=items,
+        next_cursor=(
+            Cursor.from_row(items[-1], order, PageDirection.NEXT).encode()
+            if has_next
+            else None
+        ),
+        prev_cursor=(
+            Cursor.from_row(items[0], order, PageDirection.PREV).encode()
+            if has_prev
+            else None
+        ),
+        has_more=has_more,
+    )
@@ -0,0 +1,39 @@
+import logging
+import time
+
+from sqlalchemy.orm import configure_mappers
+
+from app.containers import Container
+
+logger = logging.getLogger(__name__)
+
+# never issued by the sequences, the statements run but match nothing
+MISSING_ID = 0
+
+
+async def warm_up(container: Container, connections: int) -> None:
+    started = time.perf_counter()
+    configure_mappers()
+
+    db = container.db()
+    await db.warm_up(connections)
+    redis = await container.redis.async_()
+    await redis.ping()
+
+    # compiles the hot statements into the engine's cache and loads the result
+    # processors of every column type
+    user_repository = await container.user_repository.async_()
+    await user_repository.get_user_by_email("")
+    board_repository = await container.board_repository.async_()
+    await board_repository.get_board_by_board_id(MISSING_ID)
+    await board_repository.get_board(MISSING_ID, MISSING_ID)
+    await board_repository.list_boards(MISSING_ID, limit=1)
+    post_repository = await container.post_repository.async_()
+    await post_repository.get_post_by_post_id(MISSING_ID)
+    await post_repository.get_post(MISSING_ID, MISSING_ID)
+    await post_repository.list_posts(MISSING_ID, MISSING_ID, limit=1)
+
+    auth_service = await container.auth_service.async_()
+    auth_service.load_password_backend()
+
+    logger.info("Warm-up finished in %.0fms", (time.perf_counter() - started) * 1000)
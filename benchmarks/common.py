@@ -0,0 +1,53 @@
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator
+
+from dependency_injector import providers
+from fakeredis import aioredis as fakeredis
+from redis import asyncio as aioredis
+
+from app.application import app
+from app.databases.rdb import RDBDatabase
+from app.databases.redis import get_redis
+
+
+def percentile(samples: list[float], value: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(value / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def _fake_redis() -> AsyncGenerator[aioredis.Redis, Any]:
+    yield fakeredis.FakeRedis(decode_responses=True)
+
+
+@asynccontextmanager
+async def local_stand_ins(
+    db_url: str | None = None, redis_url: str | None = None
+) -> AsyncGenerator[RDBDatabase, None]:
+    # SQLite and fakeredis unless a real Postgres / Redis url is given
+    container = app.container  # type: ignore
+    with tempfile.TemporaryDirectory() as directory:
+        db = RDBDatabase(
+            db_url=db_url
+            or f"sqlite+aiosqlite:///{os.path.join(directory, 'bench.db')}",
+            echo=False,
+        )
+        await db.connect()
+        container.db.override(providers.Object(db))
+        if redis_url is None:
+            container.redis.override(providers.Resource(_fake_redis))
+        else:
+            container.redis.override(providers.Resource(get_redis, redis_url=redis_url))
+        # services and repositories are singletons bound to the overridden db
+        container.reset_singletons()
+        try:
+            yield db
+        finally:
+            await db.disconnect()
+            container.db.reset_override()
+            container.redis.reset_override()
+            container.reset_singletons()
@@ -0,0 +1,122 @@
+"""Dependency resolution benchmark.
+
+Compares the singleton services and repositories of ``app.containers`` with
+the per request ``Factory`` providers they replaced. For each variant it
+reports the time and memory allocated to resolve the providers of one
+``GET /api/v1/post/{id}`` request, and the requests per second of that route
+through httpx's ASGI transport. Runs on SQLite and fakeredis so no services are
+needed.
+
+    $ python -m benchmarks.di --requests 2000 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+from typing import Any
+
+import httpx
+from dependency_injector import providers
+
+from app.application import app
+from app.containers import Container
+from benchmarks.common import local_stand_ins
+from benchmarks.middleware import measure, setup
+
+# the providers GET /api/v1/post/{id} resolves, directly or as dependencies
+SERVICES = (
+    "auth_service",
+    "board_repository",
+    "board_service",
+    "post_repository",
+    "post_service",
+    "user_repository",
+    "user_service",
+)
+REQUEST_PROVIDERS = ("auth_service", "post_service")
+
+
+def use_factories(container: Container, factories: bool) -> None:
+    for name in SERVICES:
+        provider = getattr(container, name)
+        provider.reset_override()
+        if factories:
+            # the same constructor arguments, a new object graph on every call
+            provider.override(
+                providers.Factory(provider.cls, *provider.args, **provider.kwargs)
+            )
+
+
+async def resolve(container: Container) -> None:
+    for name in REQUEST_PROVIDERS:
+        await getattr(container, name).async_()
+
+
+async def measure_resolution(container: Container, rounds: int) -> dict[str, float]:
+    await resolve(container)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        await resolve(container)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    await resolve(container)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "resolve_us": round(elapsed / rounds * 1_000_000, 1),
+        "allocated_kib": round(peak / 1024, 1),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--resolutions", type=int, default=2000)
+    args = parser.parse_args()
+
+    container: Container = app.container  # type: ignore
+    results: dict[str, dict[str, Any]] = {}
+    async with local_stand_ins():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            headers = await setup(client)
+            try:
+                # interleave the variants so drift affects both equally
+                for _ in range(args.rounds):
+                    for name in ("factory", "singleton"):
+                        use_factories(container, name == "factory")
+                        result = results.setdefault(name, {"requests_per_s": []})
+                        result.update(
+                            await measure_resolution(container, args.resolutions)
+                        )
+                        result["requests_per_s"].append(
+                            await measure(
+                                client,
+                                "/api/v1/post/1",
+                                headers,
+                                args.requests,
+                                args.concurrency,
+                            )
+                        )
+            finally:
+                use_factories(container, False)
+
+    report = {
+        name: {**result, "requests_per_s": round(max(result["requests_per_s"]), 1)}
+        for name, result in results.items()
+    }
+    speedup = round(
+        report["singleton"]["requests_per_s"] / report["factory"]["requests_per_s"], 2
+    )
+    print(json.dumps({**report, "speedup": speedup, **vars(args)}, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
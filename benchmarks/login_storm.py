@@ -0,0 +1,120 @@
+"""Login storm benchmark.
+
+Floods ``POST /api/v1/auth/login`` with concurrent logins while probing
+``GET /health`` and reports the probe latency next to the login throughput.
+``inline`` hashes on the event loop (the old behaviour), ``executor`` uses the
+bounded password executor from the container.
+
+    $ python -m benchmarks.login_storm --duration 5 --concurrency 8
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime
+from typing import Any, Callable, ParamSpec, TypeVar
+
+import httpx
+from dependency_injector import providers
+from passlib.context import CryptContext
+
+from app.application import app
+from app.models.user import User
+from benchmarks.common import percentile
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+EMAIL = "storm@test.com"
+PASSWORD = "storm-password"
+
+
+class InMemoryUserRepository:
+    def __init__(self, user: User) -> None:
+        self.user = user
+
+    async def get_user_by_email(self, email: str) -> User | None:
+        return self.user if email == self.user.email else None
+
+
+class InlineExecutor:
+    async def run(self, func: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+        return func(*args, **kwargs)
+
+
+async def run_storm(mode: str, duration: float, concurrency: int) -> dict[str, Any]:
+    container = app.container  # type: ignore
+    if mode == "inline":
+        container.password_executor.override(providers.Object(InlineExecutor()))
+    else:
+        container.password_executor.reset_override()
+
+    logins: list[int] = []
+    rejected: list[int] = []
+    probe_latencies: list[float] = []
+    deadline = time.perf_counter() + duration
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+
+        async def login_worker() -> None:
+            while time.perf_counter() < deadline:
+                response = await client.post(
+                    "/api/v1/auth/login", json={"email": EMAIL, "password": PASSWORD}
+                )
+                if response.status_code == 200:
+                    logins.append(1)
+                else:
+                    rejected.append(response.status_code)
+
+        async def probe() -> None:
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                await client.get("/health")
+                probe_latencies.append(time.perf_counter() - start)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(probe(), *(login_worker() for _ in range(concurrency)))
+
+    return {
+        "mode": mode,
+        "duration_s": duration,
+        "concurrency": concurrency,
+        "logins_per_s": round(len(logins) / duration, 2),
+        "rejected": len(rejected),
+        "health_requests": len(probe_latencies),
+        "health_p50_ms": round(percentile(probe_latencies, 50) * 1000, 2),
+        "health_p99_ms": round(percentile(probe_latencies, 99) * 1000, 2),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--modes", nargs="+", default=["inline", "executor"])
+    args = parser.parse_args()
+
+    password = CryptContext(schemes=["bcrypt"], deprecated="auto").hash(PASSWORD)
+    user = User(
+        id=1,
+        fullname="storm",
+        email=EMAIL,
+        password=password,
+        created_dt=datetime.now(),
+        updated_dt=datetime.now(),
+    )
+    container = app.container  # type: ignore
+    container.user_repository.override(providers.Object(InMemoryUserRepository(user)))
+
+    results = [
+        await run_storm(mode, args.duration, args.concurrency) for mode in args.modes
+    ]
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
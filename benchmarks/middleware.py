@@ -0,0 +1,145 @@
+"""Error-handling middleware benchmark.
+
+Measures requests per second on ``GET /health`` and ``GET /api/v1/post/{id}``
+with the application's middleware stack, swapping only the error-handling
+middleware. ``base_http`` is the previous ``BaseHTTPMiddleware`` dispatch,
+``asgi`` is ``APIExceptionMiddleware``. Runs on SQLite and fakeredis so no
+services are needed.
+
+    $ python -m benchmarks.middleware --requests 2000 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Awaitable, Callable
+
+import httpx
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+from app.application import app
+from app.config import settings
+from app.middlewares.request import APIExceptionMiddleware, exception_handler
+from benchmarks.common import local_stand_ins
+
+
+async def base_http_middleware(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    # the dispatch function APIExceptionMiddleware replaced
+    if request.url.path in settings.EXCEPT_PATH_LIST:
+        return await call_next(request)
+
+    try:
+        return await call_next(request)
+    except Exception as e:
+        error = await exception_handler(e)
+        error_dict = {
+            "status_code": error.status_code,
+            "code": error.code,
+            "message": error.message,
+        }
+        return JSONResponse(status_code=error.status_code, content=error_dict)
+
+
+MIDDLEWARES = {
+    "base_http": Middleware(BaseHTTPMiddleware, dispatch=base_http_middleware),
+    "asgi": Middleware(APIExceptionMiddleware),
+}
+
+
+def use_middleware(middleware: Middleware) -> None:
+    app.user_middleware = [
+        middleware
+        if existing.cls in (APIExceptionMiddleware, BaseHTTPMiddleware)
+        else existing
+        for existing in app.user_middleware
+    ]
+    # rebuilt lazily on the next request
+    app.middleware_stack = None
+
+
+async def measure(
+    client: httpx.AsyncClient,
+    path: str,
+    headers: dict[str, str],
+    requests: int,
+    concurrency: int,
+) -> float:
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            response = await client.get(path, headers=headers)
+            assert response.status_code == 200, response.text
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return requests / (time.perf_counter() - start)
+
+
+async def setup(client: httpx.AsyncClient) -> dict[str, str]:
+    user = {"fullname": "bench", "email": "bench@test.com", "password": "bench"}
+    await client.post("/api/v1/user/register", json=user)
+    response = await client.post(
+        "/api/v1/auth/login", json={"email": user["email"], "password": "bench"}
+    )
+    headers = {"Authorization": f"Bearer {response.json()['data']['access_token']}"}
+    await client.post(
+        "/api/v1/board", json={"name": "bench", "public": True}, headers=headers
+    )
+    await client.post(
+        "/api/v1/post",
+        json={"board_id": 1, "title": "bench", "content": "bench"},
+        headers=headers,
+    )
+    return headers
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    async with local_stand_ins():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            headers = await setup(client)
+            results: dict[str, dict[str, Any]] = {}
+            # interleave the variants so drift affects both equally
+            for _ in range(args.rounds):
+                for name, middleware in MIDDLEWARES.items():
+                    use_middleware(middleware)
+                    for path in ("/health", "/api/v1/post/1"):
+                        rps = await measure(
+                            client, path, headers, args.requests, args.concurrency
+                        )
+                        results.setdefault(name, {}).setdefault(path, []).append(rps)
+
+    report = {
+        name: {path: round(max(samples), 1) for path, samples in paths.items()}
+        for name, paths in results.items()
+    }
+    speedup = {
+        path: round(report["asgi"][path] / report["base_http"][path], 2)
+        for path in report["asgi"]
+    }
+    print(
+        json.dumps(
+            {"requests_per_s": report, "speedup": speedup, **vars(args)}, indent=2
+        )
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
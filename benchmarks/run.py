@@ -0,0 +1,436 @@
+"""Endpoint benchmark suite.
+
+Drives every route of ``app.application:app`` through httpx's ASGI transport
+and reports throughput and p50/p95/p99 latency per route as JSON. Runs on a
+SQLite file and fakeredis by default, pass ``--db-url``/``--redis-url`` to use
+a local Postgres and Redis instead.
+
+    $ python -m benchmarks.run --output result.json
+    $ python -m benchmarks.run --baseline result.json --tolerance 0.2
+
+With ``--baseline`` the run exits 1 when a route's throughput drops, or its
+p99 latency rises, by more than the tolerance.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import httpx
+from fastapi.routing import APIRoute
+
+from app.application import app, shutdown, startup
+from benchmarks.common import local_stand_ins, percentile
+
+PASSWORD = "bench-password"
+
+
+@dataclass
+class Scenario:
+    method: str
+    path: str
+    # request index -> (url, httpx request kwargs)
+    request: Callable[[int], tuple[str, dict[str, Any]]]
+    status_code: int = 200
+    # bcrypt bound routes get fewer requests
+    max_requests: int | None = None
+    # needs Postgres features SQLite lacks, skipped without --db-url
+    postgres_only: bool = False
+
+
+@dataclass
+class Fixture:
+    email: str
+    headers: dict[str, str]
+    board_id: int
+    post_id: int
+    post_ids: list[int]
+    deletable_board_ids: list[int]
+    deletable_post_ids: list[int]
+
+
+async def create_fixture(
+    client: httpx.AsyncClient, pool_size: int, run_id: str
+) -> Fixture:
+    # names are unique per run so a Postgres database can be reused
+    email = f"bench-{run_id}@test.com"
+    user = {"fullname": "bench", "email": email, "password": PASSWORD}
+    await client.post("/api/v1/user/register", json=user)
+    response = await client.post(
+        "/api/v1/auth/login", json={"email": email, "password": PASSWORD}
+    )
+    headers = {"Authorization": f"Bearer {response.json()['data']['access_token']}"}
+
+    async def create_board(name: str) -> int:
+        await client.post(
+            "/api/v1/board", json={"name": name, "public": True}, headers=headers
+        )
+        response = await client.get(
+            "/api/v1/boards", params={"limit": 1, "order": "-id"}, headers=headers
+        )
+        board_id: int = response.json()["data"][0]["id"]
+        return board_id
+
+    async def create_post(board_id: int) -> int:
+        await client.post(
+            "/api/v1/post",
+            json={"board_id": board_id, "title": "bench", "content": "bench " * 50},
+            headers=headers,
+        )
+        response = await client.get(
+            f"/api/v1/posts/{board_id}",
+            params={"limit": 1, "order": "-id"},
+            headers=headers,
+        )
+        post_id: int = response.json()["data"][0]["id"]
+        return post_id
+
+    board_id = await create_board(f"bench-{run_id}")
+    post_ids = [await create_post(board_id) for _ in range(100)]
+    deletable_board_ids = [
+        await create_board(f"bench-{run_id}-delete-{index}")
+        for index in range(pool_size)
+    ]
+    deletable_post_ids = [await create_post(board_id) for _ in range(pool_size)]
+    return Fixture(
+        email=email,
+        headers=headers,
+        board_id=board_id,
+        post_id=post_ids[0],
+        post_ids=post_ids,
+        deletable_board_ids=deletable_board_ids,
+        deletable_post_ids=deletable_post_ids,
+    )
+
+
+def create_scenarios(fixture: Fixture, run_id: str) -> list[Scenario]:
+    headers = fixture.headers
+    return [
+        Scenario("GET", "/health", lambda i: ("/health", {})),
+        Scenario("GET", "/ready", lambda i: ("/ready", {})),
+        Scenario("GET", "/metrics", lambda i: ("/metrics", {})),
+        Scenario(
+            "POST",
+            "/api/v1/user/register",
+            lambda i: (
+                "/api/v1/user/register",
+                {
+                    "json": {
+                        "fullname": "bench",
+                        "email": f"bench-{run_id}-register-{i}@test.com",
+                        "password": PASSWORD,
+                    }
+                },
+            ),
+            status_code=201,
+            max_requests=50,
+        ),
+        Scenario(
+            "POST",
+            "/api/v1/auth/login",
+            lambda i: (
+                "/api/v1/auth/login",
+                {"json": {"email": fixture.email, "password": PASSWORD}},
+            ),
+            max_requests=50,
+        ),
+        Scenario(
+            "POST",
+            "/api/v1/auth/logout",
+            lambda i: ("/api/v1/auth/logout", {"json": {"token": f"bench-{i}"}}),
+        ),
+        Scenario(
+            "POST",
+            "/api/v1/board",
+            lambda i: (
+                "/api/v1/board",
+                {
+                    "json": {"name": f"bench-{run_id}-create-{i}", "public": True},
+                    "headers": headers,
+                },
+            ),
+            status_code=201,
+        ),
+        Scenario(
+            "GET",
+            "/api/v1/board/{id}",
+            lambda i: (f"/api/v1/board/{fixture.board_id}", {"headers": headers}),
+        ),
+        Scenario(
+            "GET",
+            "/api/v1/boards",
+            lambda i: (
+                "/api/v1/boards",
+                {"params": {"limit": 20}, "headers": headers},
+            ),
+        ),
+        Scenario(
+            "POST",
+            "/api/v1/boards:batchGet",
+            lambda i: (
+                "/api/v1/boards:batchGet",
+                {
+                    "json": {
+                        "ids": [fixture.board_id, *fixture.deletable_board_ids[:19]]
+                    },
+                    "headers": headers,
+                },
+            ),
+        ),
+        Scenario(
+            "PUT",
+            "/api/v1/board/{id}",
+            lambda i: (
+                f"/api/v1/board/{fixture.board_id}",
+                {
+                    "json": {"name": f"bench-{run_id}", "public": True},
+                    "headers": headers,
+                },
+            ),
+        ),
+        Scenario(
+            "DELETE",
+            "/api/v1/board/{id}",
+            lambda i: (
+                f"/api/v1/board/{fixture.deletable_board_ids[i]}",
+                {"headers": headers},
+            ),
+        ),
+        Scenario(
+            "GET",
+            "/api/v1/board/{id}/export",
+            lambda i: (
+                f"/api/v1/board/{fixture.board_id}/export",
+                {"headers": headers},
+            ),
+            max_requests=100,
+        ),
+        Scenario(
+            "POST",
+            "/api/v1/post",
+            lambda i: (
+                "/api/v1/post",
+                {
+                    "json": {
+                        "board_id": fixture.board_id,
+                        "title": "bench",
+                        "content": "bench",
+                    },
+                    "headers": headers,
+                },
+            ),
+            status_code=201,
+        ),
+        Scenario(
+            "POST",
+            "/api/v1/posts:batch",
+            lambda i: (
+                "/api/v1/posts:batch",
+                {
+                    "json": {
+                        "posts": [
+                            {
+                                "board_id": fixture.board_id,
+                                "title": "bench",
+                                "content": "bench",
+                            }
+                        ]
+                        * 50
+                    },
+                    "headers": headers,
+                },
+            ),
+            max_requests=100,
+        ),
+        Scenario(
+            "GET",
+            "/api/v1/post/{id}",
+            lambda i: (f"/api/v1/post/{fixture.post_id}", {"headers": headers}),
+        ),
+        Scenario(
+            "POST",
+            "/api/v1/posts:batchGet",
+            lambda i: (
+                "/api/v1/posts:batchGet",
+                {"json": {"ids": fixture.post_ids[:20]}, "headers": headers},
+            ),
+        ),
+        Scenario(
+            "PUT",
+            "/api/v1/post/{id}",
+            lambda i: (
+                f"/api/v1/post/{fixture.post_id}",
+                {"json": {"title": "bench", "content": "bench"}, "headers": headers},
+            ),
+        ),
+        Scenario(
+            "DELETE",
+            "/api/v1/post/{id}",
+            lambda i: (
+                f"/api/v1/post/{fixture.deletable_post_ids[i]}",
+                {"headers": headers},
+            ),
+        ),
+        Scenario(
+            "GET",
+            "/api/v1/posts/search",
+            lambda i: (
+                "/api/v1/posts/search",
+                {"params": {"q": "bench", "limit": 20}, "headers": headers},
+            ),
+            postgres_only=True,
+        ),
+        Scenario(
+            "GET",
+            "/api/v1/posts/{board_id}",
+            lambda i: (
+                f"/api/v1/posts/{fixture.board_id}",
+                {"params": {"limit": 20}, "headers": headers},
+            ),
+        ),
+    ]
+
+
+def uncovered_routes(scenarios: list[Scenario]) -> list[str]:
+    covered = {f"{scenario.method} {scenario.path}" for scenario in scenarios}
+    return [
+        f"{method} {route.path}"
+        for route in app.routes
+        if isinstance(route, APIRoute)
+        for method in sorted(route.methods)
+        if f"{method} {route.path}" not in covered
+    ]
+
+
+async def run_scenario(
+    client: httpx.AsyncClient, scenario: Scenario, requests: int, concurrency: int
+) -> dict[str, Any]:
+    requests = min(requests, scenario.max_requests or requests)
+    latencies: list[float] = []
+    errors: dict[int, int] = {}
+    next_index = 0
+
+    async def worker() -> None:
+        nonlocal next_index
+        while next_index < requests:
+            index = next_index
+            next_index += 1
+            url, kwargs = scenario.request(index)
+            start = time.perf_counter()
+            response = await client.request(scenario.method, url, **kwargs)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code != scenario.status_code:
+                errors[response.status_code] = errors.get(response.status_code, 0) + 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "requests": requests,
+        "errors": errors,
+        "requests_per_s": round(requests / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+    }
+
+
+def find_regressions(
+    routes: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    tolerance: float,
+) -> list[str]:
+    regressions = []
+    for name, result in routes.items():
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+        if result["requests_per_s"] < expected["requests_per_s"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: {result['requests_per_s']} req/s, "
+                f"baseline {expected['requests_per_s']} req/s"
+            )
+        if result["p99_ms"] > expected["p99_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: p99 {result['p99_ms']} ms, baseline {expected['p99_ms']} ms"
+            )
+    return regressions
+
+
+async def run(args: argparse.Namespace) -> int:
+    async with local_stand_ins(args.db_url, args.redis_url):
+        await startup()
+        try:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://bench"
+            ) as client:
+                run_id = str(int(time.time()))
+                fixture = await create_fixture(client, args.requests, run_id)
+                scenarios = create_scenarios(fixture, run_id)
+                routes = {}
+                for scenario in scenarios:
+                    name = f"{scenario.method} {scenario.path}"
+                    if args.routes and name not in args.routes:
+                        continue
+                    if scenario.postgres_only and not args.db_url:
+                        continue
+                    routes[name] = await run_scenario(
+                        client, scenario, args.requests, args.concurrency
+                    )
+        finally:
+            await shutdown()
+
+    report = {
+        "config": {
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "database": "postgres" if args.db_url else "sqlite",
+            "redis": "redis" if args.redis_url else "fakeredis",
+        },
+        "uncovered_routes": uncovered_routes(scenarios),
+        "routes": routes,
+    }
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output + "\n")
+    print(output)
+
+    failed = [name for name, result in routes.items() if result["errors"]]
+    for name in failed:
+        print(f"unexpected status codes on {name}", file=sys.stderr)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["routes"]
+        regressions = find_regressions(routes, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"regression {regression}", file=sys.stderr)
+
+    return 1 if failed or regressions or report["uncovered_routes"] else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--db-url", help="postgresql+asyncpg:// url, SQLite if unset")
+    parser.add_argument("--redis-url", help="redis:// url, fakeredis if unset")
+    parser.add_argument("--routes", nargs="+", help='only these, e.g. "GET /health"')
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    sys.exit(asyncio.run(run(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
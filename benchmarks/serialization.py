@@ -0,0 +1,102 @@
+"""Response serialization benchmark.
+
+Turns a ``list_posts`` page of ORM rows into response bytes and reports the
+cost per item. ``default`` is the previous path: validated DTOs, FastAPI's
+response_model validation and jsonable_encoder, then stdlib json. ``fast`` is
+``ResponsePostListDto.from_row`` rendered by ``FastJSONRoute`` through orjson.
+
+    $ python -m benchmarks.serialization --items 100 --iterations 2000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime
+from typing import Awaitable, Callable
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+
+from app.api.routing import FastJSONRoute
+from app.models.post import Post
+from app.schemas.post import ResponsePostList, ResponsePostListDto
+
+
+def create_rows(items: int) -> list[Post]:
+    return [
+        Post(
+            id=index,
+            title=f"title {index}",
+            content="content " * 50,
+            user_id=1,
+            board_id=1,
+            created_dt=datetime.now(),
+            updated_dt=datetime.now(),
+        )
+        for index in range(items)
+    ]
+
+
+def page_response(data: list[ResponsePostListDto]) -> ResponsePostList:
+    return ResponsePostList(
+        code=200,
+        message="게시글 목록 조회 성공",
+        data=data,
+        next_cursor="cursor",
+        has_more=True,
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    rows = create_rows(args.items)
+    payload = page_response([ResponsePostListDto.from_row(row) for row in rows])
+
+    async def list_posts() -> ResponsePostList:
+        return payload
+
+    # only the response field and render of the route are measured
+    route = FastJSONRoute("/posts", list_posts, response_model=ResponsePostList)
+
+    async def default() -> bytes:
+        content = page_response([ResponsePostListDto(**row.__dict__) for row in rows])
+        serialized = await serialize_response(
+            field=route.secure_cloned_response_field,
+            response_content=content,
+            is_coroutine=True,
+        )
+        return bytes(JSONResponse(serialized).body)
+
+    async def fast() -> bytes:
+        content = page_response([ResponsePostListDto.from_row(row) for row in rows])
+        return bytes(route.render(content).body)
+
+    assert json.loads(await default()) == json.loads(await fast())
+
+    async def measure(render: Callable[[], Awaitable[bytes]]) -> float:
+        iterations: int = args.iterations
+        start = time.perf_counter()
+        for _ in range(iterations):
+            await render()
+        return (time.perf_counter() - start) / iterations
+
+    results = {}
+    for name, render in (("default", default), ("fast", fast)):
+        per_page = await measure(render)
+        results[name] = {
+            "per_page_us": round(per_page * 1e6, 1),
+            "per_item_us": round(per_page * 1e6 / args.items, 2),
+        }
+    results["speedup"] = round(
+        results["default"]["per_page_us"] / results["fast"]["per_page_us"], 2
+    )
+    print(json.dumps({**results, **vars(args)}, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,160 @@
+"""Cold start benchmark.
+
+Reports how long importing ``app.application`` takes with the slowest modules
+from ``python -X importtime``, and the time from spawning ``cli.serve`` with
+one worker to its first ``GET /health`` and ``GET /ready`` responses. The
+server uses the Postgres and Redis of the environment (``POSTGRES_*``,
+``REDIS_*``), without them warm-up fails fast and the worker starts cold.
+
+    $ python -m benchmarks.startup --output startup.json
+    $ python -m benchmarks.startup --baseline startup.json --tolerance 0.2
+
+With ``--baseline`` the run exits 1 when any of the timings grows by more than
+the tolerance.
+"""
+
+import argparse
+import json
+import signal
+import socket
+import subprocess
+import sys
+import time
+from typing import Any
+
+import httpx
+
+MODULE = "app.application"
+TIMINGS = ("import_s", "first_response_s", "ready_s")
+
+
+def measure_import() -> tuple[float, list[dict[str, Any]]]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {MODULE}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = []
+    total = 0.0
+    # "import time: <self us> | <cumulative us> | <indented name>"
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        modules.append(
+            {
+                "module": name.strip(),
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+            }
+        )
+        if name.strip() == MODULE:
+            total = int(cumulative_us) / 1_000_000
+    return total, modules
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port: int = sock.getsockname()[1]
+        return port
+
+
+def wait_for(client: httpx.Client, url: str, start: float, timeout: float) -> float:
+    while time.perf_counter() - start < timeout:
+        try:
+            if client.get(url).status_code == 200:
+                return time.perf_counter() - start
+        except httpx.TransportError:
+            pass
+        time.sleep(0.01)
+    raise TimeoutError(f"{url} did not answer 200 within {timeout}s")
+
+
+def measure_first_response(timeout: float) -> tuple[float, float]:
+    base_url = f"http://127.0.0.1:{free_port()}"
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "cli.serve",
+            "--bind",
+            base_url.removeprefix("http://"),
+            "--workers",
+            "1",
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        with httpx.Client(base_url=base_url, timeout=1) as client:
+            first_response = wait_for(client, "/health", start, timeout)
+            ready = wait_for(client, "/ready", start, timeout)
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=30)
+    return first_response, ready
+
+
+def find_regressions(
+    result: dict[str, float], baseline: dict[str, float], tolerance: float
+) -> list[str]:
+    return [
+        f"{name}: {result[name]}s, baseline {baseline[name]}s"
+        for name in TIMINGS
+        if name in baseline and result[name] > baseline[name] * (1 + tolerance)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="slowest imports shown")
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    imports = []
+    servers = []
+    for _ in range(args.rounds):
+        imports.append(measure_import())
+        servers.append(measure_first_response(args.timeout))
+
+    # the fastest round is the least disturbed by everything else on the machine
+    import_s, modules = min(imports, key=lambda sample: sample[0])
+    result = {
+        "import_s": round(import_s, 3),
+        "first_response_s": round(min(first for first, _ in servers), 3),
+        "ready_s": round(min(ready for _, ready in servers), 3),
+    }
+    report = {
+        "config": {"rounds": args.rounds, "python": sys.version.split()[0]},
+        "startup": result,
+        "slowest_imports": sorted(modules, key=lambda m: m["self_ms"], reverse=True)[
+            : args.top
+        ],
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output + "\n")
+    print(output)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["startup"]
+        regressions = find_regressions(result, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"regression {regression}", file=sys.stderr)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+import argparse
+import asyncio
+import json
+import sys
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, Awaitable, Callable
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, create_async_engine
+
+from app.config import DatabaseSettings
+from app.repositories.board import BoardRepository
+from app.repositories.post import PostRepository
+from app.repositories.user import UserRepository
+from app.schemas.board import BoardUpdate
+from app.schemas.post import PostUpdate
+from app.utils.pagination import Cursor, Page, PageOrder, RankCursor
+
+PLANNED = ("SELECT", "UPDATE", "DELETE")
+
+SEED_USERS = """
+INSERT INTO "user" (fullname, email, password)
+SELECT 'explain', 'explain-' || g || '@example.com', 'explain'
+FROM generate_series(1, :users) AS g
+"""
+
+SEED_BOARDS = """
+INSERT INTO board (name, public, user_id)
+SELECT 'explain-' || g, g % :public_every = 0, u.id
+FROM generate_series(1, :boards) AS g
+JOIN (
+    SELECT id, row_number() OVER (ORDER BY id) - 1 AS n
+    FROM "user" WHERE email LIKE 'explain-%'
+) AS u ON u.n = g % :users
+"""
+
+SEED_POSTS = """
+INSERT INTO post (title, content, user_id, board_id)
+SELECT 'explain-' || g, 'explain', b.user_id, b.id
+FROM generate_series(1, :posts) AS g
+JOIN (
+    SELECT id, user_id, row_number() OVER (ORDER BY id) - 1 AS n
+    FROM board WHERE name LIKE 'explain-%'
+) AS b ON b.n = g % :boards
+"""
+
+
+async def seed(conn: AsyncConnection, users: int, boards: int, posts: int) -> None:
+    await conn.execute(text(SEED_USERS), {"users": users})
+    await conn.execute(
+        text(SEED_BOARDS), {"boards": boards, "users": users, "public_every": 10}
+    )
+    await conn.execute(text(SEED_POSTS), {"posts": posts, "boards": boards})
+    await conn.execute(text("ANALYZE"))
+
+
+async def run_repositories(
+    session_factory: Callable[..., Any],
+    user_id: int,
+    board_id: int,
+    post_id: int,
+) -> None:
+    user_repository = UserRepository(session_factory, redis=None)  # type: ignore
+    board_repository = BoardRepository(session_factory)
+    post_repository = PostRepository(session_factory)
+
+    await user_repository.get_user_by_email("explain-1@example.com")
+
+    await board_repository.get_board(board_id, user_id)
+    await board_repository.get_boards([board_id, -1], user_id)
+    await board_repository.get_board_by_board_id(board_id)
+    await board_repository.update(
+        BoardUpdate(id=-1, user_id=user_id, name="explain", public=True)
+    )
+    await board_repository.delete(-1, user_id)
+
+    await post_repository.get_post_by_post_id(post_id)
+    await post_repository.get_post(post_id, user_id)
+    await post_repository.get_posts([post_id, -1], user_id)
+    await post_repository.update(
+        PostUpdate(id=-1, user_id=user_id, title="explain", content="explain")
+    )
+    await post_repository.delete(-1, user_id)
+
+    page = await post_repository.search_posts(user_id, "explain", 10)
+    if page.next_cursor is not None:
+        await post_repository.search_posts(
+            user_id, "explain", 10, RankCursor.decode(page.next_cursor)
+        )
+
+    for order in PageOrder:
+        await walk_pages(
+            lambda cursor: board_repository.list_boards(user_id, 10, order, cursor)
+        )
+        await walk_pages(
+            lambda cursor: post_repository.list_posts(
+                board_id, user_id, 10, order, cursor
+            )
+        )
+        # a narrowed column list must not lose the index that serves the order
+        await walk_pages(
+            lambda cursor: post_repository.list_posts(
+                board_id, user_id, 10, order, cursor, ("title", "content"), excerpt=20
+            )
+        )
+
+    async for _ in post_repository.stream_posts(board_id, user_id, 100):
+        pass
+
+
+async def walk_pages(
+    list_page: Callable[[Cursor | None], Awaitable[Page[Any]]],
+) -> None:
+    # first page, a forward page and a backward page cover every predicate shape
+    page = await list_page(None)
+    if page.next_cursor is None:
+        return
+    page = await list_page(Cursor.decode(page.next_cursor))
+    if page.prev_cursor is not None:
+        await list_page(Cursor.decode(page.prev_cursor))
+
+
+def find_full_scans(plan: dict[str, Any]) -> list[str]:
+    found = []
+    node_type = plan["Node Type"]
+    if node_type == "Seq Scan":
+        found.append(f"Seq Scan on {plan['Relation Name']}")
+    elif (
+        node_type in ("Index Scan", "Index Only Scan")
+        and "Filter" in plan
+        and "Index Cond" not in plan
+    ):
+        # walks the whole index, e.g. only for its order, and filters every row.
+        # with enable_seqscan off this is what a missing index turns into
+        found.append(f"Filtered {node_type} on {plan['Relation Name']}")
+    for child in plan.get("Plans", []):
+        found.extend(find_full_scans(child))
+    return found
+
+
+async def explain(args: argparse.Namespace) -> int:
+    engine = create_async_engine(DatabaseSettings().db_url)
+    captured: list[tuple[str, Any]] = []
+    capturing = False
+
+    def capture(
+        conn: Any, cursor: Any, statement: str, parameters: Any, *_: Any
+    ) -> None:
+        # inserts never scan, savepoints and the like cannot be explained
+        if capturing and statement.lstrip().upper().startswith(PLANNED):
+            captured.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+
+    failed = 0
+    async with engine.connect() as conn:
+        # everything happens inside one transaction that is rolled back at the end
+        await conn.begin()
+        await seed(conn, args.users, args.boards, args.posts)
+        if not args.natural:
+            # the planner then prefers any index, even one it only walks for its
+            # order, so those show up as filtered index scans rather than seq scans
+            await conn.execute(text("SET LOCAL enable_seqscan = off"))
+
+        row = (
+            await conn.execute(
+                text(
+                    "SELECT p.user_id, p.board_id, p.id FROM post p "
+                    "WHERE p.title LIKE 'explain-%' ORDER BY p.id LIMIT 1"
+                )
+            )
+        ).one()
+
+        @asynccontextmanager
+        async def session_factory() -> AsyncGenerator[AsyncSession, None]:
+            async with AsyncSession(
+                bind=conn, join_transaction_mode="create_savepoint"
+            ) as session:
+                yield session
+
+        capturing = True
+        await run_repositories(session_factory, row.user_id, row.board_id, row.id)
+        capturing = False
+
+        for statement, parameters in dict.fromkeys(captured):
+            result = await conn.exec_driver_sql(
+                f"EXPLAIN (FORMAT JSON) {statement}", parameters
+            )
+            plan = result.scalar_one()
+            plan = json.loads(plan) if isinstance(plan, str) else plan
+            full_scans = find_full_scans(plan[0]["Plan"])
+            query = " ".join(statement.split())
+            if full_scans:
+                failed += 1
+                print(f"{', '.join(full_scans)}: {query}")
+            elif args.verbose:
+                print(f"ok: {query}")
+
+        await conn.rollback()
+    await engine.dispose()
+
+    print(f"{len(dict.fromkeys(captured))} statements checked, {failed} full scans")
+    return 1 if failed else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Fail if any repository query plans a full table or index scan"
+    )
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--boards", type=int, default=10_000)
+    parser.add_argument("--posts", type=int, default=100_000)
+    parser.add_argument(
+        "--natural",
+        action="store_true",
+        help="keep enable_seqscan on and rely on the seeded statistics",
+    )
+    parser.add_argument("--verbose", action="store_true")
+    sys.exit(asyncio.run(explain(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
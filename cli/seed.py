@@ -0,0 +1,299 @@
+import argparse
+import asyncio
+import itertools
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Any, Iterator, Sequence
+
+import asyncpg  # type: ignore[import-untyped]
+from passlib.context import CryptContext
+
+from app.config import DatabaseSettings
+
+USER_COLUMNS = ["id", "fullname", "email", "password", "created_dt", "updated_dt"]
+BOARD_COLUMNS = ["id", "name", "public", "user_id", "created_dt", "updated_dt"]
+POST_COLUMNS = [
+    "id",
+    "title",
+    "content",
+    "user_id",
+    "board_id",
+    "created_dt",
+    "updated_dt",
+]
+
+Record = tuple[Any, ...]
+
+
+def cumulative_weights(
+    size: int, distribution: str, skew: float, rng: random.Random
+) -> list[float]:
+    if distribution == "uniform":
+        weights = [1.0] * size
+    else:
+        # zipf: a few hot users own most boards, a few hot boards get most posts
+        weights = [1 / rank**skew for rank in range(1, size + 1)]
+        rng.shuffle(weights)
+    return list(itertools.accumulate(weights))
+
+
+def timestamps(start: datetime, end: datetime, count: int) -> Iterator[datetime]:
+    # ids and created_dt grow together, like rows inserted over time
+    step = (end - start) / max(count, 1)
+    for index in range(count):
+        yield start + step * index
+
+
+def weighted_choices(
+    population: Sequence[Any], cum_weights: list[float], count: int, rng: random.Random
+) -> Iterator[Any]:
+    # drawing in blocks is much cheaper than one rng.choices call per row
+    for offset in range(0, count, 10_000):
+        yield from rng.choices(
+            population, cum_weights=cum_weights, k=min(10_000, count - offset)
+        )
+
+
+def chunked(records: Iterator[Record], size: int) -> Iterator[list[Record]]:
+    while chunk := list(itertools.islice(records, size)):
+        yield chunk
+
+
+def generate_users(
+    first_id: int, count: int, password: str, start: datetime, end: datetime
+) -> Iterator[Record]:
+    for index, created_dt in enumerate(timestamps(start, end, count)):
+        user_id = first_id + index
+        yield (
+            user_id,
+            f"seed user {user_id}",
+            f"seed-{user_id}@example.com",
+            password,
+            created_dt,
+            created_dt,
+        )
+
+
+def generate_boards(
+    first_id: int,
+    count: int,
+    user_ids: Sequence[int],
+    owner_weights: list[float],
+    public_ratio: float,
+    start: datetime,
+    end: datetime,
+    rng: random.Random,
+) -> Iterator[Record]:
+    owners = weighted_choices(user_ids, owner_weights, count, rng)
+    for index, (created_dt, user_id) in enumerate(
+        zip(timestamps(start, end, count), owners)
+    ):
+        board_id = first_id + index
+        yield (
+            board_id,
+            f"seed-board-{board_id}",
+            rng.random() < public_ratio,
+            user_id,
+            created_dt,
+            created_dt,
+        )
+
+
+def generate_posts(
+    first_id: int,
+    count: int,
+    boards: Sequence[tuple[int, int]],
+    board_weights: list[float],
+    content_length: int,
+    start: datetime,
+    end: datetime,
+    rng: random.Random,
+) -> Iterator[Record]:
+    content = ("lorem ipsum dolor sit amet " * (content_length // 27 + 1))[
+        :content_length
+    ]
+    # only the board owner can post to a board
+    owned_boards = weighted_choices(boards, board_weights, count, rng)
+    for index, (created_dt, (board_id, user_id)) in enumerate(
+        zip(timestamps(start, end, count), owned_boards)
+    ):
+        post_id = first_id + index
+        yield (
+            post_id,
+            f"seed post {post_id}",
+            content,
+            user_id,
+            board_id,
+            created_dt,
+            created_dt,
+        )
+
+
+async def copy_chunks(
+    pool: asyncpg.Pool,
+    table: str,
+    columns: list[str],
+    records: Iterator[Record],
+    chunk_size: int,
+    workers: int,
+) -> None:
+    started = time.perf_counter()
+    copied = 0
+    queue: asyncio.Queue[list[Record] | None] = asyncio.Queue(maxsize=workers * 2)
+
+    async def worker() -> None:
+        nonlocal copied
+        while (chunk := await queue.get()) is not None:
+            async with pool.acquire() as conn:
+                await conn.copy_records_to_table(table, records=chunk, columns=columns)
+            copied += len(chunk)
+
+    async def produce() -> None:
+        for chunk in chunked(records, chunk_size):
+            await queue.put(chunk)
+            # let the copies run while the next chunk is generated
+            await asyncio.sleep(0)
+        for _ in range(workers):
+            await queue.put(None)
+
+    # a failed copy cancels the producer, which would otherwise wait forever on
+    # the full queue
+    async with asyncio.TaskGroup() as group:
+        group.create_task(produce())
+        for _ in range(workers):
+            group.create_task(worker())
+
+    elapsed = time.perf_counter() - started
+    print(f"{table}: {copied} rows in {elapsed:.1f}s ({copied / elapsed:.0f} rows/s)")
+
+
+async def next_id(conn: asyncpg.Connection, table: str) -> int:
+    value: int = await conn.fetchval(f'SELECT COALESCE(MAX(id), 0) + 1 FROM "{table}"')
+    return value
+
+
+async def seed(args: argparse.Namespace) -> None:
+    rng = random.Random(args.random_seed)
+    end = datetime.now()
+    start = end - timedelta(days=args.days)
+    # hashing once keeps seeding I/O bound, every seeded user shares the password
+    password = CryptContext(schemes=["bcrypt"], deprecated="auto").hash(args.password)
+
+    dsn = DatabaseSettings().db_url.replace("postgresql+asyncpg://", "postgresql://")
+    pool = await asyncpg.create_pool(dsn, min_size=args.workers, max_size=args.workers)
+    try:
+        async with pool.acquire() as conn:
+            if args.truncate:
+                await conn.execute(
+                    'TRUNCATE post, board, "user" RESTART IDENTITY CASCADE'
+                )
+            first_user_id = await next_id(conn, "user")
+            first_board_id = await next_id(conn, "board")
+            first_post_id = await next_id(conn, "post")
+
+        await copy_chunks(
+            pool,
+            "user",
+            USER_COLUMNS,
+            generate_users(first_user_id, args.users, password, start, end),
+            args.chunk_size,
+            args.workers,
+        )
+
+        user_ids = range(first_user_id, first_user_id + args.users)
+        owner_weights = cumulative_weights(
+            args.users, args.owner_distribution, args.skew, rng
+        )
+        board_owners: list[int] = []
+
+        def remember_owner(records: Iterator[Record]) -> Iterator[Record]:
+            for record in records:
+                board_owners.append(record[3])
+                yield record
+
+        await copy_chunks(
+            pool,
+            "board",
+            BOARD_COLUMNS,
+            remember_owner(
+                generate_boards(
+                    first_board_id,
+                    args.boards,
+                    user_ids,
+                    owner_weights,
+                    args.public_ratio,
+                    start,
+                    end,
+                    rng,
+                )
+            ),
+            args.chunk_size,
+            args.workers,
+        )
+
+        boards = list(
+            zip(range(first_board_id, first_board_id + args.boards), board_owners)
+        )
+        board_weights = cumulative_weights(
+            args.boards, args.post_distribution, args.skew, rng
+        )
+        await copy_chunks(
+            pool,
+            "post",
+            POST_COLUMNS,
+            generate_posts(
+                first_post_id,
+                args.posts,
+                boards,
+                board_weights,
+                args.content_length,
+                start,
+                end,
+                rng,
+            ),
+            args.chunk_size,
+            args.workers,
+        )
+
+        async with pool.acquire() as conn:
+            # explicit ids bypass the sequences, move them past the seeded rows
+            for table in ("user", "board", "post"):
+                await conn.execute(
+                    f"SELECT setval(pg_get_serial_sequence('\"{table}\"', 'id'), "
+                    f'(SELECT MAX(id) FROM "{table}"))'
+                )
+            await conn.execute('ANALYZE "user", board, post')
+    finally:
+        await pool.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Bulk load users, boards and posts with COPY"
+    )
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--boards", type=int, default=5_000)
+    parser.add_argument("--posts", type=int, default=1_000_000)
+    parser.add_argument(
+        "--owner-distribution", choices=["uniform", "zipf"], default="zipf"
+    )
+    parser.add_argument(
+        "--post-distribution", choices=["uniform", "zipf"], default="zipf"
+    )
+    parser.add_argument("--skew", type=float, default=1.1, help="zipf exponent")
+    parser.add_argument("--public-ratio", type=float, default=0.3)
+    parser.add_argument("--content-length", type=int, default=500)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--chunk-size", type=int, default=20_000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--password", default="password")
+    parser.add_argument("--random-seed", type=int, default=0)
+    parser.add_argument(
+        "--truncate", action="store_true", help="empty the tables before seeding"
+    )
+    asyncio.run(seed(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
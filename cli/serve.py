@@ -0,0 +1,146 @@
+import argparse
+import gc
+import glob
+import math
+import os
+import tempfile
+from importlib.util import find_spec
+from typing import Any
+
+from gunicorn.app.base import BaseApplication  # type: ignore[import-untyped]
+from gunicorn.util import import_app  # type: ignore[import-untyped]
+from uvicorn.workers import UvicornWorker
+
+from app.utils.metrics import remove_snapshot
+
+APP = "app.application:app"
+
+LOOP = "uvloop" if find_spec("uvloop") else "asyncio"
+HTTP = "httptools" if find_spec("httptools") else "h11"
+
+
+class Worker(UvicornWorker):
+    CONFIG_KWARGS = {"loop": LOOP, "http": HTTP}
+
+
+def read_ints(path: str) -> list[int] | None:
+    try:
+        with open(path) as file:
+            return [int(value) for value in file.read().replace("max", "-1").split()]
+    except (OSError, ValueError):
+        return None
+
+
+def cgroup_cpu_limit() -> float | None:
+    # cgroup v2 "<quota> <period>", quota is "max" without a limit
+    values = read_ints("/sys/fs/cgroup/cpu.max")
+    if values is None:
+        # cgroup v1, quota is -1 without a limit
+        quota = read_ints("/sys/fs/cgroup/cpu/cpu.cfs_quota_us")
+        period = read_ints("/sys/fs/cgroup/cpu/cpu.cfs_period_us")
+        values = quota + period if quota and period else None
+    if values is None or len(values) != 2 or values[0] <= 0 or values[1] <= 0:
+        return None
+    return values[0] / values[1]
+
+
+def available_cpus() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    limit = cgroup_cpu_limit()
+    if limit is not None:
+        cpus = min(cpus, math.ceil(limit))
+    return max(1, cpus)
+
+
+def metrics_dir() -> str:
+    # read by the app, so it has to be set before the master imports it
+    directory = os.environ.get("METRICS_DIR") or tempfile.mkdtemp(prefix="metrics-")
+    os.makedirs(directory, exist_ok=True)
+    # left behind by a previous server, their workers are gone
+    for path in glob.glob(os.path.join(directory, "*.json")):
+        os.remove(path)
+    os.environ["METRICS_DIR"] = directory
+    return directory
+
+
+class Server(BaseApplication):  # type: ignore[misc]
+    def __init__(self, options: dict[str, Any]) -> None:
+        self.options = options
+        super().__init__()
+
+    def load_config(self) -> None:
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self) -> Any:
+        application = import_app(APP)
+        # objects created by the import are never collected, freezing them keeps
+        # the collector from touching and so copying the pages shared with workers
+        gc.freeze()
+        return application
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Serve the application with pre-forked uvicorn workers",
+        epilog=(
+            "kill -HUP <master pid> starts new workers and gracefully stops the "
+            "old ones. they fork from the app the master preloaded, so HUP does "
+            "not pick up new code: send USR2 to start a new master with it, then "
+            "QUIT to the old master"
+        ),
+    )
+    parser.add_argument("--bind", default=os.environ.get("BIND", "0.0.0.0:8000"))
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("WEB_CONCURRENCY", "0")),
+        help="defaults to the CPUs available to the process, cgroup limits included",
+    )
+    parser.add_argument(
+        "--backlog",
+        type=int,
+        default=int(os.environ.get("BACKLOG", "2048")),
+        help="pending connections, capped by net.core.somaxconn",
+    )
+    parser.add_argument(
+        "--keepalive",
+        type=int,
+        default=int(os.environ.get("KEEPALIVE", "65")),
+        help="seconds, keep above the idle timeout of the load balancer",
+    )
+    parser.add_argument("--graceful-timeout", type=int, default=30)
+    parser.add_argument(
+        "--max-requests",
+        type=int,
+        default=int(os.environ.get("MAX_REQUESTS", "0")),
+        help="recycle a worker after this many requests, 0 disables",
+    )
+    args = parser.parse_args()
+
+    workers = args.workers or available_cpus()
+    directory = metrics_dir()
+    print(f"serving {APP} on {args.bind} with {workers} workers ({LOOP}, {HTTP})")
+    Server(
+        {
+            "bind": args.bind,
+            "workers": workers,
+            "worker_class": "cli.serve.Worker",
+            "preload_app": True,
+            "backlog": args.backlog,
+            "keepalive": args.keepalive,
+            "graceful_timeout": args.graceful_timeout,
+            "max_requests": args.max_requests,
+            # spread recycling so the workers do not restart all at once
+            "max_requests_jitter": args.max_requests // 10,
+            # the samples of a dead worker would otherwise be served forever
+            "child_exit": lambda server, worker: remove_snapshot(directory, worker.pid),
+        }
+    ).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""add list query indexes
+
+Revision ID: 5c1e7a9d3b24
+Revises: 108c0ff7ecd6
+Create Date: 2026-10-18 00:00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c1e7a9d3b24"
+down_revision: Union[str, None] = "108c0ff7ecd6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        # list_posts: board_id = ? AND user_id = ? ORDER BY id / created_dt, id
+        op.create_index(
+            "ix_post_board_id_user_id_id",
+            "post",
+            ["board_id", "user_id", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_post_board_id_user_id_created_dt_id",
+            "post",
+            ["board_id", "user_id", "created_dt", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+        # list_boards: user_id = ? OR public ORDER BY id / created_dt, id
+        op.create_index(
+            "ix_board_user_id_id",
+            "board",
+            ["user_id", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_board_user_id_created_dt_id",
+            "board",
+            ["user_id", "created_dt", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_board_public_id",
+            "board",
+            ["id"],
+            postgresql_where=sa.text("public"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_board_public_created_dt_id",
+            "board",
+            ["created_dt", "id"],
+            postgresql_where=sa.text("public"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+        # nothing filters on post.title, and board.user_id is a prefix of the above
+        op.drop_index(
+            "ix_post_title",
+            table_name="post",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_board_user_id",
+            table_name="board",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_board_user_id",
+            "board",
+            ["user_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_post_title",
+            "post",
+            ["title"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        for index_name, table_name in (
+            ("ix_board_public_created_dt_id", "board"),
+            ("ix_board_public_id", "board"),
+            ("ix_board_user_id_created_dt_id", "board"),
+            ("ix_board_user_id_id", "board"),
+            ("ix_post_board_id_user_id_created_dt_id", "post"),
+            ("ix_post_board_id_user_id_id", "post"),
+        ):
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,51 @@
+"""add post search vector
+
+Revision ID: 8f3b2c6d1e47
+Revises: 5c1e7a9d3b24
+Create Date: 2026-10-18 00:01:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8f3b2c6d1e47"
+down_revision: Union[str, None] = "5c1e7a9d3b24"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # kept in sync by Postgres, a title match ranks above a content match.
+    # adding a stored column rewrites the table under an exclusive lock
+    op.execute(
+        """
+        ALTER TABLE post ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple', coalesce(title, '')), 'A')
+            || setweight(to_tsvector('simple', coalesce(content, '')), 'B')
+        ) STORED
+        """
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_post_search_vector",
+            "post",
+            ["search_vector"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_post_search_vector",
+            table_name="post",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("post", "search_vector")